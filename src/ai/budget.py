@@ -0,0 +1,32 @@
+import time
+from typing import Optional
+
+
+class SearchTimeout(Exception):
+    """Se lanza dentro de la búsqueda cuando se agota el presupuesto de tiempo o nodos."""
+
+
+class SearchCancelled(Exception):
+    """Se lanza cuando se cancela la búsqueda desde otro hilo (no se atrapa como un timeout)."""
+
+
+class SearchBudget:
+    """
+    Límite de tiempo (segundos de reloj) y/o de nodos para una búsqueda.
+    SearchContext decide cada cuántos nodos consultarlo (su check_interval).
+    """
+
+    def __init__(self, time_limit: Optional[float] = None, node_limit: Optional[int] = None):
+        self.time_limit = time_limit
+        self.node_limit = node_limit
+        self.start_time = time.perf_counter()
+        self.deadline = None if time_limit is None else self.start_time + time_limit
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.start_time
+
+    def exhausted(self, nodes: int) -> bool:
+        """Indica si el presupuesto ya se consumió (sin lanzar excepción)."""
+        if self.node_limit is not None and nodes >= self.node_limit:
+            return True
+        return self.deadline is not None and time.perf_counter() >= self.deadline
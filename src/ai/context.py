@@ -0,0 +1,208 @@
+"""
+Contexto de búsqueda compartido por todos los motores.
+
+Reemplaza al antiguo contador {"nodes": n}: cuenta los nodos visitados, aplica el
+presupuesto de tiempo/nodos, permite cancelar la búsqueda desde otro hilo, informa
+el progreso periódicamente y, al terminar, resume las estadísticas finales.
+
+El costo por nodo es un incremento y una comparación; el reloj, la cancelación y
+los avisos de progreso solo se revisan cada `check_interval` nodos. Los motores
+además avisan de finales, aciertos de tabla y cortes beta: en SearchContext esos
+avisos no hacen nada y DetailedSearchContext los cuenta (por profundidad).
+"""
+
+import threading
+import time
+from collections import Counter
+from typing import Callable, Dict, Optional, Tuple
+
+from src.ai.budget import SearchBudget, SearchCancelled, SearchTimeout
+
+ProgressCallback = Callable[[dict], None]
+
+
+class SearchContext:
+    """
+    time_limit / node_limit: presupuesto; al agotarse la búsqueda lanza SearchTimeout.
+    progress: función que recibe stats() cada `progress_interval` segundos (y al terminar).
+    check_interval: cada cuántos nodos se revisan reloj, cancelación y progreso.
+    """
+
+    # Si detail() trae estadísticas; se pregunta al contexto y no con isinstance porque
+    # simulate.py (script) importa este módulo como ai.context y los motores como src.ai.context
+    collects_detail = False
+
+    def __init__(
+        self,
+        time_limit: Optional[float] = None,
+        node_limit: Optional[int] = None,
+        progress: Optional[ProgressCallback] = None,
+        progress_interval: float = 0.25,
+        check_interval: int = 256,
+    ):
+        self.budget = SearchBudget(time_limit, node_limit)
+        self.node_limit = node_limit
+        self.progress = progress
+        self.progress_interval = progress_interval
+        self.check_interval = check_interval
+        self.cancel_event = threading.Event()
+
+        self.nodes = 0
+        self.best_move: Optional[Tuple[int, int]] = None
+        self.best_score: Optional[float] = None
+        self.depth = 0  # Plies de la última iteración completa (o de la búsqueda completa)
+        self.timed_out = False
+        self.end_time: Optional[float] = None
+
+        self._next_check = self._limit_check(check_interval)
+        self._next_report = self.budget.start_time + progress_interval
+
+    def _limit_check(self, nodes: int) -> int:
+        """Próximo número de nodos en el que hay que revisar (nunca después del límite de nodos)."""
+        if self.node_limit is not None:
+            return min(nodes, self.node_limit)
+        return nodes
+
+    def visit(self, depth: int = 0):
+        """Llamado por la búsqueda en cada nodo (depth: plies bajo la posición de la que se elige jugada)."""
+        self.nodes += 1
+        if self.nodes >= self._next_check:
+            self._poll()
+
+    def terminal(self):
+        """La búsqueda llegó a un final (victoria o empate)."""
+
+    def tt_hit(self):
+        """La tabla de transposición resolvió el nodo sin expandirlo."""
+
+    def cutoff(self, depth: int, move_number: int):
+        """Corte beta en la jugada número move_number (0 = la primera probada) del nodo a esa profundidad."""
+
+    def detail(self) -> Dict:
+        """Estadísticas detalladas (vacías si el contexto no las recolecta)."""
+        return {}
+
+    def merge(self, nodes: int, detail: Optional[Dict] = None):
+        """Suma el trabajo de una búsqueda hecha en otro proceso (nodos y, si hay, su detalle)."""
+        self.nodes += nodes
+
+    def _poll(self):
+        self._next_check = self._limit_check(self.nodes + self.check_interval)
+        if self.cancel_event.is_set():
+            raise SearchCancelled()
+        if self.budget.exhausted(self.nodes):
+            self.timed_out = True
+            raise SearchTimeout()
+        if self.progress is not None and time.perf_counter() >= self._next_report:
+            self._next_report = time.perf_counter() + self.progress_interval
+            self.progress(self.stats())
+
+    def cancel(self):
+        """Pide detener la búsqueda (seguro desde otro hilo); se interrumpe en la próxima revisión."""
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
+    def exhausted(self) -> bool:
+        """Indica si el presupuesto ya se consumió (sin lanzar excepción)."""
+        return self.budget.exhausted(self.nodes)
+
+    def elapsed(self) -> float:
+        end = self.end_time if self.end_time is not None else time.perf_counter()
+        return end - self.budget.start_time
+
+    def update(
+        self,
+        best_move: Optional[Tuple[int, int]] = None,
+        best_score: Optional[float] = None,
+        depth: Optional[int] = None,
+    ):
+        """Registra la mejor jugada conocida y la profundidad alcanzada (para el progreso)."""
+        if best_move is not None:
+            self.best_move = best_move
+        if best_score is not None:
+            self.best_score = best_score
+        if depth is not None:
+            self.depth = depth
+
+    def finish(self):
+        """Marca el final de la búsqueda y envía el último aviso de progreso."""
+        self.end_time = time.perf_counter()
+        if self.progress is not None:
+            self.progress(self.stats())
+
+    def stats(self) -> dict:
+        """Estadísticas actuales (o finales, si ya terminó)."""
+        elapsed = self.elapsed()
+        return {
+            "nodes": self.nodes,
+            "elapsed": elapsed,
+            "nodes_per_second": self.nodes / elapsed if elapsed > 0 else 0.0,
+            "best_move": self.best_move,
+            "best_score": self.best_score,
+            "depth": self.depth,
+            "cancelled": self.cancelled,
+            "timed_out": self.timed_out,
+            "finished": self.end_time is not None,
+        }
+
+
+class DetailedSearchContext(SearchContext):
+    """
+    SearchContext que además cuenta nodos y cortes beta por profundidad, cortes en
+    la primera jugada (calidad del ordenamiento), finales alcanzados y aciertos de
+    la tabla de transposición. Cuesta un acceso a diccionario más por nodo.
+    """
+
+    collects_detail = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.nodes_by_depth: Counter = Counter()
+        self.cutoffs_by_depth: Counter = Counter()
+        self.first_move_cutoffs = 0
+        self.terminal_nodes = 0
+        self.tt_hits = 0
+
+    def visit(self, depth: int = 0):
+        self.nodes_by_depth[depth] += 1
+        self.nodes += 1
+        if self.nodes >= self._next_check:
+            self._poll()
+
+    def terminal(self):
+        self.terminal_nodes += 1
+
+    def tt_hit(self):
+        self.tt_hits += 1
+
+    def cutoff(self, depth: int, move_number: int):
+        self.cutoffs_by_depth[depth] += 1
+        if move_number == 0:
+            self.first_move_cutoffs += 1
+
+    def detail(self) -> Dict:
+        cutoffs = sum(self.cutoffs_by_depth.values())
+        return {
+            "nodes_by_depth": dict(sorted(self.nodes_by_depth.items())),
+            "cutoffs_by_depth": dict(sorted(self.cutoffs_by_depth.items())),
+            "cutoffs": cutoffs,
+            "first_move_cutoffs": self.first_move_cutoffs,
+            "first_move_cutoff_rate": self.first_move_cutoffs / cutoffs if cutoffs else 0.0,
+            "terminal_nodes": self.terminal_nodes,
+            "tt_hits": self.tt_hits,
+        }
+
+    def merge(self, nodes: int, detail: Optional[Dict] = None):
+        super().merge(nodes, detail)
+        if detail:
+            self.nodes_by_depth.update(detail["nodes_by_depth"])
+            self.cutoffs_by_depth.update(detail["cutoffs_by_depth"])
+            self.first_move_cutoffs += detail["first_move_cutoffs"]
+            self.terminal_nodes += detail["terminal_nodes"]
+            self.tt_hits += detail["tt_hits"]
+
+    def stats(self) -> dict:
+        return {**super().stats(), **self.detail()}
@@ -0,0 +1,35 @@
+"""
+Funciones de evaluación estática para búsquedas con profundidad limitada.
+
+Todas tienen la firma evaluate(board, maximizing_player_id) -> float y retornan
+valores estrictamente entre -1 y 1, para que nunca igualen a una victoria (+1)
+o derrota (-1) real.
+"""
+
+from src.game_logic.board import Board
+
+
+def zero_evaluation(board: Board, maximizing_player_id: int) -> float:
+    """Trata todo horizonte como empate (útil como referencia)."""
+    return 0.0
+
+
+def open_lines_evaluation(board: Board, maximizing_player_id: int) -> float:
+    """
+    Cuenta las líneas ganadoras todavía abiertas para cada jugador (sin fichas
+    rivales), ponderando cada una por 4^(fichas propias en la línea).
+    """
+    own = board.masks[maximizing_player_id - 1]
+    rival = board.masks[2 - maximizing_player_id]
+
+    own_score = 0
+    rival_score = 0
+    for line_mask, _ in board.win_lines:
+        own_in_line = own & line_mask
+        rival_in_line = rival & line_mask
+        if own_in_line and not rival_in_line:
+            own_score += 4 ** own_in_line.bit_count()
+        elif rival_in_line and not own_in_line:
+            rival_score += 4 ** rival_in_line.bit_count()
+
+    return (own_score - rival_score) / (own_score + rival_score + 1)
@@ -0,0 +1,309 @@
+"""
+Profundización iterativa sobre minimax con presupuesto de tiempo o de nodos.
+
+Cada iteración busca un ply más que la anterior y, en el horizonte, puntúa con una
+función de evaluación estática. Si el presupuesto se agota a mitad de una
+iteración, se descarta y se usa la jugada de la última iteración completa.
+"""
+
+import math
+from typing import List, Optional, Tuple
+
+from src.ai.budget import SearchTimeout
+from src.ai.context import SearchContext
+from src.ai.evaluation import open_lines_evaluation
+from src.ai.minimax import (
+    Evaluation,
+    find_best_move_and_viz,
+    get_focused_tree,
+    minimax_alpha_beta,
+    minimax_bruteforce,
+)
+from src.ai.opening_book import book_move, load_opening_book
+from src.ai.ordering import MoveOrderer
+from src.ai.transposition import TranspositionTable, empty_cells
+from src.game_logic.board import Board
+
+
+def _search_root(
+    board: Board,
+    depth_limit: int,
+    scoring_function,
+    context: SearchContext,
+    evaluate: Evaluation,
+    table: Optional[TranspositionTable],
+    ordering: Optional[MoveOrderer],
+    root_scores: List[Tuple[Tuple[int, int], float]],
+):
+    """Puntúa cada jugada raíz con ventana completa hasta depth_limit plies desde la raíz."""
+    ai_player_id = board.turn
+    for move in board.get_available_moves():
+        board.push(move)
+        if scoring_function is minimax_bruteforce:
+            score = minimax_bruteforce(board, 1, False, context, ai_player_id, table, depth_limit, evaluate)
+        else:
+            score = scoring_function(
+                board,
+                1,
+                -math.inf,
+                math.inf,
+                False,
+                context,
+                ai_player_id,
+                table,
+                depth_limit,
+                evaluate,
+                ordering,
+            )
+        board.pop()
+        root_scores.append((move, score))
+
+
+def _best_of(root_scores: List[Tuple[Tuple[int, int], float]]) -> Tuple[Tuple[int, int], float]:
+    """Primera jugada (en orden de filas) con el mejor puntaje."""
+    best_move, best_score = root_scores[0]
+    for move, score in root_scores:
+        if score > best_score:
+            best_move, best_score = move, score
+    return best_move, best_score
+
+
+def iterative_deepening(
+    board: Board,
+    use_alpha_beta: bool = True,
+    time_limit: Optional[float] = None,
+    node_limit: Optional[int] = None,
+    max_depth: Optional[int] = None,
+    evaluate: Evaluation = open_lines_evaluation,
+    table: Optional[TranspositionTable] = None,
+    ordering: Optional[MoveOrderer] = None,
+    scoring_function=None,
+    context: Optional[SearchContext] = None,
+) -> dict:
+    """
+    Busca con profundidad creciente hasta agotar el presupuesto (o el árbol).
+    ordering solo afecta a alfa-beta y PVS; las jugadas raíz se recorren en orden de filas.
+    scoring_function: reemplaza al minimax elegido por use_alpha_beta (por ejemplo minimax_pvs).
+    context: contexto de la búsqueda; si se pasa, su presupuesto reemplaza a time_limit/node_limit.
+    Retorna un dict con: move, score, depth (última iteración completa), nodes,
+    complete (True si la búsqueda llegó a todos los finales) y root_scores.
+    """
+    if context is None:
+        context = SearchContext(time_limit=time_limit, node_limit=node_limit)
+
+    moves = board.get_available_moves()
+    result = {
+        "move": moves[0] if moves else (0, 0),
+        "score": 0,
+        "depth": 0,
+        "nodes": 0,
+        "complete": not moves,
+        "root_scores": [],
+    }
+    if not moves:
+        return result
+
+    if scoring_function is None:
+        scoring_function = minimax_alpha_beta if use_alpha_beta else minimax_bruteforce
+    start = len(board.history)
+    full_depth = empty_cells(board)
+    depth_limit = 1
+
+    try:
+        while True:
+            root_scores = []
+            try:
+                _search_root(board, depth_limit, scoring_function, context, evaluate, table, ordering, root_scores)
+            except SearchTimeout:
+                if result["depth"] == 0 and root_scores:
+                    # Ninguna iteración terminó: mejor opción entre las jugadas ya puntuadas
+                    result["move"], result["score"] = _best_of(root_scores)
+                break
+
+            result["move"], result["score"] = _best_of(root_scores)
+            result["depth"] = depth_limit
+            result["root_scores"] = root_scores
+            context.update(best_move=result["move"], best_score=result["score"], depth=depth_limit)
+
+            if depth_limit >= full_depth:
+                result["complete"] = True
+                break
+            # Una victoria o derrota demostrada no cambia con más profundidad (y así se elige la más corta)
+            if abs(result["score"]) >= 1:
+                break
+            if max_depth is not None and depth_limit >= max_depth:
+                break
+            if context.exhausted():
+                break
+            depth_limit += 1
+    finally:
+        # Con SearchCancelled (no se atrapa aquí) tampoco quedan jugadas en el tablero del llamador
+        board.pop_to(start)
+
+    result["nodes"] = context.nodes
+    context.update(best_move=result["move"], best_score=result["score"])
+    context.finish()
+    return result
+
+
+def find_best_move_iterative(
+    board: Board,
+    use_alpha_beta: bool = True,
+    time_limit: Optional[float] = None,
+    node_limit: Optional[int] = None,
+    table: Optional[TranspositionTable] = None,
+    ordering: Optional[MoveOrderer] = None,
+    scoring_function=None,
+    use_book: bool = True,
+    context: Optional[SearchContext] = None,
+) -> Tuple[Tuple[int, int], int]:
+    """
+    Retorna (mejor_movimiento, total_nodos_evaluados) respetando el presupuesto. Para la simulación.
+    use_book: si la posición está en el libro de aperturas, responde sin buscar (0 nodos).
+    context: si se pasa, su presupuesto reemplaza a time_limit/node_limit (y se pueden leer sus estadísticas).
+    """
+    if use_book:
+        opening_move = book_move(board, context)
+        if opening_move is not None:
+            return opening_move, 0
+    result = iterative_deepening(
+        board,
+        use_alpha_beta,
+        time_limit,
+        node_limit,
+        table=table,
+        ordering=ordering,
+        scoring_function=scoring_function,
+        context=context,
+    )
+    return result["move"], result["nodes"]
+
+
+def _book_tree(board: Board, opening_move: Tuple[int, int]) -> dict:
+    """
+    Árbol de una posición del libro sin buscar: cada hijo que también está en el libro
+    lleva su valor y la jugada elegida, el de la raíz (no hay más puntajes sin buscar).
+    """
+    book = load_opening_book()
+    root_score = book.entry(board)[0]
+    root_node = {
+        "score": root_score,
+        "board_matrix": board.board,
+        "children": [],
+        "best_move_coordinate": opening_move,
+    }
+    for move in board.get_available_moves():
+        board.push(move)
+        entry = book.entry(board)
+        if move == opening_move or entry is not None:
+            # El libro puntúa para el jugador que mueve: en el hijo, el rival
+            score = root_score if move == opening_move else -entry[0]
+            root_node["children"].append(
+                {
+                    "score": score,
+                    "board_matrix": board.board,
+                    "children": [],
+                    "is_chosen": move == opening_move,
+                    "move": move,
+                }
+            )
+        board.pop()
+    return root_node
+
+
+def find_best_move_and_viz_limited(
+    board: Board,
+    use_alpha_beta: bool,
+    time_limit: float,
+    table: Optional[TranspositionTable] = None,
+    ordering: Optional[MoveOrderer] = None,
+    scoring_function=None,
+    context: Optional[SearchContext] = None,
+    use_book: bool = True,
+):
+    """
+    Como find_best_move_and_viz pero con techo de latencia: la jugada sale de la
+    profundización iterativa y el árbol visual se completa solo con el tiempo restante.
+    Si la profundización paró antes de los finales sin agotar el presupuesto (por una
+    victoria o derrota demostrada), las jugadas raíz se vuelven a puntuar con búsqueda
+    exacta; el árbol limitado (puntajes heurísticos, sin expandir) queda solo para
+    cuando el tiempo realmente se acabó.
+    context: si se pasa, su presupuesto reemplaza a time_limit.
+    use_book: en las posiciones del libro de aperturas la jugada no se busca y el árbol
+    se arma como en find_best_move_and_viz (sus puntajes salen casi todos del libro);
+    si el tiempo no alcanza, el árbol queda con los puntajes del libro, sin expandir.
+    Retorna: (best_move, tree_root_node)
+    """
+    if context is None:
+        context = SearchContext(time_limit=time_limit)
+    if scoring_function is None:
+        scoring_function = minimax_alpha_beta if use_alpha_beta else minimax_bruteforce
+    if use_book:
+        opening_move = book_move(board)
+        if opening_move is not None:
+            try:
+                _, root_node = find_best_move_and_viz(board, use_alpha_beta, table, scoring_function, context)
+            except SearchTimeout:
+                root_node = _book_tree(board, opening_move)
+                context.update(best_move=opening_move, best_score=root_node["score"], depth=empty_cells(board))
+                context.finish()
+            return opening_move, root_node
+    start = len(board.history)
+    try:
+        result = iterative_deepening(
+            board, table=table, ordering=ordering, scoring_function=scoring_function, context=context
+        )
+        best_move, best_score = result["move"], result["score"]
+        root_scores, complete = result["root_scores"], result["complete"]
+        ai_player_id = board.turn
+
+        if not complete and not context.exhausted():
+            exact_scores = []
+            try:
+                _search_root(board, None, scoring_function, context, None, table, ordering, exact_scores)
+            except SearchTimeout:
+                board.pop_to(start)
+            else:
+                root_scores, complete = exact_scores, True
+                best_move, best_score = _best_of(root_scores)
+                context.update(best_move=best_move, best_score=best_score, depth=empty_cells(board))
+
+        root_node = {
+            "score": best_score,
+            "board_matrix": board.board,
+            "children": [],
+            "best_move_coordinate": best_move,
+        }
+        for move, score in root_scores:
+            board.push(move)
+            root_node["children"].append(
+                {
+                    "score": score,
+                    "board_matrix": board.board,
+                    "children": [],
+                    "is_chosen": move == best_move,
+                    "move": move,
+                }
+            )
+            board.pop()
+
+        # Con la búsqueda completa y tiempo de sobra, se expande la ruta elegida como antes
+        if complete and not context.exhausted():
+            board.push(best_move)
+            try:
+                child_node = get_focused_tree(board, ai_player_id, scoring_function, 1, 3, table, context)
+            except SearchTimeout:
+                child_node = None
+            board.pop_to(start)
+
+            if child_node is not None:
+                for i, child in enumerate(root_node["children"]):
+                    if child["is_chosen"]:
+                        child_node.update(score=child["score"], is_chosen=True, move=best_move)
+                        root_node["children"][i] = child_node
+    finally:
+        # Una cancelación atraviesa los except de SearchTimeout: el tablero se restaura igual
+        board.pop_to(start)
+
+    context.finish()
+    return best_move, root_node
@@ -0,0 +1,190 @@
+"""
+Tabla de juego perfecto precalculada para el tablero de 3x3.
+
+El generador resuelve una sola vez todas las posiciones alcanzables usando
+minimax_alpha_beta y escribe un archivo binario con 3^9 entradas, indexadas por
+la codificación en base 3 del tablero (casilla i vale 0, 1 o 2 por 3^i).
+En tiempo de ejecución el archivo se mapea en memoria y cada consulta es O(1).
+
+Uso: python -m src.ai.lookup  (regenera src/ai/data/perfect_play.bin)
+"""
+
+import math
+import mmap
+import struct
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from src.ai.context import SearchContext
+from src.ai.minimax import get_focused_tree, minimax_alpha_beta
+from src.ai.transposition import TranspositionTable
+from src.game_logic.board import Board
+
+LOOKUP_ROWS, LOOKUP_COLS, LOOKUP_WIN_LENGTH = 3, 3, 3
+GEOMETRY = (LOOKUP_ROWS, LOOKUP_COLS, LOOKUP_WIN_LENGTH)
+CELLS = LOOKUP_ROWS * LOOKUP_COLS
+NUM_ENTRIES = 3**CELLS
+
+MAGIC = b"TTTLUT1\0"
+HEADER = struct.Struct("<8sBBH")  # magic, filas, columnas, tamaño de entrada
+ENTRY = struct.Struct("<bHB")  # puntaje, máscara de mejores jugadas, profundidad hasta el final
+UNREACHABLE = 127  # Puntaje reservado para posiciones que no pueden ocurrir
+
+DEFAULT_TABLE_PATH = Path(__file__).resolve().parent / "data" / "perfect_play.bin"
+
+# Valor en base 3 de cada máscara de 9 bits (jugador 1 suma 1·3^i, jugador 2 suma 2·3^i)
+_BASE3 = tuple(sum(3**i for i in range(CELLS) if mask >> i & 1) for mask in range(1 << CELLS))
+
+
+def board_index(board: Board) -> int:
+    """Índice en base 3 del tablero dentro de la tabla."""
+    return _BASE3[board.masks[0]] + 2 * _BASE3[board.masks[1]]
+
+
+def _terminal_score(board: Board) -> int:
+    """Puntaje de una posición terminal desde la perspectiva del jugador al que le tocaría mover."""
+    return -1 if board.winner else 0
+
+
+def _solve(board: Board, entries: Dict[int, Tuple[int, int, int]], table: TranspositionTable):
+    """Recorre en profundidad las posiciones alcanzables y las resuelve con minimax_alpha_beta."""
+    index = board_index(board)
+    if index in entries:
+        return
+
+    if board.game_over:
+        entries[index] = (_terminal_score(board), 0, 0)
+        return
+
+    player = board.turn
+    scores = []
+    for move in board.get_available_moves():
+        board.push(move)
+        score = minimax_alpha_beta(board, 0, -math.inf, math.inf, False, SearchContext(), player, table)
+        _solve(board, entries, table)
+        scores.append((move, score, board_index(board)))
+        board.pop()
+
+    best_score = max(score for _, score, _ in scores)
+    best_mask = 0
+    child_depths = []
+    for move, score, child_index in scores:
+        if score == best_score:
+            best_mask |= 1 << (move[0] * LOOKUP_COLS + move[1])
+            child_depths.append(entries[child_index][2])
+
+    # Quien gana busca el final más corto; quien pierde o empata, el más largo
+    depth = 1 + (min(child_depths) if best_score > 0 else max(child_depths))
+    entries[index] = (int(best_score), best_mask, depth)
+
+
+def generate_lookup_table(path: Path = DEFAULT_TABLE_PATH) -> int:
+    """Resuelve todas las posiciones alcanzables y escribe la tabla binaria. Retorna cuántas resolvió."""
+    board = Board(*GEOMETRY)
+    entries: Dict[int, Tuple[int, int, int]] = {}
+    _solve(board, entries, TranspositionTable())
+
+    data = bytearray(HEADER.size + NUM_ENTRIES * ENTRY.size)
+    HEADER.pack_into(data, 0, MAGIC, LOOKUP_ROWS, LOOKUP_COLS, ENTRY.size)
+    for index in range(NUM_ENTRIES):
+        score, best_mask, depth = entries.get(index, (UNREACHABLE, 0, 0))
+        ENTRY.pack_into(data, HEADER.size + index * ENTRY.size, score, best_mask, depth)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(bytes(data))
+    return len(entries)
+
+
+class LookupTable:
+    """Vista de solo lectura, mapeada en memoria, de la tabla de juego perfecto."""
+
+    def __init__(self, path: Path = DEFAULT_TABLE_PATH):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, rows, cols, entry_size = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or (rows, cols) != (LOOKUP_ROWS, LOOKUP_COLS) or entry_size != ENTRY.size:
+            self._mm.close()
+            raise ValueError(f"Archivo de tabla inválido: {path}")
+
+    def close(self):
+        self._mm.close()
+
+    def entry(self, board: Board) -> Tuple[int, int, int]:
+        """Retorna (puntaje, máscara de mejores jugadas, profundidad hasta el final) para el jugador que mueve."""
+        return ENTRY.unpack_from(self._mm, HEADER.size + board_index(board) * ENTRY.size)
+
+
+_table: Optional[LookupTable] = None
+
+
+def load_lookup_table(path: Path = DEFAULT_TABLE_PATH) -> LookupTable:
+    """Carga (y si no existe, genera) la tabla compartida del proceso."""
+    global _table
+    if _table is None:
+        if not path.exists():
+            generate_lookup_table(path)
+        _table = LookupTable(path)
+    return _table
+
+
+def find_best_move_lookup(board: Board) -> Optional[Tuple[int, int]]:
+    """
+    Mejor jugada sin búsqueda. Entre las jugadas óptimas elige la primera en orden
+    de filas, igual que find_best_move_alpha_beta.
+    """
+    if (board.rows, board.cols, board.win_length) != GEOMETRY:
+        raise ValueError("La tabla de juego perfecto solo existe para el tres en raya de 3x3")
+    if board.game_over:
+        return None
+
+    _, best_mask, _ = load_lookup_table().entry(board)
+    index = (best_mask & -best_mask).bit_length() - 1
+    return index // LOOKUP_COLS, index % LOOKUP_COLS
+
+
+def minimax_lookup(
+    board: Board,
+    depth: int,
+    alpha: float,
+    beta: float,
+    is_maximizing: bool,
+    context: SearchContext,
+    maximizing_player_id: int,
+    table: Optional[TranspositionTable] = None,
+    max_depth: Optional[int] = None,
+    evaluate=None,
+    ordering=None,
+) -> int:
+    """
+    Puntaje de la tabla con la misma firma que minimax_alpha_beta, para usarlo como
+    función de evaluación en get_focused_tree. Cuenta un nodo por consulta.
+    """
+    context.visit(depth)
+    if board.game_over:
+        context.terminal()
+        if board.winner == 0:
+            return 0
+        return 1 if board.winner == maximizing_player_id else -1
+
+    score = load_lookup_table().entry(board)[0]
+    return score if board.turn == maximizing_player_id else -score
+
+
+def find_best_move_lookup_and_viz(board: Board, context: Optional[SearchContext] = None):
+    """Equivalente a find_best_move_and_viz pero puntuando cada nodo con la tabla."""
+    start = len(board.history)
+    try:
+        root_node = get_focused_tree(board, board.turn, minimax_lookup, max_viz_depth=3, context=context)
+    finally:
+        # Cortada por presupuesto o cancelación, la búsqueda no deja jugadas en el tablero del llamador
+        board.pop_to(start)
+    best_move = root_node.get("best_move_coordinate")
+    if context is not None:
+        context.update(best_move=best_move, best_score=root_node["score"])
+        context.finish()
+    return best_move, root_node
+
+
+if __name__ == "__main__":
+    solved = generate_lookup_table()
+    print(f"Tabla generada en '{DEFAULT_TABLE_PATH}' ({solved} posiciones alcanzables).")
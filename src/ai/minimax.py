@@ -1,47 +1,96 @@
 import math
-from copy import deepcopy
-from typing import Dict, List, Tuple
-
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.ai.context import DetailedSearchContext, SearchContext
+from src.ai.opening_book import OpeningBook, book_move, load_opening_book
+from src.ai.ordering import MoveOrderer
+from src.ai.transposition import (
+    EXACT,
+    TranspositionTable,
+    best_move_from_entry,
+    empty_cells,
+    probe_window,
+    store_window,
+    to_canonical_cell,
+)
 from src.game_logic.board import Board
 
+Evaluation = Callable[[Board, int], float]
+
+# Pool de score_root_moves_parallel: arrancar procesos cuesta más que puntuar una jugada,
+# así que se crea una vez y se reutiliza en todas las jugadas de la corrida
+_root_pool: Optional[ProcessPoolExecutor] = None
+_root_pool_key: Optional[Tuple[int, int]] = None
+
 
 def minimax_bruteforce(
     board: Board,
     depth: int,
     is_maximizing: bool,
-    counter: Dict[str, int],
+    context: SearchContext,
     maximizing_player_id: int,
+    table: Optional[TranspositionTable] = None,
+    max_depth: Optional[int] = None,
+    evaluate: Optional[Evaluation] = None,
 ) -> int:
     """
     maximizing_player_id: El ID del jugador (IA) que quiere obtener +1.
+    context: cuenta los nodos; si su presupuesto se agota lanza SearchTimeout (o SearchCancelled).
+    table: tabla de transposición opcional; solo guarda valores exactos.
+    max_depth/evaluate: si se indican, al llegar a esa profundidad se usa la evaluación estática.
     """
-    counter["nodes"] += 1
+    context.visit(depth)
 
     if board.winner is not None and board.winner != 0:
+        context.terminal()
         if board.winner == maximizing_player_id:
             return 1
         else:
             return -1
 
     if board.is_full():
+        context.terminal()
         return 0
 
+    if max_depth is not None and depth >= max_depth:
+        return evaluate(board, maximizing_player_id)
+
+    if table is not None:
+        key, sym = table.key(board)
+        remaining = empty_cells(board) if max_depth is None else min(empty_cells(board), max_depth - depth)
+        entry = table.probe(key)
+        if entry is not None and entry[1] == EXACT and entry[2] >= remaining:
+            context.tt_hit()
+            return entry[0] if is_maximizing else -entry[0]
+
+    best_move = None
     if is_maximizing:
         best_score = -math.inf
         for move in board.get_available_moves():
-            temp_board = deepcopy(board)
-            temp_board.make_move(move[0], move[1])
-            score = minimax_bruteforce(temp_board, depth + 1, False, counter, maximizing_player_id)
-            best_score = max(score, best_score)
-        return best_score
+            board.push(move)
+            score = minimax_bruteforce(
+                board, depth + 1, False, context, maximizing_player_id, table, max_depth, evaluate
+            )
+            board.pop()
+            if score > best_score:
+                best_score, best_move = score, move
     else:
         best_score = math.inf
         for move in board.get_available_moves():
-            temp_board = deepcopy(board)
-            temp_board.make_move(move[0], move[1])
-            score = minimax_bruteforce(temp_board, depth + 1, True, counter, maximizing_player_id)
-            best_score = min(score, best_score)
-        return best_score
+            board.push(move)
+            score = minimax_bruteforce(
+                board, depth + 1, True, context, maximizing_player_id, table, max_depth, evaluate
+            )
+            board.pop()
+            if score < best_score:
+                best_score, best_move = score, move
+
+    if table is not None:
+        move_index = to_canonical_cell(board, best_move[0] * board.cols + best_move[1], sym)
+        table.store(key, best_score if is_maximizing else -best_score, EXACT, remaining, move_index)
+    return best_score
 
 
 def minimax_alpha_beta(
@@ -50,63 +99,181 @@ def minimax_alpha_beta(
     alpha: float,
     beta: float,
     is_maximizing: bool,
-    counter: Dict[str, int],
+    context: SearchContext,
     maximizing_player_id: int,
+    table: Optional[TranspositionTable] = None,
+    max_depth: Optional[int] = None,
+    evaluate: Optional[Evaluation] = None,
+    ordering: Optional[MoveOrderer] = None,
 ) -> int:
-    counter["nodes"] += 1
+    """
+    context: cuenta los nodos; si su presupuesto se agota lanza SearchTimeout (o SearchCancelled).
+    table: tabla de transposición opcional con cotas exactas, inferiores y superiores.
+    max_depth/evaluate: si se indican, al llegar a esa profundidad se usa la evaluación estática.
+    ordering: ordenador de jugadas opcional (jugada hash, killers, historia, prior estático).
+    """
+    context.visit(depth)
 
     if board.winner is not None and board.winner != 0:
+        context.terminal()
         if board.winner == maximizing_player_id:
             return 1
         else:
             return -1
 
     if board.is_full():
+        context.terminal()
         return 0
 
+    if max_depth is not None and depth >= max_depth:
+        return evaluate(board, maximizing_player_id)
+
+    hash_move = None
+    if table is not None or ordering is not None:
+        remaining = empty_cells(board) if max_depth is None else min(empty_cells(board), max_depth - depth)
+    if table is not None:
+        key, sym = table.key(board)
+        value, alpha, beta, entry = probe_window(table, key, remaining, is_maximizing, alpha, beta)
+        if value is not None:
+            context.tt_hit()
+            return value
+        alpha_orig, beta_orig = alpha, beta
+        if entry is not None:
+            hash_move = best_move_from_entry(board, entry, sym)
+
+    moves = board.get_available_moves()
+    if ordering is not None:
+        moves = ordering.order(board, moves, depth, hash_move)
+
+    best_move = None
     if is_maximizing:
         best_score = -math.inf
-        for move in board.get_available_moves():
-            temp_board = deepcopy(board)
-            temp_board.make_move(move[0], move[1])
+        for move in moves:
+            board.push(move)
             score = minimax_alpha_beta(
-                temp_board,
+                board,
                 depth + 1,
                 alpha,
                 beta,
                 False,
-                counter,
+                context,
                 maximizing_player_id,
+                table,
+                max_depth,
+                evaluate,
+                ordering,
             )
-            best_score = max(score, best_score)
+            board.pop()
+            if score > best_score:
+                best_score, best_move = score, move
             alpha = max(alpha, best_score)
             if beta <= alpha:
+                context.cutoff(depth, moves.index(move))
+                if ordering is not None:
+                    ordering.record_cutoff(board, move, depth, remaining)
                 break
-        return best_score
     else:
         best_score = math.inf
-        for move in board.get_available_moves():
-            temp_board = deepcopy(board)
-            temp_board.make_move(move[0], move[1])
+        for move in moves:
+            board.push(move)
             score = minimax_alpha_beta(
-                temp_board,
+                board,
                 depth + 1,
                 alpha,
                 beta,
                 True,
-                counter,
+                context,
                 maximizing_player_id,
+                table,
+                max_depth,
+                evaluate,
+                ordering,
             )
-            best_score = min(score, best_score)
+            board.pop()
+            if score < best_score:
+                best_score, best_move = score, move
             beta = min(beta, best_score)
             if beta <= alpha:
+                context.cutoff(depth, moves.index(move))
+                if ordering is not None:
+                    ordering.record_cutoff(board, move, depth, remaining)
                 break
-        return best_score
+
+    if table is not None:
+        move_index = to_canonical_cell(board, best_move[0] * board.cols + best_move[1], sym)
+        store_window(table, key, best_score, alpha_orig, beta_orig, is_maximizing, remaining, move_index)
+    return best_score
+
+
+def _score_root_move(task: Tuple[Tuple[int, int, int], List[Tuple[int, int]], Tuple[int, int], bool, bool, bool]):
+    """
+    Trabajo de un proceso del pool: reconstruye la posición, juega la jugada raíz y
+    la puntúa con una búsqueda completa. Retorna (puntaje, nodos, tablero resultante, detalle).
+    """
+    geometry, played, move, use_alpha_beta, use_table, detailed = task
+    board = Board(*geometry)
+    for played_move in played:
+        board.push(played_move)
+    ai_player_id = board.turn
+    table = TranspositionTable() if use_table else None
+    context = DetailedSearchContext() if detailed else SearchContext()
+
+    board.push(move)
+    if use_alpha_beta:
+        score = minimax_alpha_beta(board, 1, -math.inf, math.inf, False, context, ai_player_id, table)
+    else:
+        score = minimax_bruteforce(board, 1, False, context, ai_player_id, table)
+    return score, context.nodes, board.board, context.detail()
+
+
+def root_pool(workers: int) -> ProcessPoolExecutor:
+    """Pool compartido de `workers` procesos; se recrea si cambia el tamaño o si el proceso es un fork."""
+    global _root_pool, _root_pool_key
+    key = (os.getpid(), workers)
+    if _root_pool is None or _root_pool_key != key:
+        if _root_pool is not None and _root_pool_key[0] == key[0]:
+            _root_pool.shutdown()
+        _root_pool = ProcessPoolExecutor(max_workers=workers)
+        _root_pool_key = key
+    return _root_pool
+
+
+def score_root_moves_parallel(
+    board: Board,
+    use_alpha_beta: bool,
+    workers: int,
+    use_table: bool = False,
+    context: Optional[SearchContext] = None,
+) -> List[Tuple[Tuple[int, int], float, int, List[List[int]]]]:
+    """
+    Reparte las jugadas raíz entre los `workers` procesos de root_pool y retorna, en orden de filas,
+    (jugada, puntaje, nodos, tablero) de cada una. Cada jugada se busca con ventana
+    completa y, si use_table, con una tabla de transposición propia del trabajo
+    (las tablas no se comparten entre procesos).
+    context: si se pasa, acumula los nodos (y el detalle, si lo recolecta) de todos los procesos.
+    """
+    geometry = (board.rows, board.cols, board.win_length)
+    played = [entry[0] for entry in board.history]
+    moves = board.get_available_moves()
+    detailed = context is not None and context.collects_detail
+    tasks = [(geometry, played, move, use_alpha_beta, use_table, detailed) for move in moves]
+    results = list(root_pool(workers).map(_score_root_move, tasks))
+    if context is not None:
+        for _, nodes, _, detail in results:
+            context.merge(nodes, detail)
+    return [(move, score, nodes, matrix) for move, (score, nodes, matrix, _) in zip(moves, results)]
 
 
 def find_best_move_bruteforce(
     board: Board,
+    table: Optional[TranspositionTable] = None,
+    workers: Optional[int] = None,
+    use_book: bool = True,
 ) -> Tuple[Tuple[int, int], List[dict]]:
+    """
+    workers: con más de 1, las jugadas raíz se puntúan en paralelo con un pool de procesos.
+    use_book: consulta primero el libro de aperturas (sin puntajes por jugada si acierta).
+    """
     best_score = -math.inf
     best_move = None
     graph_data = []
@@ -117,15 +284,26 @@ def find_best_move_bruteforce(
     if not available_moves:
         return (0, 0), []
 
+    if use_book:
+        opening_move = book_move(board)
+        if opening_move is not None:
+            return opening_move, []
+
     best_move = available_moves[0]
 
-    for move in available_moves:
-        temp_board = deepcopy(board)
-        temp_board.make_move(move[0], move[1])
+    if workers is not None and workers > 1:
+        for move, score, _, matrix in score_root_moves_parallel(board, False, workers, table is not None):
+            graph_data.append({"move": move, "score": score, "board": matrix})
+            if score > best_score:
+                best_score, best_move = score, move
+        return best_move, graph_data
 
-        score = minimax_bruteforce(temp_board, 0, False, {"nodes": 0}, ai_player_id)
+    for move in available_moves:
+        board.push(move)
+        score = minimax_bruteforce(board, 0, False, SearchContext(), ai_player_id, table)
+        graph_data.append({"move": move, "score": score, "board": board.board})
+        board.pop()
 
-        graph_data.append({"move": move, "score": score, "board": temp_board.board.tolist()})
         if score > best_score:
             best_score, best_move = score, move
 
@@ -134,7 +312,16 @@ def find_best_move_bruteforce(
 
 def find_best_move_alpha_beta(
     board: Board,
+    table: Optional[TranspositionTable] = None,
+    ordering: Optional[MoveOrderer] = None,
+    workers: Optional[int] = None,
+    use_book: bool = True,
 ) -> Tuple[Tuple[int, int], List[dict]]:
+    """
+    workers: con más de 1, las jugadas raíz se puntúan en paralelo con un pool de
+    procesos (sin ordenamiento; cada proceso usa su propia tabla si se pasó `table`).
+    use_book: consulta primero el libro de aperturas (sin puntajes por jugada si acierta).
+    """
     best_score = -math.inf
     best_move = None
     graph_data = []
@@ -145,36 +332,119 @@ def find_best_move_alpha_beta(
     if not available_moves:
         return (0, 0), []
 
+    if use_book:
+        opening_move = book_move(board)
+        if opening_move is not None:
+            return opening_move, []
+
     best_move = available_moves[0]
 
-    for move in available_moves:
-        temp_board = deepcopy(board)
-        temp_board.make_move(move[0], move[1])
+    if workers is not None and workers > 1:
+        for move, score, _, matrix in score_root_moves_parallel(board, True, workers, table is not None):
+            graph_data.append({"move": move, "score": score, "board": matrix})
+            if score > best_score:
+                best_score, best_move = score, move
+        return best_move, graph_data
 
+    for move in available_moves:
+        board.push(move)
         score = minimax_alpha_beta(
-            temp_board,
+            board,
             0,
             -math.inf,
             math.inf,
             False,
-            {"nodes": 0},
+            SearchContext(),
             ai_player_id,
+            table,
+            ordering=ordering,
         )
+        graph_data.append({"move": move, "score": score, "board": board.board})
+        board.pop()
 
-        graph_data.append({"move": move, "score": score, "board": temp_board.board.tolist()})
         if score > best_score:
             best_score, best_move = score, move
 
     return best_move, graph_data
 
 
+def _score_position(
+    board: Board,
+    is_maximizing: bool,
+    ai_player_id: int,
+    scoring_function,
+    table: Optional[TranspositionTable],
+    context: SearchContext,
+    memo: Dict[Tuple[int, int], float],
+    expand_depth: int,
+    book: Optional[OpeningBook] = None,
+) -> float:
+    """
+    Puntaje exacto de la posición para ai_player_id, memorizado por posición.
+    Con expand_depth > 0 los primeros plies se recorren aquí (mismo recorrido que
+    haría minimax) para dejar en `memo` el puntaje de cada descendiente que el
+    árbol visual consultará después. Las posiciones del libro no se buscan.
+    """
+    key = (board.masks[0], board.masks[1])
+    score = memo.get(key)
+    if score is not None:
+        return score
+
+    entry = book.entry(board) if book is not None else None
+    if entry is not None:
+        score = entry[0] if board.turn == ai_player_id else -entry[0]
+    elif expand_depth > 0 and not board.game_over:
+        context.visit()
+        scores = []
+        for move in board.get_available_moves():
+            board.push(move)
+            scores.append(
+                _score_position(
+                    board,
+                    not is_maximizing,
+                    ai_player_id,
+                    scoring_function,
+                    table,
+                    context,
+                    memo,
+                    expand_depth - 1,
+                    book,
+                )
+            )
+            board.pop()
+        score = max(scores) if is_maximizing else min(scores)
+    elif scoring_function.__name__ == "minimax_bruteforce":
+        score = scoring_function(board, 0, is_maximizing, context, ai_player_id, table)
+    else:
+        score = scoring_function(board, 0, -math.inf, math.inf, is_maximizing, context, ai_player_id, table)
+
+    memo[key] = score
+    return score
+
+
 def get_focused_tree(
     board: Board,
     ai_player_id: int,
     scoring_function,
     current_depth=0,
     max_viz_depth=3,
+    table: Optional[TranspositionTable] = None,
+    context: Optional[SearchContext] = None,
+    memo: Optional[Dict[Tuple[int, int], float]] = None,
+    book: Optional[OpeningBook] = None,
 ):
+    """
+    Árbol de decisión enfocado en la ruta elegida.
+    context: contexto compartido por todas las búsquedas del árbol (presupuesto,
+    cancelación, progreso); por defecto uno nuevo, sin límites, por jugada.
+    memo: puntajes ya calculados por posición, compartidos entre los niveles del árbol.
+    Con minimax_bruteforce (valores exactos en todos los nodos) el primer nivel
+    memoriza también los descendientes visibles, así los niveles siguientes no
+    vuelven a buscar; los motores con poda reutilizan en cambio la tabla de transposición.
+    book: libro de aperturas; las posiciones que contiene se puntúan sin buscar.
+    """
+    if memo is None:
+        memo = {}
     if board.game_over or current_depth >= max_viz_depth:
         score = 0
         if board.winner == ai_player_id:
@@ -183,7 +453,7 @@ def get_focused_tree(
             score = -1
         return {
             "score": score,
-            "board_matrix": board.board.tolist(),
+            "board_matrix": board.board,
             "children": [],
             "move": None,
         }
@@ -195,29 +465,28 @@ def get_focused_tree(
     if not moves:
         return {
             "score": 0,
-            "board_matrix": board.board.tolist(),
+            "board_matrix": board.board,
             "children": [],
             "move": None,
         }
 
+    expand_depth = max_viz_depth - current_depth - 1 if scoring_function.__name__ == "minimax_bruteforce" else 0
     for move in moves:
-        temp_board = deepcopy(board)
-        temp_board.make_move(move[0], move[1])
-
-        if scoring_function.__name__ == "minimax_bruteforce":
-            score = scoring_function(temp_board, 0, not is_maximizing, {"nodes": 0}, ai_player_id)
-        else:
-            score = scoring_function(
-                temp_board,
-                0,
-                -math.inf,
-                math.inf,
-                not is_maximizing,
-                {"nodes": 0},
-                ai_player_id,
-            )
-
-        candidates.append({"move": move, "score": score, "board": temp_board})
+        board.push(move)
+        move_context = context if context is not None else SearchContext()
+        score = _score_position(
+            board,
+            not is_maximizing,
+            ai_player_id,
+            scoring_function,
+            table,
+            move_context,
+            memo,
+            expand_depth,
+            book,
+        )
+        candidates.append({"move": move, "score": score, "board_matrix": board.board})
+        board.pop()
 
     # Elegir mejor
     if is_maximizing:
@@ -228,7 +497,7 @@ def get_focused_tree(
     # Nodo actual
     node = {
         "score": best_candidate["score"],
-        "board_matrix": board.board.tolist(),
+        "board_matrix": board.board,
         "children": [],
         "best_move_coordinate": best_candidate["move"],
     }
@@ -237,13 +506,19 @@ def get_focused_tree(
         is_best_path = cand["move"] == best_candidate["move"]
 
         if is_best_path:
+            board.push(cand["move"])
             child_node = get_focused_tree(
-                cand["board"],
+                board,
                 ai_player_id,
                 scoring_function,
                 current_depth + 1,
                 max_viz_depth,
+                table,
+                context,
+                memo,
+                book,
             )
+            board.pop()
             child_node["score"] = cand["score"]
             child_node["is_chosen"] = True
             child_node["move"] = cand["move"]
@@ -251,7 +526,7 @@ def get_focused_tree(
         else:
             leaf_node = {
                 "score": cand["score"],
-                "board_matrix": cand["board"].board.tolist(),
+                "board_matrix": cand["board_matrix"],
                 "children": [],
                 "is_chosen": False,
                 "move": cand["move"],
@@ -261,24 +536,62 @@ def get_focused_tree(
     return node
 
 
-def find_best_move_and_viz(board: Board, use_alpha_beta: bool):
+def find_best_move_and_viz(
+    board: Board,
+    use_alpha_beta: bool,
+    table: Optional[TranspositionTable] = None,
+    scoring_function=None,
+    context: Optional[SearchContext] = None,
+    use_book: bool = True,
+):
     """
     Calcula el mejor movimiento y genera el árbol visual.
+    table: tabla de transposición opcional que puede conservarse entre jugadas.
+    scoring_function: reemplaza al minimax elegido por use_alpha_beta (por ejemplo minimax_pvs).
+    context: contexto para acotar, observar o cancelar la búsqueda desde otro hilo.
+    use_book: puntúa con el libro de aperturas las posiciones que contiene.
     Retorna: (best_move, tree_root_node)
     """
     ai_player_id = board.turn
 
-    scoring_func = minimax_alpha_beta if use_alpha_beta else minimax_bruteforce
+    scoring_func = scoring_function or (minimax_alpha_beta if use_alpha_beta else minimax_bruteforce)
+    if table is None and scoring_func is not minimax_bruteforce:
+        # Tabla solo para este árbol: cada nivel reutiliza lo que ya resolvió el anterior
+        table = TranspositionTable()
 
-    root_node = get_focused_tree(board, ai_player_id, scoring_func, max_viz_depth=3)
+    book = load_opening_book() if use_book else None
+    start = len(board.history)
+    try:
+        root_node = get_focused_tree(
+            board, ai_player_id, scoring_func, max_viz_depth=3, table=table, context=context, book=book
+        )
+    finally:
+        # Cortada por presupuesto o cancelación, la búsqueda no deja jugadas en el tablero del llamador
+        board.pop_to(start)
 
     best_move = root_node.get("best_move_coordinate")
+    if context is not None:
+        context.update(best_move=best_move, best_score=root_node["score"], depth=empty_cells(board))
+        context.finish()
 
     return best_move, root_node
 
 
-def get_simulation_move_bruteforce(board: Board) -> Tuple[Tuple[int, int], int]:
-    """Retorna (mejor_movimiento, total_nodos_evaluados) para la simulación."""
+def get_simulation_move_bruteforce(
+    board: Board,
+    table: Optional[TranspositionTable] = None,
+    workers: Optional[int] = None,
+    context: Optional[SearchContext] = None,
+    use_book: bool = True,
+) -> Tuple[Tuple[int, int], int]:
+    """
+    Retorna (mejor_movimiento, total_nodos_evaluados) para la simulación.
+    workers: con más de 1, reparte las jugadas raíz entre procesos y suma sus nodos.
+    context: contexto opcional para acotar u observar la búsqueda (y leer sus estadísticas al final).
+    use_book: si la posición está en el libro de aperturas, responde sin buscar (0 nodos).
+    """
+    if context is None:
+        context = SearchContext()
 
     ai_player_id = board.turn
 
@@ -286,29 +599,53 @@ def get_simulation_move_bruteforce(board: Board) -> Tuple[Tuple[int, int], int]:
     if not moves:
         return (0, 0), 0
 
+    if use_book:
+        opening_move = book_move(board, context)
+        if opening_move is not None:
+            return opening_move, context.nodes
+
     best_score = -math.inf
     best_move = moves[0]
-    total_nodes = 0
-
-    for move in moves:
-        temp_board = deepcopy(board)
-        temp_board.make_move(move[0], move[1])
-        counter = {"nodes": 0}
 
-        score = minimax_bruteforce(temp_board, 0, False, counter, ai_player_id)
-
-        total_nodes += counter["nodes"]
-        if score > best_score:
-            best_score = score
-            best_move = move
-
-    return best_move, total_nodes
-
-
-def get_simulation_move_alpha_beta(board: Board) -> Tuple[Tuple[int, int], int]:
+    if workers is not None and workers > 1:
+        for move, score, _, _ in score_root_moves_parallel(board, False, workers, table is not None, context):
+            if score > best_score:
+                best_score, best_move = score, move
+    else:
+        start = len(board.history)
+        try:
+            for move in moves:
+                board.push(move)
+                score = minimax_bruteforce(board, 1, False, context, ai_player_id, table)
+                board.pop()
+
+                if score > best_score:
+                    best_score = score
+                    best_move = move
+                    context.update(best_move=best_move, best_score=best_score)
+        finally:
+            # Cortada por presupuesto o cancelación, la búsqueda no deja jugadas en el tablero del llamador
+            board.pop_to(start)
+
+    context.update(best_move=best_move, best_score=best_score, depth=empty_cells(board))
+    context.finish()
+    return best_move, context.nodes
+
+
+def get_simulation_move_alpha_beta(
+    board: Board,
+    table: Optional[TranspositionTable] = None,
+    ordering: Optional[MoveOrderer] = None,
+    context: Optional[SearchContext] = None,
+    use_book: bool = True,
+) -> Tuple[Tuple[int, int], int]:
     """
     Retorna (mejor_movimiento, total_nodos_evaluados). Para la simulación
+    context: contexto opcional para acotar u observar la búsqueda (y leer sus estadísticas al final).
+    use_book: si la posición está en el libro de aperturas, responde sin buscar (0 nodos).
     """
+    if context is None:
+        context = SearchContext()
 
     ai_player_id = board.turn
 
@@ -316,21 +653,32 @@ def get_simulation_move_alpha_beta(board: Board) -> Tuple[Tuple[int, int], int]:
     if not moves:
         return (0, 0), 0
 
+    if use_book:
+        opening_move = book_move(board, context)
+        if opening_move is not None:
+            return opening_move, context.nodes
+
     best_score = -math.inf
     best_move = moves[0]
-    counter = {"nodes": 0}
     alpha, beta = -math.inf, math.inf
 
-    for move in moves:
-        temp_board = deepcopy(board)
-        temp_board.make_move(move[0], move[1])
+    start = len(board.history)
+    try:
+        for move in moves:
+            board.push(move)
+            score = minimax_alpha_beta(board, 1, alpha, beta, False, context, ai_player_id, table, ordering=ordering)
+            board.pop()
 
-        score = minimax_alpha_beta(temp_board, 0, alpha, beta, False, counter, ai_player_id)
+            if score > best_score:
+                best_score = score
+                best_move = move
+                context.update(best_move=best_move, best_score=best_score)
 
-        if score > best_score:
-            best_score = score
-            best_move = move
-
-        alpha = max(alpha, best_score)
+            alpha = max(alpha, best_score)
+    finally:
+        # Cortada por presupuesto o cancelación, la búsqueda no deja jugadas en el tablero del llamador
+        board.pop_to(start)
 
-    return best_move, counter["nodes"]
+    context.update(depth=empty_cells(board))
+    context.finish()
+    return best_move, context.nodes
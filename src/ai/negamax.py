@@ -0,0 +1,237 @@
+"""
+Núcleo negamax con búsqueda de variante principal (PVS / NegaScout).
+
+A diferencia de minimax_alpha_beta, hay una sola rama: el valor siempre se
+expresa desde la perspectiva del jugador que mueve y se niega al subir. Tras la
+primera jugada de cada nodo, las demás se prueban con una ventana nula y solo
+se vuelven a buscar con ventana completa si la superan. En la raíz se usa una
+ventana de aspiración alrededor del valor esperado.
+"""
+
+import math
+from typing import Optional, Tuple
+
+from src.ai.context import SearchContext
+from src.ai.minimax import Evaluation
+from src.ai.opening_book import book_move
+from src.ai.ordering import MoveOrderer
+from src.ai.transposition import (
+    TranspositionTable,
+    best_move_from_entry,
+    empty_cells,
+    probe_window,
+    store_window,
+    to_canonical_cell,
+)
+from src.game_logic.board import Board
+
+NULL_WINDOW = 1e-6  # Ancho de la ventana nula (los puntajes no son enteros por la evaluación estática)
+ASPIRATION_DELTA = 0.5  # Semiancho de la ventana de aspiración en la raíz
+
+
+def negamax(
+    board: Board,
+    depth: int,
+    alpha: float,
+    beta: float,
+    context: SearchContext,
+    table: Optional[TranspositionTable] = None,
+    max_depth: Optional[int] = None,
+    evaluate: Optional[Evaluation] = None,
+    ordering: Optional[MoveOrderer] = None,
+    use_pvs: bool = True,
+) -> float:
+    """
+    Retorna el valor de la posición para el jugador que mueve (+1 gana, -1 pierde).
+    use_pvs: si es False se comporta como alfa-beta negamax clásico (sin ventanas nulas).
+    """
+    context.visit(depth)
+
+    if board.winner:
+        context.terminal()
+        return -1  # Ganó quien acaba de mover
+
+    if board.is_full():
+        context.terminal()
+        return 0
+
+    if max_depth is not None and depth >= max_depth:
+        return evaluate(board, board.turn)
+
+    hash_move = None
+    if table is not None or ordering is not None:
+        remaining = empty_cells(board) if max_depth is None else min(empty_cells(board), max_depth - depth)
+    if table is not None:
+        key, sym = table.key(board)
+        value, alpha, beta, entry = probe_window(table, key, remaining, True, alpha, beta)
+        if value is not None:
+            context.tt_hit()
+            return value
+        alpha_orig, beta_orig = alpha, beta
+        if entry is not None:
+            hash_move = best_move_from_entry(board, entry, sym)
+
+    moves = board.get_available_moves()
+    if ordering is not None:
+        moves = ordering.order(board, moves, depth, hash_move)
+
+    best_score = -math.inf
+    best_move = None
+    for i, move in enumerate(moves):
+        board.push(move)
+        if i == 0 or not use_pvs:
+            score = -negamax(board, depth + 1, -beta, -alpha, context, table, max_depth, evaluate, ordering, use_pvs)
+        else:
+            score = -negamax(
+                board,
+                depth + 1,
+                -alpha - NULL_WINDOW,
+                -alpha,
+                context,
+                table,
+                max_depth,
+                evaluate,
+                ordering,
+                use_pvs,
+            )
+            if alpha < score < beta:
+                score = -negamax(
+                    board, depth + 1, -beta, -alpha, context, table, max_depth, evaluate, ordering, use_pvs
+                )
+        board.pop()
+
+        if score > best_score:
+            best_score, best_move = score, move
+        if score > alpha:
+            alpha = score
+        if alpha >= beta:
+            context.cutoff(depth, i)
+            if ordering is not None:
+                ordering.record_cutoff(board, move, depth, remaining)
+            break
+
+    if table is not None:
+        move_index = to_canonical_cell(board, best_move[0] * board.cols + best_move[1], sym)
+        store_window(table, key, best_score, alpha_orig, beta_orig, True, remaining, move_index)
+    return best_score
+
+
+def minimax_pvs(
+    board: Board,
+    depth: int,
+    alpha: float,
+    beta: float,
+    is_maximizing: bool,
+    context: SearchContext,
+    maximizing_player_id: int,
+    table: Optional[TranspositionTable] = None,
+    max_depth: Optional[int] = None,
+    evaluate: Optional[Evaluation] = None,
+    ordering: Optional[MoveOrderer] = None,
+) -> float:
+    """
+    PVS con la misma firma que minimax_alpha_beta (valor desde la perspectiva de
+    maximizing_player_id), para usarlo en get_focused_tree y en la profundización iterativa.
+    """
+    if board.winner:
+        # Como en minimax_alpha_beta, el final se puntúa por el ganador y no por is_maximizing
+        context.visit(depth)
+        context.terminal()
+        return 1 if board.winner == maximizing_player_id else -1
+
+    if evaluate is not None:
+        # negamax evalúa para el jugador que mueve; se adapta la evaluación del llamador
+        original_evaluate = evaluate
+
+        def evaluate(b: Board, player_id: int) -> float:
+            value = original_evaluate(b, maximizing_player_id)
+            return value if player_id == maximizing_player_id else -value
+
+    if is_maximizing:
+        return negamax(board, depth, alpha, beta, context, table, max_depth, evaluate, ordering)
+    return -negamax(board, depth, -beta, -alpha, context, table, max_depth, evaluate, ordering)
+
+
+def _search_root(
+    board: Board,
+    alpha: float,
+    beta: float,
+    context: SearchContext,
+    table: Optional[TranspositionTable],
+    ordering: Optional[MoveOrderer],
+) -> Tuple[float, Tuple[int, int]]:
+    """
+    Raíz PVS en orden de filas: la jugada elegida es la primera con el mejor valor.
+    Como en los demás motores, la raíz no cuenta como nodo (los hijos están a profundidad 1).
+    """
+    moves = board.get_available_moves()
+    best_score = -math.inf
+    best_move = moves[0]
+    for i, move in enumerate(moves):
+        board.push(move)
+        if i == 0:
+            score = -negamax(board, 1, -beta, -alpha, context, table, ordering=ordering)
+        else:
+            score = -negamax(board, 1, -alpha - NULL_WINDOW, -alpha, context, table, ordering=ordering)
+            if alpha < score < beta:
+                score = -negamax(board, 1, -beta, -alpha, context, table, ordering=ordering)
+        board.pop()
+
+        if score > best_score:
+            best_score, best_move = score, move
+        if score > alpha:
+            alpha = score
+        if alpha >= beta:
+            context.cutoff(0, i)
+            break
+    return best_score, best_move
+
+
+def get_simulation_move_pvs(
+    board: Board,
+    table: Optional[TranspositionTable] = None,
+    ordering: Optional[MoveOrderer] = None,
+    aspiration: Optional[float] = ASPIRATION_DELTA,
+    context: Optional[SearchContext] = None,
+    use_book: bool = True,
+) -> Tuple[Tuple[int, int], int]:
+    """
+    Retorna (mejor_movimiento, total_nodos_evaluados) usando PVS. Para la simulación.
+    aspiration: semiancho de la ventana inicial alrededor del valor esperado
+    (el de la tabla si la posición ya se vio, 0 si no); None usa ventana completa.
+    context: contexto opcional para acotar u observar la búsqueda (y leer sus estadísticas al final).
+    use_book: si la posición está en el libro de aperturas, responde sin buscar (0 nodos).
+    """
+    if not board.get_available_moves():
+        return (0, 0), 0
+    if context is None:
+        context = SearchContext()
+
+    if use_book:
+        opening_move = book_move(board, context)
+        if opening_move is not None:
+            return opening_move, context.nodes
+
+    start = len(board.history)
+    try:
+        if aspiration is None:
+            score, best_move = _search_root(board, -math.inf, math.inf, context, table, ordering)
+        else:
+            guess = 0.0
+            if table is not None:
+                entry = table.entries.get(table.key(board)[0])
+                if entry is not None:
+                    guess = entry[0]
+
+            low, high = guess - aspiration, guess + aspiration
+            score, best_move = _search_root(board, low, high, context, table, ordering)
+            if score <= low or score >= high:
+                # Falló la aspiración: se repite con ventana completa
+                score, best_move = _search_root(board, -math.inf, math.inf, context, table, ordering)
+    finally:
+        # Cortada por presupuesto o cancelación, la búsqueda no deja jugadas en el tablero del llamador
+        board.pop_to(start)
+
+    context.update(best_move=best_move, best_score=score, depth=empty_cells(board))
+    context.finish()
+    return best_move, context.nodes
@@ -0,0 +1,146 @@
+"""
+Libro de aperturas: mejores respuestas precalculadas para los primeros plies.
+
+Las primeras jugadas son las más caras de buscar (el tablero vacío cuesta más de
+medio millón de nodos con minimax), pero son pocas posiciones distintas una vez
+reducidas por simetría. El generador las resuelve con minimax_alpha_beta y guarda
+en un JSON, por clave canónica, el valor para el jugador que mueve y la máscara de
+casillas óptimas en el marco canónico. Al consultar se traducen al tablero real y se
+elige la primera óptima en orden de filas, la misma que elegiría la búsqueda.
+
+Uso: python -m src.ai.opening_book  (regenera src/ai/data/opening_book.json)
+"""
+
+import json
+import math
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from src.ai.context import SearchContext
+from src.ai.transposition import (
+    TranspositionTable,
+    canonical_key,
+    empty_cells,
+    from_canonical_cell,
+    to_canonical_cell,
+)
+from src.config import BOARD_COLS, BOARD_ROWS, WIN_LENGTH
+from src.game_logic.board import Board
+
+BOOK_PLIES = 3  # Posiciones con menos de BOOK_PLIES fichas en el tablero
+DEFAULT_BOOK_PATH = Path(__file__).resolve().parent / "data" / "opening_book.json"
+
+
+def _solve_position(board: Board, table: TranspositionTable) -> Tuple[int, int]:
+    """Retorna (valor para el jugador que mueve, máscara de casillas óptimas en el marco canónico)."""
+    from src.ai.minimax import minimax_alpha_beta
+
+    _, sym = canonical_key(board)
+    player = board.turn
+    scores = []
+    for move in board.get_available_moves():
+        board.push(move)
+        scores.append((move, minimax_alpha_beta(board, 0, -math.inf, math.inf, False, SearchContext(), player, table)))
+        board.pop()
+
+    best_score = max(score for _, score in scores)
+    best_mask = 0
+    for move, score in scores:
+        if score == best_score:
+            best_mask |= 1 << to_canonical_cell(board, move[0] * board.cols + move[1], sym)
+    return int(best_score), best_mask
+
+
+def _collect(board: Board, plies: int, positions: Dict[int, Tuple[int, int]], table: TranspositionTable):
+    """Recorre las posiciones no terminales con menos de `plies` fichas, una vez por clase de simetría."""
+    if board.game_over or len(board.history) >= plies:
+        return
+    key, _ = canonical_key(board)
+    if key in positions:
+        return
+    positions[key] = _solve_position(board, table)
+    for move in board.get_available_moves():
+        board.push(move)
+        _collect(board, plies, positions, table)
+        board.pop()
+
+
+def generate_opening_book(
+    path: Path = DEFAULT_BOOK_PATH,
+    plies: int = BOOK_PLIES,
+    geometry: Tuple[int, int, int] = (BOARD_ROWS, BOARD_COLS, WIN_LENGTH),
+) -> int:
+    """Resuelve las posiciones de apertura y escribe el libro. Retorna cuántas posiciones guardó."""
+    positions: Dict[int, Tuple[int, int]] = {}
+    _collect(Board(*geometry), plies, positions, TranspositionTable())
+
+    data = {
+        "geometry": list(geometry),
+        "plies": plies,
+        "positions": {str(key): list(entry) for key, entry in sorted(positions.items())},
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, separators=(",", ":")) + "\n")
+    return len(positions)
+
+
+class OpeningBook:
+    """Libro cargado en memoria: clave canónica -> (valor, máscara de casillas óptimas canónicas)."""
+
+    def __init__(self, path: Path = DEFAULT_BOOK_PATH):
+        data = json.loads(Path(path).read_text())
+        self.geometry = tuple(data["geometry"])
+        self.plies = data["plies"]
+        self.positions = {int(key): tuple(entry) for key, entry in data["positions"].items()}
+
+    def entry(self, board: Board) -> Optional[Tuple[int, Tuple[int, int]]]:
+        """Retorna (valor para el jugador que mueve, mejor jugada) o None si la posición no está en el libro."""
+        if (board.rows, board.cols, board.win_length) != self.geometry or board.game_over:
+            return None
+        key, sym = canonical_key(board)
+        entry = self.positions.get(key)
+        if entry is None:
+            return None
+
+        score, best_mask = entry
+        best_index = None
+        while best_mask:
+            canonical = (best_mask & -best_mask).bit_length() - 1
+            best_mask &= best_mask - 1
+            index = from_canonical_cell(board, canonical, sym)
+            if best_index is None or index < best_index:
+                best_index = index
+        return score, (best_index // board.cols, best_index % board.cols)
+
+
+_book: Optional[OpeningBook] = None
+
+
+def load_opening_book(path: Path = DEFAULT_BOOK_PATH) -> OpeningBook:
+    """Carga (y si no existe, genera) el libro compartido del proceso."""
+    global _book
+    if _book is None:
+        if not path.exists():
+            generate_opening_book(path)
+        _book = OpeningBook(path)
+    return _book
+
+
+def book_move(board: Board, context: Optional[SearchContext] = None) -> Optional[Tuple[int, int]]:
+    """
+    Jugada del libro para la posición, o None si hay que buscarla.
+    context: si hay jugada, se cierra como una búsqueda completa que no visitó nodos.
+    """
+    entry = load_opening_book().entry(board)
+    if entry is None:
+        return None
+    score, move = entry
+    if context is not None:
+        context.update(best_move=move, best_score=score, depth=empty_cells(board))
+        context.finish()
+    return move
+
+
+if __name__ == "__main__":
+    stored = generate_opening_book()
+    print(f"Libro generado en '{DEFAULT_BOOK_PATH}' ({stored} posiciones).")
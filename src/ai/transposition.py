@@ -0,0 +1,237 @@
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from src.game_logic.board import Board
+
+# Tipos de entrada (valor desde la perspectiva del jugador que mueve)
+EXACT = 0
+LOWER = 1  # El valor real es >= al almacenado (corte beta)
+UPPER = 2  # El valor real es <= al almacenado (falla baja)
+
+CHUNK_BITS = 9  # Bits por tabla de traducción (512 entradas)
+
+
+@lru_cache(maxsize=None)
+def symmetry_permutations(rows: int, cols: int) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Permutaciones de casillas del grupo diédrico del tablero.
+    perm[i] es la casilla destino de la casilla i. Los tableros cuadrados tienen 8
+    simetrías; los rectangulares solo 4 (identidad, espejos y giro de 180°).
+    """
+    transforms = [
+        lambda r, c: (r, c),
+        lambda r, c: (r, cols - 1 - c),
+        lambda r, c: (rows - 1 - r, c),
+        lambda r, c: (rows - 1 - r, cols - 1 - c),
+    ]
+    if rows == cols:
+        transforms += [
+            lambda r, c: (c, r),
+            lambda r, c: (cols - 1 - c, r),
+            lambda r, c: (c, rows - 1 - r),
+            lambda r, c: (cols - 1 - c, rows - 1 - r),
+        ]
+
+    perms = []
+    for transform in transforms:
+        perm = []
+        for index in range(rows * cols):
+            r, c = transform(index // cols, index % cols)
+            perm.append(r * cols + c)
+        perms.append(tuple(perm))
+    return tuple(perms)
+
+
+@lru_cache(maxsize=None)
+def _chunk_tables(rows: int, cols: int) -> Tuple[Tuple[Tuple[int, ...], ...], ...]:
+    """
+    Tablas para transformar bitboards por bloques de CHUNK_BITS bits:
+    tables[s][k][v] es la máscara resultante de aplicar la simetría s al bloque k con valor v.
+    """
+    cells = rows * cols
+    tables = []
+    for perm in symmetry_permutations(rows, cols):
+        per_chunk = []
+        for start in range(0, cells, CHUNK_BITS):
+            width = min(CHUNK_BITS, cells - start)
+            table = []
+            for value in range(1 << width):
+                mask = 0
+                for offset in range(width):
+                    if value >> offset & 1:
+                        mask |= 1 << perm[start + offset]
+                table.append(mask)
+            per_chunk.append(tuple(table))
+        tables.append(tuple(per_chunk))
+    return tuple(tables)
+
+
+def transform_mask(mask: int, chunk_tables: Tuple[Tuple[int, ...], ...]) -> int:
+    """Aplica una simetría (dada por sus tablas de bloques) a un bitboard."""
+    result = 0
+    chunk_mask = (1 << CHUNK_BITS) - 1
+    for table in chunk_tables:
+        result |= table[mask & chunk_mask]
+        mask >>= CHUNK_BITS
+    return result
+
+
+def canonical_key(board: Board) -> Tuple[int, int]:
+    """
+    Retorna (clave, simetría) donde la clave es la menor codificación de la posición
+    entre todas sus simetrías y `simetría` es el índice que lleva el tablero a esa forma.
+    """
+    cells = board.rows * board.cols
+    p1, p2 = board.masks
+    best_key = -1
+    best_sym = 0
+    for sym, chunk_tables in enumerate(_chunk_tables(board.rows, board.cols)):
+        key = transform_mask(p1, chunk_tables) << cells | transform_mask(p2, chunk_tables)
+        if best_key < 0 or key < best_key:
+            best_key, best_sym = key, sym
+    return best_key, best_sym
+
+
+def to_canonical_cell(board: Board, index: int, sym: int) -> int:
+    """Traduce una casilla del tablero real al marco canónico."""
+    return symmetry_permutations(board.rows, board.cols)[sym][index]
+
+
+def from_canonical_cell(board: Board, index: int, sym: int) -> int:
+    """Traduce una casilla del marco canónico al tablero real."""
+    return symmetry_permutations(board.rows, board.cols)[sym].index(index)
+
+
+class TranspositionTable:
+    """
+    Tabla de transposición para la búsqueda minimax.
+
+    Las entradas se indexan por la clave canónica de la posición (reducida por
+    simetrías) y guardan (valor, tipo, profundidad restante, mejor casilla canónica),
+    con el valor expresado desde la perspectiva del jugador que mueve. Así la misma
+    tabla sirve para ambos jugadores y puede conservarse entre jugadas de una partida.
+
+    max_entries: capacidad máxima antes de desalojar entradas.
+    eviction: "lru" (desaloja la menos usada) o "fifo" (desaloja la más antigua).
+    """
+
+    def __init__(self, max_entries: int = 100_000, eviction: str = "lru", use_symmetry: bool = True):
+        if eviction not in ("lru", "fifo"):
+            raise ValueError(f"Política de desalojo desconocida: {eviction}")
+        self.max_entries = max_entries
+        self.eviction = eviction
+        self.use_symmetry = use_symmetry
+        self.entries: "OrderedDict[int, Tuple[float, int, int, int]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def clear(self):
+        """Vacía la tabla (por ejemplo al comenzar una nueva partida)."""
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, board: Board) -> Tuple[int, int]:
+        """Retorna (clave, simetría) para la posición actual."""
+        if self.use_symmetry:
+            return canonical_key(board)
+        return board.masks[0] << (board.rows * board.cols) | board.masks[1], 0
+
+    def probe(self, key: int) -> Optional[Tuple[float, int, int, int]]:
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        if self.eviction == "lru":
+            self.entries.move_to_end(key)
+        return entry
+
+    def store(self, key: int, value: float, flag: int, depth: int, move: int = -1):
+        """Guarda una entrada; si la clave ya existe solo se reemplaza con igual o mayor profundidad."""
+        entries = self.entries
+        old = entries.get(key)
+        if old is not None:
+            if old[2] > depth:
+                return
+            entries[key] = (value, flag, depth, move)
+            if self.eviction == "lru":
+                entries.move_to_end(key)
+            return
+
+        if len(entries) >= self.max_entries:
+            entries.popitem(last=False)
+        entries[key] = (value, flag, depth, move)
+
+
+def empty_cells(board: Board) -> int:
+    """Número de casillas libres, usado como profundidad restante de una búsqueda completa."""
+    return board.rows * board.cols - (board.masks[0] | board.masks[1]).bit_count()
+
+
+def best_move_from_entry(board: Board, entry: Tuple[float, int, int, int], sym: int) -> Optional[Tuple[int, int]]:
+    """Convierte la mejor casilla canónica de una entrada a coordenadas (fila, col) reales."""
+    move = entry[3]
+    if move < 0:
+        return None
+    index = from_canonical_cell(board, move, sym)
+    return index // board.cols, index % board.cols
+
+
+def probe_window(
+    table: TranspositionTable,
+    key: int,
+    depth: int,
+    is_maximizing: bool,
+    alpha: float,
+    beta: float,
+) -> Tuple[Optional[float], float, float, Optional[Tuple[float, int, int, int]]]:
+    """
+    Consulta la tabla para un nodo minimax con ventana (alpha, beta).
+    Retorna (valor, alpha, beta, entrada): `valor` no es None si la entrada permite
+    cortar directamente; en otro caso alpha/beta quedan ajustados con las cotas
+    guardadas. La entrada se devuelve aunque sea poco profunda (sirve para ordenar).
+    """
+    entry = table.probe(key)
+    if entry is None or entry[2] < depth:
+        return None, alpha, beta, entry
+
+    value = entry[0] if is_maximizing else -entry[0]
+    flag = entry[1]
+    if flag == EXACT:
+        return value, alpha, beta, entry
+    if (flag == LOWER) == is_maximizing:
+        alpha = max(alpha, value)
+    else:
+        beta = min(beta, value)
+    if beta <= alpha:
+        return value, alpha, beta, entry
+    return None, alpha, beta, entry
+
+
+def store_window(
+    table: TranspositionTable,
+    key: int,
+    score: float,
+    alpha: float,
+    beta: float,
+    is_maximizing: bool,
+    depth: int,
+    move: int = -1,
+):
+    """Guarda el resultado de un nodo minimax clasificándolo según la ventana original."""
+    if score <= alpha:
+        flag = UPPER
+    elif score >= beta:
+        flag = LOWER
+    else:
+        flag = EXACT
+    if not is_maximizing:
+        score = -score
+        if flag != EXACT:
+            flag = LOWER if flag == UPPER else UPPER
+    table.store(key, score, flag, depth, move)
@@ -0,0 +1,261 @@
+"""
+Banco de pruebas reproducible de los motores de búsqueda.
+
+Cada motor resuelve (sin libro de aperturas y con tablas nuevas por posición)
+conjuntos fijos de posiciones y se mide: nodos, tiempo de pared (el mejor de
+`repeat` corridas), nodos por segundo y pico de memoria (con tracemalloc, en una
+corrida aparte para no alterar el tiempo). Los valores obtenidos se guardan para
+detectar también cambios de resultado, no solo de velocidad.
+
+Los resultados se comparan con una línea base en JSON: más nodos, valores
+distintos o un tiempo / pico de memoria por encima de la tolerancia cuentan como
+regresión y el proceso termina con código 1.
+
+Uso: python -m src.benchmark [--engines ...] [--sets ...] [--save-baseline]
+"""
+
+import argparse
+import json
+import math
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.ai.context import SearchContext
+from src.ai.minimax import minimax_alpha_beta, minimax_bruteforce
+from src.ai.negamax import negamax
+from src.ai.ordering import MoveOrderer
+from src.ai.transposition import TranspositionTable
+from src.game_logic.board import Board
+
+DEFAULT_BASELINE_PATH = Path(__file__).resolve().parent.parent / "benchmarks" / "baseline.json"
+DEFAULT_REPEAT = 3
+DEFAULT_TOLERANCE = 0.25  # Margen relativo para tiempo y memoria (los nodos deben coincidir o bajar)
+# Margen absoluto que se suma al relativo: las mediciones de pocos milisegundos o KiB son puro ruido
+NOISE_FLOOR = {"seconds": 0.005, "peak_kib": 4.0}
+
+# Retorna (valor para el jugador que mueve, nodos visitados)
+Engine = Callable[[Board], Tuple[float, int]]
+
+# Posiciones tácticas: victoria inmediata, bloqueo obligado, horquilla y defensa de horquilla
+TACTICAL_POSITIONS = (
+    ((0, 0), (1, 0), (0, 1), (1, 1)),
+    ((0, 0), (1, 1), (2, 2), (0, 2)),
+    ((0, 0), (1, 1), (2, 2)),
+    ((1, 1), (0, 0), (2, 2), (0, 2)),
+    ((0, 1), (1, 1), (1, 0)),
+)
+
+
+def _minimax(board: Board) -> Tuple[float, int]:
+    context = SearchContext()
+    return minimax_bruteforce(board, 0, True, context, board.turn), context.nodes
+
+
+def _alpha_beta(board: Board) -> Tuple[float, int]:
+    context = SearchContext()
+    return minimax_alpha_beta(board, 0, -math.inf, math.inf, True, context, board.turn), context.nodes
+
+
+def _alpha_beta_tt(board: Board) -> Tuple[float, int]:
+    context = SearchContext()
+    value = minimax_alpha_beta(
+        board, 0, -math.inf, math.inf, True, context, board.turn, TranspositionTable(), ordering=MoveOrderer()
+    )
+    return value, context.nodes
+
+
+def _pvs(board: Board) -> Tuple[float, int]:
+    context = SearchContext()
+    return negamax(board, 0, -math.inf, math.inf, context), context.nodes
+
+
+def _pvs_tt(board: Board) -> Tuple[float, int]:
+    context = SearchContext()
+    value = negamax(board, 0, -math.inf, math.inf, context, TranspositionTable(), ordering=MoveOrderer())
+    return value, context.nodes
+
+
+ENGINES: Dict[str, Engine] = {
+    "minimax": _minimax,
+    "alpha_beta": _alpha_beta,
+    "alpha_beta_tt": _alpha_beta_tt,
+    "pvs": _pvs,
+    "pvs_tt": _pvs_tt,
+}
+
+
+def _positions_at_ply(plies: int) -> List[Tuple[Tuple[int, int], ...]]:
+    """Todas las secuencias de `plies` jugadas desde el tablero vacío (en orden de filas)."""
+    sequences = [()]
+    for _ in range(plies):
+        extended = []
+        for sequence in sequences:
+            board = _board_from(sequence)
+            if not board.game_over:
+                extended.extend(sequence + (move,) for move in board.get_available_moves())
+        sequences = extended
+    return sequences
+
+
+def _board_from(moves) -> Board:
+    board = Board()
+    for move in moves:
+        board.push(move)
+    return board
+
+
+POSITION_SETS: Dict[str, Callable[[], List[Tuple[Tuple[int, int], ...]]]] = {
+    "empty": lambda: [()],
+    "ply1": lambda: _positions_at_ply(1),
+    "ply2": lambda: _positions_at_ply(2),
+    "tactical": lambda: list(TACTICAL_POSITIONS),
+}
+
+
+def _solve_set(engine: Engine, boards: List[Board]) -> Tuple[List[float], int]:
+    values = []
+    nodes = 0
+    for board in boards:
+        value, visited = engine(board)
+        values.append(value)
+        nodes += visited
+    return values, nodes
+
+
+def measure(engine_name: str, set_name: str, repeat: int = DEFAULT_REPEAT) -> dict:
+    """Mide un motor sobre un conjunto de posiciones."""
+    engine = ENGINES[engine_name]
+    boards = [_board_from(moves) for moves in POSITION_SETS[set_name]()]
+
+    best_seconds = math.inf
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        values, nodes = _solve_set(engine, boards)
+        best_seconds = min(best_seconds, time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        _solve_set(engine, boards)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "positions": len(boards),
+        "nodes": nodes,
+        "seconds": best_seconds,
+        "nodes_per_second": nodes / best_seconds if best_seconds > 0 else 0.0,
+        "peak_kib": peak / 1024,
+        "values": values,
+    }
+
+
+def run_benchmarks(
+    engines: Optional[List[str]] = None,
+    sets: Optional[List[str]] = None,
+    repeat: int = DEFAULT_REPEAT,
+) -> Dict[str, dict]:
+    """Retorna {"motor/conjunto": medición} para cada combinación pedida."""
+    results = {}
+    for engine_name in engines or list(ENGINES):
+        for set_name in sets or list(POSITION_SETS):
+            results[f"{engine_name}/{set_name}"] = measure(engine_name, set_name, repeat)
+    return results
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], tolerance: float = DEFAULT_TOLERANCE) -> List[str]:
+    """Lista de regresiones de `results` respecto de la línea base (vacía si no hay)."""
+    regressions = []
+    for key, current in results.items():
+        reference = baseline.get(key)
+        if reference is None:
+            continue
+        if current["values"] != reference["values"]:
+            regressions.append(f"{key}: los valores cambiaron")
+        if current["nodes"] > reference["nodes"]:
+            regressions.append(f"{key}: nodos {reference['nodes']} -> {current['nodes']}")
+        for field, unit in (("seconds", "s"), ("peak_kib", " KiB")):
+            if current[field] > reference[field] * (1 + tolerance) + NOISE_FLOOR[field]:
+                regressions.append(f"{key}: {field} {reference[field]:.3f}{unit} -> {current[field]:.3f}{unit}")
+    return regressions
+
+
+def load_baseline(path: Path = DEFAULT_BASELINE_PATH) -> Dict[str, dict]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())["results"]
+
+
+def save_baseline(results: Dict[str, dict], path: Path = DEFAULT_BASELINE_PATH):
+    data = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2) + "\n")
+
+
+def format_report(results: Dict[str, dict], baseline: Dict[str, dict]) -> str:
+    lines = [f"{'motor/conjunto':<24} {'nodos':>10} {'seg':>8} {'nodos/s':>11} {'pico KiB':>9} {'vs base':>8}"]
+    for key, row in results.items():
+        reference = baseline.get(key)
+        ratio = f"{row['seconds'] / reference['seconds']:.2f}x" if reference and reference["seconds"] else "-"
+        lines.append(
+            f"{key:<24} {row['nodes']:>10} {row['seconds']:>8.3f} {row['nodes_per_second']:>11.0f} "
+            f"{row['peak_kib']:>9.1f} {ratio:>8}"
+        )
+    return "\n".join(lines)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Banco de pruebas de los motores de búsqueda.")
+    parser.add_argument("--engines", nargs="+", choices=list(ENGINES), default=list(ENGINES), help="Motores a medir.")
+    parser.add_argument(
+        "--sets", nargs="+", choices=list(POSITION_SETS), default=list(POSITION_SETS), help="Conjuntos de posiciones."
+    )
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Corridas por medición (se toma la mejor).")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH, help="Archivo JSON de la línea base.")
+    parser.add_argument(
+        "--tolerance", type=float, default=DEFAULT_TOLERANCE, help="Margen relativo para tiempo y memoria."
+    )
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="Guarda los resultados como nueva línea base (sin comparar)."
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    results = run_benchmarks(args.engines, args.sets, args.repeat)
+
+    if args.save_baseline:
+        # Se conservan las mediciones de la línea base que no se volvieron a correr
+        merged = {**load_baseline(args.baseline), **results}
+        save_baseline(merged, args.baseline)
+        print(format_report(results, {}))
+        print(f"\nLínea base guardada en '{args.baseline}'.")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    print(format_report(results, baseline))
+    if not baseline:
+        print(f"\nNo hay línea base en '{args.baseline}' (créala con --save-baseline).")
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print("\nRegresiones:")
+        for regression in regressions:
+            print(f"  - {regression}")
+        return 1
+    print("\nSin regresiones respecto de la línea base.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,9 +2,11 @@ WIDTH, HEIGHT = 1100, 750  # Expandido para márgenes cómodos
 BOARD_WIDTH = 600
 BOARD_OFFSET_Y = 100  # Margen superior
 BOARD_OFFSET_X = 50  # Margen izquierdo
+# Modo m,n,k: filas, columnas y fichas en línea para ganar (p. ej. 4, 4, 4 o gomoku 15, 15, 5)
 BOARD_ROWS, BOARD_COLS = 3, 3
+WIN_LENGTH = 3
 SQUARE_SIZE = BOARD_WIDTH // BOARD_COLS
-LINE_WIDTH = 15
+LINE_WIDTH = max(2, 45 // BOARD_COLS)
 
 
 BG_COLOR = (40, 42, 54)  # Carbón oscuro
@@ -15,8 +17,8 @@ CROSS_COLOR = (255, 121, 198)  # Rosa
 WIN_LINE_COLOR = (241, 250, 140)  # amarillo
 
 CIRCLE_RADIUS = SQUARE_SIZE // 3
-CIRCLE_WIDTH = 15
-CROSS_WIDTH = 25
+CIRCLE_WIDTH = max(2, 45 // BOARD_COLS)
+CROSS_WIDTH = max(3, 75 // BOARD_COLS)
 
 FONT_SIZE = 50
 FONT_COLOR = (248, 248, 242)
@@ -25,6 +27,9 @@ MENU_SELECTED_COLOR = (255, 255, 0)
 
 FPS = 60
 
+# Techo de latencia por jugada de la IA (segundos); None = búsqueda completa sin límite
+AI_MOVE_TIME_LIMIT = 10.0
+
 # Constantes del Grafo
 GRAPH_BG_COLOR = (40, 42, 54)
 NODE_COLOR = (255, 255, 255)
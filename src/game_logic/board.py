@@ -1,40 +1,142 @@
+from functools import lru_cache
 from typing import List, Tuple
 
-import numpy as np
+from src.config import BOARD_COLS, BOARD_ROWS, WIN_LENGTH
 
-from src.config import BOARD_COLS, BOARD_ROWS
+Cell = Tuple[int, int]
+WinLine = Tuple[int, Tuple[Cell, Cell]]
+
+# Direcciones de las líneas: horizontal, vertical, diagonal descendente y ascendente
+DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+
+@lru_cache(maxsize=None)
+def build_win_lines(rows: int, cols: int, win_length: int) -> Tuple[WinLine, ...]:
+    """
+    Precalcula todas las líneas ganadoras de longitud win_length como bitboards.
+    Retorna tuplas (mascara, win_info) donde el bit i corresponde a la casilla (i // cols, i % cols)
+    y win_info es ((fila, col) inicial, (fila, col) final) de la línea.
+    """
+    lines = []
+    for d_row, d_col in DIRECTIONS:
+        for row in range(rows):
+            for col in range(cols):
+                end_row = row + d_row * (win_length - 1)
+                end_col = col + d_col * (win_length - 1)
+                if not (0 <= end_row < rows and 0 <= end_col < cols):
+                    continue
+                mask = 0
+                for step in range(win_length):
+                    mask |= 1 << ((row + d_row * step) * cols + col + d_col * step)
+                lines.append((mask, ((row, col), (end_row, end_col))))
+    return tuple(lines)
+
+
+@lru_cache(maxsize=None)
+def build_cell_lines(rows: int, cols: int, win_length: int) -> Tuple[Tuple[WinLine, ...], ...]:
+    """Para cada casilla, las líneas ganadoras que pasan por ella (detección incremental)."""
+    lines = build_win_lines(rows, cols, win_length)
+    return tuple(tuple(line for line in lines if line[0] >> index & 1) for index in range(rows * cols))
 
 
 class Board:
-    def __init__(self):
-        self.board = np.zeros((BOARD_ROWS, BOARD_COLS))
+    """
+    Tablero m,n,k basado en bitboards: una máscara entera por jugador.
+    El bit i representa la casilla (i // cols, i % cols); gana quien alinee
+    win_length fichas en horizontal, vertical o diagonal.
+    """
+
+    def __init__(self, rows: int = BOARD_ROWS, cols: int = BOARD_COLS, win_length: int = WIN_LENGTH):
+        if not 1 <= win_length <= max(rows, cols):
+            raise ValueError(f"No se puede alinear {win_length} en un tablero de {rows}x{cols}")
+        self.rows = rows
+        self.cols = cols
+        self.win_length = win_length
+        self.full_mask = (1 << (self.rows * self.cols)) - 1
+        self.win_lines = build_win_lines(rows, cols, win_length)
+        self.cell_lines = build_cell_lines(rows, cols, win_length)
         self.reset()
 
     def reset(self):
         """Reinicia el tablero a su estado inicial."""
-        self.board.fill(0)
+        self.masks = [0, 0]  # masks[0] -> jugador 1, masks[1] -> jugador 2
         self.winner = 0
         self.turn = 1
         self.game_over = False
         self.win_info = None
+        self.history = []  # Pila de deshacer para push/pop
+
+    def copy(self) -> "Board":
+        """Copia independiente de la posición (incluida la pila de deshacer)."""
+        clone = Board.__new__(Board)
+        clone.__dict__.update(self.__dict__)
+        clone.masks = list(self.masks)
+        clone.history = list(self.history)
+        return clone
+
+    @property
+    def occupied(self) -> int:
+        """Máscara con todas las casillas ocupadas."""
+        return self.masks[0] | self.masks[1]
+
+    @property
+    def board(self) -> List[List[int]]:
+        """Vista de la cuadrícula como lista de listas (0 vacío, 1 o 2 jugador)."""
+        p1, p2 = self.masks
+        grid = []
+        for row in range(self.rows):
+            line = []
+            for col in range(self.cols):
+                bit = 1 << (row * self.cols + col)
+                line.append(1 if p1 & bit else 2 if p2 & bit else 0)
+            grid.append(line)
+        return grid
 
     def is_valid_move(self, row, col):
-        """Verifica si una casilla está vacía."""
-        return self.board[row][col] == 0
+        """Verifica si la casilla está dentro del tablero y vacía."""
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            return False
+        return not (self.masks[0] | self.masks[1]) & (1 << (row * self.cols + col))
 
     def make_move(self, row, col):
         """Realiza un movimiento y actualiza el estado del juego."""
-        if self.is_valid_move(row, col) and not self.game_over:
-            self.board[row][col] = self.turn
-            if self.check_win():
-                self.winner = self.turn
-                self.game_over = True
-            elif self.is_full():
-                self.game_over = True  # Es un empate
-            else:
-                self.switch_turn()
-            return True
-        return False
+        return self.push((row, col))
+
+    def push(self, move: Tuple[int, int]) -> bool:
+        """
+        Realiza un movimiento reversible: guarda en la pila el estado necesario
+        para que pop() lo deshaga sin copiar el tablero. Retorna False, sin tocar
+        nada, si la casilla está fuera del tablero u ocupada o si la partida terminó.
+        """
+        row, col = move
+        if self.game_over or not (0 <= row < self.rows and 0 <= col < self.cols):
+            return False
+        index = row * self.cols + col
+        bit = 1 << index
+        if (self.masks[0] | self.masks[1]) & bit:
+            return False
+
+        self.history.append((move, self.winner, self.turn, self.game_over, self.win_info))
+        self.masks[self.turn - 1] |= bit
+        if self.check_win_at(index):
+            self.winner = self.turn
+            self.game_over = True
+        elif self.is_full():
+            self.game_over = True  # Es un empate
+        else:
+            self.switch_turn()
+        return True
+
+    def pop(self) -> Tuple[int, int]:
+        """Deshace el último movimiento y retorna su coordenada (fila, col)."""
+        move, self.winner, self.turn, self.game_over, self.win_info = self.history.pop()
+        self.masks[self.turn - 1] &= ~(1 << (move[0] * self.cols + move[1]))
+        return move
+
+    def pop_to(self, length: int):
+        """Deshace jugadas hasta que el historial tenga `length` elementos (p. ej. tras abortar una búsqueda)."""
+        while len(self.history) > length:
+            self.pop()
 
     def switch_turn(self):
         """Cambia el turno del jugador."""
@@ -42,36 +144,34 @@ class Board:
 
     def is_full(self):
         """Verifica si el tablero está lleno."""
-        return 0 not in self.board
+        return (self.masks[0] | self.masks[1]) == self.full_mask
 
     def check_win(self):
         """Verifica todas las condiciones de victoria."""
-        player = self.turn
-        # Comprobar filas
-        for row in range(BOARD_ROWS):
-            if np.all(self.board[row] == player):
-                self.win_info = ("row", row)
-                return True
-        # Comprobar columnas
-        for col in range(BOARD_COLS):
-            if np.all(self.board[:, col] == player):
-                self.win_info = ("col", col)
+        player_mask = self.masks[self.turn - 1]
+        for line_mask, info in self.win_lines:
+            if player_mask & line_mask == line_mask:
+                self.win_info = info
                 return True
-        # Comprobar diagonales
-        if np.all(np.diag(self.board) == player):
-            self.win_info = ("diag", 1)  # Diagonal descendente
-            return True
-        if np.all(np.diag(np.fliplr(self.board)) == player):
-            self.win_info = ("diag", 2)  # Diagonal ascendente
-            return True
+        return False
 
+    def check_win_at(self, index: int):
+        """Verifica solo las líneas que pasan por la casilla recién jugada."""
+        player_mask = self.masks[self.turn - 1]
+        for line_mask, info in self.cell_lines[index]:
+            if player_mask & line_mask == line_mask:
+                self.win_info = info
+                return True
         return False
 
     def get_available_moves(self) -> List[Tuple[int, int]]:
         """Retorna una lista de tuplas (fila, col) para las casillas vacías."""
         moves: List[Tuple[int, int]] = []
-        for row in range(BOARD_ROWS):
-            for col in range(BOARD_COLS):
-                if self.board[row][col] == 0:
-                    moves.append((row, col))
+        free = self.full_mask & ~(self.masks[0] | self.masks[1])
+        cols = self.cols
+        while free:
+            low = free & -free
+            index = low.bit_length() - 1
+            moves.append((index // cols, index % cols))
+            free ^= low
         return moves
@@ -0,0 +1,19 @@
+"""
+Atlas de sprites generados bajo demanda.
+
+El grafo de decisiones dibuja decenas de mini tableros, pero son pocos distintos:
+un tablero de 3x3 tiene a lo sumo 3^9 estados y el panel usa un par de tamaños.
+Cada sprite se pinta la primera vez que se pide (get(clave, pintar)) y luego solo
+se copia con blit.
+"""
+
+import pygame
+
+from src.gui.lru import LRUCache
+
+
+class SpriteAtlas(LRUCache[pygame.Surface]):
+    """max_sprites: superficies guardadas antes de desalojar la menos usada."""
+
+    def __init__(self, max_sprites: int = 2048):
+        super().__init__(max_sprites)
@@ -0,0 +1,326 @@
+"""
+Render por lotes, sin pantalla, de posiciones con su grafo de decisiones.
+
+Cada posición se busca con el motor elegido (el mismo árbol de get_focused_tree
+que muestra la ventana) y se dibuja con el Renderer del juego sobre una superficie
+fuera de pantalla, con el controlador de video "dummy" de SDL: funciona en
+servidores sin display. Por cada posición se escribe un PNG y una fila en
+manifest.csv; opcionalmente se arman hojas de contactos con miniaturas. Con
+--workers > 1 las posiciones se reparten entre procesos, cada uno con su Renderer
+(y sus cachés) y su tabla de transposición.
+
+Las posiciones se leen de un archivo (o de la entrada estándar con "-"), una por
+línea como jugadas "fila,col" separadas por espacios ("." es el tablero vacío y
+"#" comenta), o se generan todas las que tienen cierta cantidad de fichas.
+
+Uso: python -m src.gui.headless --plies 2 3 --canonical --sheet --workers 4
+"""
+
+import argparse
+import csv
+import os
+import struct
+import sys
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from src.ai.lookup import find_best_move_lookup_and_viz
+from src.ai.minimax import find_best_move_and_viz
+from src.ai.negamax import minimax_pvs
+from src.ai.transposition import TranspositionTable, canonical_key
+from src.config import HEIGHT, WIDTH
+from src.game_logic.board import Board
+from src.gui.renderer import Renderer
+
+ENGINES = ("alpha_beta", "minimax", "pvs", "lookup")
+DEFAULT_OUTPUT_DIR = Path("renders")
+DEFAULT_THUMB_WIDTH = 275
+DEFAULT_SHEET_COLUMNS = 6
+DEFAULT_SHEET_ROWS = 8
+LABEL_HEIGHT = 18
+# pygame.image.save comprime los PNG con el nivel por defecto de libpng: en estas imágenes de colores
+# planos el nivel 1 de zlib es ~2.5 veces más rápido a cambio de archivos ~40% más grandes
+DEFAULT_COMPRESSION = 1
+
+Moves = Tuple[Tuple[int, int], ...]
+
+# Estado de cada proceso: Renderer, tabla de transposición y opciones (se crea una vez por proceso)
+_worker: Dict = {}
+
+
+def parse_moves(line: str) -> Moves:
+    """Convierte "1,1 0,0" en ((1, 1), (0, 0))."""
+    moves = tuple(tuple(int(value) for value in token.split(",")) for token in line.split())
+    for move in moves:
+        if len(move) != 2:
+            raise ValueError(f"Jugada mal formada: {','.join(map(str, move))}")
+    return moves
+
+
+def format_moves(moves: Moves) -> str:
+    return " ".join(f"{row},{col}" for row, col in moves)
+
+
+def play_moves(moves: Moves) -> Board:
+    """Tablero tras jugar `moves`; ValueError si una jugada está fuera del tablero, repite casilla o sigue al final."""
+    board = Board()
+    for row, col in moves:
+        if not board.push((row, col)):
+            raise ValueError(f"Jugada ilegal {row},{col} en la secuencia {format_moves(moves)}")
+    return board
+
+
+def read_positions(lines: Iterable[str]) -> Iterator[Moves]:
+    """Posiciones del archivo; ValueError con el número de línea si alguna no se puede jugar."""
+    for number, line in enumerate(lines, start=1):
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        try:
+            moves = () if line == "." else parse_moves(line)
+            play_moves(moves)
+        except ValueError as error:
+            raise ValueError(f"Línea {number}: {error}") from None
+        yield moves
+
+
+def positions_with_pieces(pieces: Iterable[int], canonical: bool = False) -> Iterator[Moves]:
+    """
+    Una secuencia de jugadas por cada posición distinta con esa cantidad de fichas
+    (incluidas las terminales). canonical: una sola por clase de simetría.
+    """
+    wanted = set(pieces)
+    seen = set()
+    board = Board()
+
+    def visit(moves: Moves):
+        key = canonical_key(board)[0] if canonical else tuple(board.masks)
+        if key in seen:
+            return
+        seen.add(key)
+        if len(moves) in wanted:
+            yield moves
+        if board.game_over or len(moves) >= max(wanted):
+            return
+        for move in board.get_available_moves():
+            board.push(move)
+            yield from visit(moves + (move,))
+            board.pop()
+
+    yield from visit(())
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+def save_png(surface: pygame.Surface, path: Path, compression: int = DEFAULT_COMPRESSION):
+    """Guarda la superficie como PNG RGB de 8 bits (sin filtros) con el nivel de compresión de zlib dado."""
+    width, height = surface.get_size()
+    pixels = pygame.image.tobytes(surface, "RGB")
+    stride = width * 3
+    # Cada fila va precedida del tipo de filtro (0 = ninguno)
+    scanlines = b"".join(b"\x00" + pixels[start : start + stride] for start in range(0, len(pixels), stride))
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    with open(path, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(_png_chunk(b"IHDR", header))
+        f.write(_png_chunk(b"IDAT", zlib.compress(scanlines, compression)))
+        f.write(_png_chunk(b"IEND", b""))
+
+
+def _init_worker(engine: str, output_dir: Optional[str], thumb_width: Optional[int], compression: int):
+    _worker.update(
+        renderer=Renderer(pygame.Surface((WIDTH, HEIGHT))),
+        table=TranspositionTable(),
+        engine=engine,
+        output_dir=Path(output_dir) if output_dir else None,
+        thumb_width=thumb_width,
+        compression=compression,
+    )
+
+
+def _search(board: Board):
+    engine, table = _worker["engine"], _worker["table"]
+    if engine == "lookup":
+        return find_best_move_lookup_and_viz(board)
+    if engine == "minimax":
+        return find_best_move_and_viz(board, use_alpha_beta=False)
+    scoring_function = minimax_pvs if engine == "pvs" else None
+    return find_best_move_and_viz(board, use_alpha_beta=True, table=table, scoring_function=scoring_function)
+
+
+def render_position(task: Tuple[int, Moves]) -> dict:
+    """
+    Trabajo de un proceso: busca la posición, la dibuja y guarda el PNG.
+    Retorna la fila del manifiesto y, si se piden hojas de contactos, la miniatura en bytes RGB.
+    """
+    index, moves = task
+    board = play_moves(moves)
+    best_move, tree = _search(board)
+
+    renderer = _worker["renderer"]
+    renderer.draw_game_screen(board, tree, "IA")
+
+    row = {
+        "index": index,
+        "moves": format_moves(moves),
+        "best_move": "" if best_move is None else f"{best_move[0]},{best_move[1]}",
+        "score": tree["score"] if tree else "",
+        "file": "",
+    }
+    output_dir = _worker["output_dir"]
+    if output_dir is not None:
+        filename = f"position_{index:05d}.png"
+        save_png(renderer.screen, output_dir / filename, _worker["compression"])
+        row["file"] = filename
+
+    thumb_width = _worker["thumb_width"]
+    if thumb_width:
+        size = (thumb_width, thumb_width * HEIGHT // WIDTH)
+        thumbnail = pygame.transform.smoothscale(renderer.screen, size)
+        row["thumbnail"] = (size, pygame.image.tobytes(thumbnail, "RGB"))
+    return row
+
+
+def render_positions(
+    positions: Iterable[Moves],
+    engine: str = "alpha_beta",
+    output_dir: Optional[Path] = None,
+    thumb_width: Optional[int] = None,
+    workers: int = 1,
+    compression: int = DEFAULT_COMPRESSION,
+) -> Iterator[dict]:
+    """Dibuja las posiciones (en este proceso o repartidas entre `workers`) y entrega sus filas en orden."""
+    tasks = enumerate(positions)
+    init_args = (engine, str(output_dir) if output_dir else None, thumb_width, compression)
+    if workers <= 1:
+        _init_worker(*init_args)
+        for task in tasks:
+            yield render_position(task)
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=init_args) as pool:
+        yield from pool.map(render_position, tasks, chunksize=16)
+
+
+class ContactSheet:
+    """Hojas de contactos: miniaturas en una grilla con su número de posición, paginadas por `rows`."""
+
+    def __init__(
+        self,
+        output_dir: Path,
+        columns: int = DEFAULT_SHEET_COLUMNS,
+        rows: int = DEFAULT_SHEET_ROWS,
+        compression: int = DEFAULT_COMPRESSION,
+    ):
+        self.output_dir = output_dir
+        self.columns = columns
+        self.rows = rows
+        self.compression = compression
+        self.font = pygame.font.Font(None, LABEL_HEIGHT + 2)
+        self.cells: List[Tuple[str, pygame.Surface]] = []
+        self.pages = 0
+
+    def add(self, label: str, thumbnail: pygame.Surface):
+        self.cells.append((label, thumbnail))
+        if len(self.cells) == self.columns * self.rows:
+            self.flush()
+
+    def flush(self):
+        if not self.cells:
+            return
+        cell_width, thumb_height = self.cells[0][1].get_size()
+        cell_height = thumb_height + LABEL_HEIGHT
+        used_rows = -(-len(self.cells) // self.columns)
+        sheet = pygame.Surface((self.columns * cell_width, used_rows * cell_height))
+        sheet.fill((20, 20, 28))
+        for i, (label, thumbnail) in enumerate(self.cells):
+            x, y = (i % self.columns) * cell_width, (i // self.columns) * cell_height
+            sheet.blit(thumbnail, (x, y))
+            sheet.blit(self.font.render(label, True, (220, 220, 220)), (x + 4, y + thumb_height + 2))
+        self.pages += 1
+        save_png(sheet, self.output_dir / f"contact_sheet_{self.pages:03d}.png", self.compression)
+        self.cells = []
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Dibuja sin pantalla posiciones con su grafo de decisiones.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--positions", help='Archivo con una posición por línea ("fila,col ..."), o "-" para stdin.')
+    source.add_argument("--plies", type=int, nargs="+", help="Todas las posiciones con esa cantidad de fichas.")
+    parser.add_argument("--canonical", action="store_true", help="Con --plies, una posición por clase de simetría.")
+    parser.add_argument("--engine", choices=ENGINES, default="alpha_beta", help="Motor que arma el árbol.")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT_DIR, help="Directorio de salida.")
+    parser.add_argument("--no-frames", action="store_true", help="No guarda un PNG por posición.")
+    parser.add_argument("--sheet", action="store_true", help="Arma hojas de contactos con miniaturas.")
+    parser.add_argument("--thumb-width", type=int, default=DEFAULT_THUMB_WIDTH, help="Ancho de cada miniatura.")
+    parser.add_argument("--sheet-columns", type=int, default=DEFAULT_SHEET_COLUMNS, help="Miniaturas por fila.")
+    parser.add_argument("--sheet-rows", type=int, default=DEFAULT_SHEET_ROWS, help="Filas por hoja.")
+    parser.add_argument(
+        "--compression",
+        type=int,
+        choices=range(10),
+        default=DEFAULT_COMPRESSION,
+        metavar="0-9",
+        help="Nivel de zlib de los PNG.",
+    )
+    parser.add_argument("--workers", type=int, default=1, help="Procesos en paralelo (1 = en serie).")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    if args.no_frames and not args.sheet:
+        print("Nada que generar: --no-frames sin --sheet.")
+        return 1
+
+    if args.plies:
+        positions = positions_with_pieces(args.plies, args.canonical)
+    else:
+        lines = sys.stdin if args.positions == "-" else Path(args.positions).read_text().splitlines()
+        try:
+            positions = list(read_positions(lines))  # Se valida todo antes de empezar a dibujar
+        except ValueError as error:
+            print(f"Posiciones inválidas: {error}")
+            return 1
+
+    args.output.mkdir(parents=True, exist_ok=True)
+    pygame.font.init()
+    sheet = ContactSheet(args.output, args.sheet_columns, args.sheet_rows, args.compression) if args.sheet else None
+    rows = render_positions(
+        positions,
+        args.engine,
+        None if args.no_frames else args.output,
+        args.thumb_width if args.sheet else None,
+        args.workers,
+        args.compression,
+    )
+
+    rendered = 0
+    with open(args.output / "manifest.csv", "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["index", "moves", "best_move", "score", "file"], extrasaction="ignore")
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            if sheet is not None:
+                size, data = row["thumbnail"]
+                sheet.add(f"#{row['index']}  {row['moves']}", pygame.image.frombytes(data, size, "RGB"))
+            rendered += 1
+            if rendered % 100 == 0:
+                print(f"{rendered} posiciones dibujadas...")
+    if sheet is not None:
+        sheet.flush()
+
+    pages = f" y {sheet.pages} hoja(s) de contactos" if sheet is not None else ""
+    print(f"{rendered} posiciones dibujadas en '{args.output}'{pages}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,47 @@
+"""
+Caché acotado con desalojo LRU para los recursos del Renderer (fuentes, texto, sprites).
+
+Crear el recurso es lo caro (rasterizar una fuente o pintar un mini tablero); el caché
+lo guarda la primera vez que se pide y, al llenarse, desaloja el menos usado.
+"""
+
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Iterator, TypeVar
+
+Value = TypeVar("Value")
+
+
+class LRUCache(Generic[Value]):
+    """max_size: entradas guardadas antes de desalojar la menos usada."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.entries: "OrderedDict[Hashable, Value]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """Claves de la menos a la más usada."""
+        return iter(self.entries)
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, create: Callable[[], Value]) -> Value:
+        """Valor de la clave; si no está, lo crea con create(). El valor es compartido: no modificarlo."""
+        value = self.entries.get(key)
+        if value is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return value
+
+        self.misses += 1
+        if len(self.entries) >= self.max_size:
+            self.entries.popitem(last=False)
+        value = self.entries[key] = create()
+        return value
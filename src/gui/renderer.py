@@ -1,15 +1,45 @@
-from typing import List
+from contextlib import contextmanager
+from typing import List, Optional, Tuple
 
 import pygame
 
-from src.config import *
+from src.config import (
+    BG_COLOR,
+    BOARD_COLS,
+    BOARD_OFFSET_X,
+    BOARD_OFFSET_Y,
+    BOARD_ROWS,
+    BOARD_WIDTH,
+    CIRCLE_COLOR,
+    CIRCLE_RADIUS,
+    CIRCLE_WIDTH,
+    CROSS_COLOR,
+    CROSS_WIDTH,
+    FONT_COLOR,
+    FONT_SIZE,
+    HEIGHT,
+    LINE_COLOR,
+    LINE_WIDTH,
+    MENU_SELECTED_COLOR,
+    SQUARE_HOVER_COLOR,
+    SQUARE_SIZE,
+    WIDTH,
+    WIN_LINE_COLOR,
+)
+from src.gui.atlas import SpriteAtlas
+from src.gui.text_cache import TextCache
+
+MINI_BOARD_PADDING = 2  # Margen del sprite de mini tablero para el marco de resaltado
+# Puntajes estimados por la evaluación en el horizonte (búsqueda cortada por tiempo), no demostrados
+HEURISTIC_COLOR = (130, 170, 230)
 
 
 class Renderer:
     def __init__(self, screen: pygame.Surface) -> None:
         self.screen: pygame.Surface = screen
-        self.font: pygame.font.Font = pygame.font.Font(None, 45)
-        self.menu_font: pygame.font.Font = pygame.font.Font(None, MENU_FONT_SIZE)
+        # Fuentes y textos se rasterizan una vez y se reutilizan entre cuadros
+        self.text = TextCache()
+        self.mini_boards = SpriteAtlas()
 
         # Offsets Dinámicos
         self.board_offset_x = BOARD_OFFSET_X
@@ -17,6 +47,14 @@ class Renderer:
 
         self.inverted_symbols = False
 
+        # Modo retenido: lo que solo cambia con el tablero o el grafo se dibuja en una superficie
+        # fuera de pantalla y cada cuadro repone únicamente lo que tapaban las capas dinámicas
+        self.background = pygame.Surface(screen.get_size(), 0, screen)
+        self._scene_key = None
+        self._graph_source = None
+        self._overlay_key = None
+        self._overlay_rects: List[pygame.Rect] = []
+
     def set_inverted(self, inverted: bool):
         """Si es True, Jugador 1 dibuja O (Círculo) y Jugador 2 dibuja X (Cruz)."""
         self.inverted_symbols = inverted
@@ -28,25 +66,96 @@ class Renderer:
         else:
             self.board_offset_x = BOARD_OFFSET_X
 
+    def invalidate(self):
+        """Obliga a reconstruir la escena y a actualizar toda la ventana en el próximo cuadro."""
+        self._scene_key = None
+        self._overlay_key = None
+        self._overlay_rects = []
+
+    @contextmanager
+    def _drawing_on(self, surface: pygame.Surface):
+        """Redirige a otra superficie los métodos draw_*, que dibujan sobre self.screen."""
+        screen, self.screen = self.screen, surface
+        try:
+            yield
+        finally:
+            self.screen = screen
+
+    def draw_game_screen(
+        self,
+        board,
+        graph_data,
+        player_label: str,
+        ghost: Optional[Tuple[int, int]] = None,
+        step_prompt: bool = False,
+        thinking: Optional[dict] = None,
+    ) -> List[pygame.Rect]:
+        """
+        Dibuja la pantalla de juego en modo retenido y retorna los rectángulos de pantalla
+        que cambiaron (vacío si no cambió nada, así no hace falta actualizar la ventana).
+
+        La escena estática (tablero, símbolos, grafo, turno y fin de partida) se reconstruye
+        solo cuando cambian el tablero, graph_data o la disposición. Las capas dinámicas
+        (casilla fantasma bajo el mouse, aviso de ENTER o progreso de la búsqueda) se
+        redibujan solo cuando cambian, reponiendo el fondo bajo las del cuadro anterior.
+        """
+        scene_key = (*board.masks, board.turn, player_label, self.board_offset_x, self.inverted_symbols)
+        rebuild = scene_key != self._scene_key or graph_data is not self._graph_source
+        status = None if step_prompt or thinking is None else self._thinking_text(thinking)
+        overlay_key = (ghost, step_prompt, status)
+        if not rebuild and overlay_key == self._overlay_key:
+            return []
+
+        if rebuild:
+            with self._drawing_on(self.background):
+                self.draw_grid()
+                self.draw_symbols(board.board)
+                self.draw_decision_graph(graph_data)
+                self.draw_turn_indicator(board.turn, player_label)
+                if board.game_over:
+                    self.draw_win_line(board)
+                    self.draw_game_over_text(board)
+            # Se guarda la referencia (no solo el id) para que no se reutilice con otra lista
+            self._scene_key, self._graph_source = scene_key, graph_data
+            self.screen.blit(self.background, (0, 0))
+            dirty = [self.screen.get_rect()]
+        else:
+            dirty = self._overlay_rects
+            for rect in dirty:
+                self.screen.blit(self.background, rect, rect)
+
+        overlay_rects = []
+        if ghost is not None:
+            overlay_rects.append(self.draw_ghost_symbol(*ghost, board.turn))
+        if step_prompt:
+            overlay_rects.append(self.draw_step_prompt())
+        elif status is not None:
+            overlay_rects.append(self._draw_status_line(status, self.board_offset_x + BOARD_WIDTH // 2, FONT_COLOR))
+        self._overlay_key, self._overlay_rects = overlay_key, overlay_rects
+        return dirty if rebuild else dirty + overlay_rects
+
     def draw_menu(self, options: List[str], selected_option: int) -> List[pygame.Rect]:
+        self.invalidate()  # El menú tapa la escena de juego
         self.screen.fill(BG_COLOR)
 
         option_rects = []
 
         # Título con sombra
-        title_font = pygame.font.Font(None, 80)
-        title_text = title_font.render("Tres en Raya", True, (0, 0, 0))  # Sombra negra
+        title_text = self.text.render(80, "Tres en Raya", (0, 0, 0))  # Sombra negra
         title_rect = title_text.get_rect(center=(WIDTH // 2 + 4, HEIGHT // 4 + 4))
         self.screen.blit(title_text, title_rect)
 
-        title_text_main = title_font.render("Tres en Raya", True, FONT_COLOR)
+        title_text_main = self.text.render(80, "Tres en Raya", FONT_COLOR)
         title_rect_main = title_text_main.get_rect(center=(WIDTH // 2, HEIGHT // 4))
         self.screen.blit(title_text_main, title_rect_main)
 
-        # Opciones del menú
+        # Opciones del menú (el espaciado se reduce si no caben debajo del título)
+        spacing = FONT_SIZE + 35
+        if len(options) > 1:
+            spacing = min(spacing, (HEIGHT - HEIGHT // 2 - FONT_SIZE) // (len(options) - 1))
         for i, option in enumerate(options):
             center_x = WIDTH // 2
-            center_y = HEIGHT // 2 + i * (FONT_SIZE + 35)
+            center_y = HEIGHT // 2 + i * spacing
 
             # Texto base
             if i == selected_option:
@@ -56,7 +165,7 @@ class Renderer:
                 color = (180, 180, 180)
                 text_content = option
 
-            text = self.font.render(text_content, True, color)
+            text = self.text.render(45, text_content, color)
             rect = text.get_rect(center=(center_x, center_y))
 
             if i == selected_option:
@@ -92,13 +201,36 @@ class Renderer:
         else:
             text_str = f"Turno de la IA ({symbol_str})"
 
-        text = self.font.render(text_str, True, color_rgb)
+        text = self.text.render(45, text_str, color_rgb)
         center_x = self.board_offset_x + BOARD_WIDTH // 2
         text_rect = text.get_rect(center=(center_x, BOARD_OFFSET_Y // 2))
         self.screen.blit(text, text_rect)
 
-    def draw_ghost_symbol(self, row, col, turn):
-        """Dibuja un símbolo semitransparente (hover)."""
+    def _thinking_text(self, stats: dict) -> str:
+        """Progreso de la búsqueda (SearchContext.stats()) que draw_game_screen muestra debajo del tablero."""
+        dots = "." * (int(stats["elapsed"] * 3) % 4)
+        depth = f"  prof. {stats['depth']}" if stats["depth"] else ""
+        return (
+            f"IA pensando{dots:<3}  {stats['nodes']:,} nodos  {stats['nodes_per_second']:,.0f} n/s{depth}"
+            f"  ({stats['elapsed']:.1f}s)  ESC cancela"
+        )
+
+    def _draw_status_line(self, text: str, center_x: float, color) -> pygame.Rect:
+        """Línea de estado al pie de la ventana, sobre un fondo liso. Retorna el área que ocupa."""
+        # El texto puede cambiar en cada cuadro: se usa la fuente cacheada pero no se guarda la superficie
+        surface = self.text.font(30).render(text, True, color)
+        rect = surface.get_rect(center=(center_x, HEIGHT - 25))
+        background = rect.inflate(20, 10)
+        pygame.draw.rect(self.screen, BG_COLOR, background)
+        self.screen.blit(surface, rect)
+        return background
+
+    def draw_step_prompt(self) -> pygame.Rect:
+        """Aviso de IA vs IA: la siguiente jugada espera ENTER."""
+        return self._draw_status_line("Presione ENTER para siguiente jugada...", WIDTH // 3.25, CIRCLE_COLOR)
+
+    def draw_ghost_symbol(self, row, col, turn) -> pygame.Rect:
+        """Dibuja un símbolo semitransparente (hover). Retorna la casilla que ocupa."""
         col * SQUARE_SIZE + SQUARE_SIZE // 2 + self.board_offset_x
         row * SQUARE_SIZE + SQUARE_SIZE // 2 + BOARD_OFFSET_Y
 
@@ -139,7 +271,7 @@ class Renderer:
                 center = (SQUARE_SIZE // 2, SQUARE_SIZE // 2)
                 pygame.draw.circle(ghost_surf, color, center, radius, CIRCLE_WIDTH)
 
-        self.screen.blit(
+        return self.screen.blit(
             ghost_surf,
             (
                 col * SQUARE_SIZE + self.board_offset_x,
@@ -226,32 +358,20 @@ class Renderer:
         if not board.win_info:
             return
 
-        win_type, index = board.win_info
-
-        if win_type == "row":
-            y_pos = index * SQUARE_SIZE + SQUARE_SIZE // 2 + BOARD_OFFSET_Y
-            start_pos = (15 + self.board_offset_x, y_pos)
-            end_pos = (BOARD_WIDTH - 15 + self.board_offset_x, y_pos)
-        elif win_type == "col":
-            x_pos = index * SQUARE_SIZE + SQUARE_SIZE // 2 + self.board_offset_x
-            start_pos = (x_pos, 15 + BOARD_OFFSET_Y)
-            end_pos = (x_pos, (BOARD_ROWS * SQUARE_SIZE) - 15 + BOARD_OFFSET_Y)
-        elif win_type == "diag":
-            if index == 1:  # Descendente
-                start_pos = (15 + self.board_offset_x, 15 + BOARD_OFFSET_Y)
-                end_pos = (
-                    BOARD_WIDTH - 15 + self.board_offset_x,
-                    (BOARD_ROWS * SQUARE_SIZE) - 15 + BOARD_OFFSET_Y,
-                )
-            else:  # Ascendente
-                start_pos = (
-                    15 + self.board_offset_x,
-                    (BOARD_ROWS * SQUARE_SIZE) - 15 + BOARD_OFFSET_Y,
-                )
-                end_pos = (
-                    BOARD_WIDTH - 15 + self.board_offset_x,
-                    15 + BOARD_OFFSET_Y,
-                )
+        (start_row, start_col), (end_row, end_col) = board.win_info
+
+        # La línea va de centro a centro y se extiende hasta 15px del borde de las casillas extremas
+        step_x = (end_col > start_col) - (end_col < start_col)
+        step_y = (end_row > start_row) - (end_row < start_row)
+        extension = SQUARE_SIZE // 2 - 15
+        start_pos = (
+            start_col * SQUARE_SIZE + SQUARE_SIZE // 2 + self.board_offset_x - step_x * extension,
+            start_row * SQUARE_SIZE + SQUARE_SIZE // 2 + BOARD_OFFSET_Y - step_y * extension,
+        )
+        end_pos = (
+            end_col * SQUARE_SIZE + SQUARE_SIZE // 2 + self.board_offset_x + step_x * extension,
+            end_row * SQUARE_SIZE + SQUARE_SIZE // 2 + BOARD_OFFSET_Y + step_y * extension,
+        )
 
         # Efecto Neon Glow
         glow_colors = [
@@ -277,10 +397,10 @@ class Renderer:
         else:
             text = f"¡Jugador {board.winner} gana!"
 
-        rendered_text = self.font.render(text, True, FONT_COLOR)
+        rendered_text = self.text.render(45, text, FONT_COLOR)
         text_rect = rendered_text.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 50))
 
-        restart_text = self.font.render("Pulsa 'R' para reiniciar", True, FONT_COLOR)
+        restart_text = self.text.render(45, "Pulsa 'R' para reiniciar", FONT_COLOR)
         restart_rect = restart_text.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 50))
 
         # Fondo semi-transparente para el texto
@@ -291,52 +411,72 @@ class Renderer:
         self.screen.blit(rendered_text, text_rect)
         self.screen.blit(restart_text, restart_rect)
 
-    def draw_mini_board(self, x, y, size, board_state):
-        """Dibuja un mini tablero en la posición (x, y)."""
-        # Fondo del mini tablero
-        rect = pygame.Rect(x, y, size, size)
-        pygame.draw.rect(self.screen, (255, 255, 255), rect)
-        pygame.draw.rect(self.screen, LINE_COLOR, rect, 2)
-
-        cell_size = size // 3
-
-        # Líneas
-        for i in range(1, 3):
-            pygame.draw.line(
-                self.screen,
-                (0, 0, 0),
-                (x, y + i * cell_size),
-                (x + size, y + i * cell_size),
-                1,
-            )
-            pygame.draw.line(
-                self.screen,
-                (0, 0, 0),
-                (x + i * cell_size, y),
-                (x + i * cell_size, y + size),
-                1,
-            )
+    def draw_mini_board(self, x, y, size, board_state, highlight=None):
+        """
+        Dibuja un mini tablero en la posición (x, y) copiándolo del atlas de sprites.
+        highlight: (color, grosor) de un marco alrededor del tablero, o None.
+        """
+        key = (tuple(map(tuple, board_state)), size, self.inverted_symbols, highlight)
+        sprite = self.mini_boards.get(key, lambda: self._paint_mini_board(size, board_state, highlight))
+        self.screen.blit(sprite, (int(x) - MINI_BOARD_PADDING, int(y) - MINI_BOARD_PADDING))
+
+    def _paint_mini_board(self, size, board_state, highlight):
+        """Sprite transparente con el tablero desplazado MINI_BOARD_PADDING píxeles y el marco alrededor."""
+        sprite = pygame.Surface((size + 2 * MINI_BOARD_PADDING, size + 2 * MINI_BOARD_PADDING), pygame.SRCALPHA)
+        x = y = MINI_BOARD_PADDING
+        with self._drawing_on(sprite):
+            # Fondo del mini tablero
+            rect = pygame.Rect(x, y, size, size)
+            pygame.draw.rect(self.screen, (255, 255, 255), rect)
+            pygame.draw.rect(self.screen, LINE_COLOR, rect, 2)
+
+            rows = len(board_state)
+            cols = len(board_state[0])
+            cell_size = max(1, size // max(rows, cols))
+
+            # Líneas
+            for i in range(1, rows):
+                pygame.draw.line(
+                    self.screen,
+                    (0, 0, 0),
+                    (x, y + i * cell_size),
+                    (x + size, y + i * cell_size),
+                    1,
+                )
+            for i in range(1, cols):
+                pygame.draw.line(
+                    self.screen,
+                    (0, 0, 0),
+                    (x + i * cell_size, y),
+                    (x + i * cell_size, y + size),
+                    1,
+                )
 
-        # Símbolos
-        font_mini = pygame.font.Font(None, int(cell_size * 1.5))
-        for r in range(3):
-            for c in range(3):
-                val = board_state[r][c]
-                if val != 0:
-                    if self.inverted_symbols:
-                        symbol = "O" if val == 1 else "X"
-                    else:
-                        symbol = "X" if val == 1 else "O"
-
-                    color = (0, 0, 0)
-                    text = font_mini.render(symbol, True, color)
-                    text_rect = text.get_rect(
-                        center=(
-                            x + c * cell_size + cell_size // 2,
-                            y + r * cell_size + cell_size // 2,
+            # Símbolos
+            font_size = max(6, int(cell_size * 1.5))
+            for r in range(rows):
+                for c in range(cols):
+                    val = board_state[r][c]
+                    if val != 0:
+                        if self.inverted_symbols:
+                            symbol = "O" if val == 1 else "X"
+                        else:
+                            symbol = "X" if val == 1 else "O"
+
+                        text = self.text.render(font_size, symbol, (0, 0, 0))
+                        text_rect = text.get_rect(
+                            center=(
+                                x + c * cell_size + cell_size // 2,
+                                y + r * cell_size + cell_size // 2,
+                            )
                         )
-                    )
-                    self.screen.blit(text, text_rect)
+                        self.screen.blit(text, text_rect)
+
+            if highlight is not None:
+                color, width = highlight
+                frame = pygame.Rect(x - width, y - width, size + 2 * width, size + 2 * width)
+                pygame.draw.rect(self.screen, color, frame, width)
+        return sprite
 
     def _get_tree_depth(self, node):
         """Calcula la profundidad máxima visual del árbol actual."""
@@ -357,13 +497,14 @@ class Renderer:
 
     def draw_legend(self, center_x, y):
         """Dibuja una pequeña leyenda explicando los colores."""
-        font = pygame.font.Font(None, 20)
+        font = self.text.font(20)
 
         items = [
             ("Ganar", (0, 255, 0)),
             ("Empate", (200, 200, 200)),
             ("Perder", (255, 0, 0)),
             ("Ruta Elegida", (255, 255, 0)),
+            ("Aprox.", HEURISTIC_COLOR),
         ]
 
         total_width = 0
@@ -379,7 +520,7 @@ class Renderer:
         for (text, color), w in zip(items, spacings):
             pygame.draw.rect(self.screen, color, (current_x, y, 10, 10))
 
-            txt_surf = font.render(text, True, (220, 220, 220))
+            txt_surf = self.text.render(20, text, (220, 220, 220))
             self.screen.blit(txt_surf, (current_x + 15, y - 2))
 
             current_x += w + 20
@@ -408,13 +549,11 @@ class Renderer:
         )
 
         if not root_node:
-            font = pygame.font.Font(None, 30)
-            text = font.render("Esperando turno de IA...", True, (100, 100, 100))
+            text = self.text.render(30, "Esperando turno de IA...", (100, 100, 100))
             self.screen.blit(text, text.get_rect(center=(panel_center_x, HEIGHT // 2)))
             return
 
-        font_title = pygame.font.Font(None, 36)
-        title_surf = font_title.render("Grafo Explorado", True, (255, 255, 255))
+        title_surf = self.text.render(36, "Grafo Explorado", (255, 255, 255))
         title_rect = title_surf.get_rect(center=(panel_center_x, 30))
         self.screen.blit(title_surf, title_rect)
 
@@ -496,7 +635,11 @@ class Renderer:
             current_x = start_x + (i * gap)
 
             score = child["score"]
-            if score > 0:
+            # Las búsquedas exactas puntúan con enteros (-1, 0, 1); las evaluaciones estáticas, con floats
+            proven = isinstance(score, int)
+            if not proven:
+                color = HEURISTIC_COLOR
+            elif score > 0:
                 color = (0, 255, 0)
             elif score < 0:
                 color = (255, 0, 0)
@@ -524,28 +667,12 @@ class Renderer:
                 y - (mini_size // 2),
                 mini_size,
                 child["board_matrix"],
+                highlight=((255, 255, 0), 2) if is_chosen else (color, 1),
             )
 
-            if is_chosen:
-                rect = pygame.Rect(
-                    current_x - (mini_size // 2) - 2,
-                    y - (mini_size // 2) - 2,
-                    mini_size + 4,
-                    mini_size + 4,
-                )
-                pygame.draw.rect(self.screen, (255, 255, 0), rect, 2)
-            else:
-                rect = pygame.Rect(
-                    current_x - (mini_size // 2) - 1,
-                    y - (mini_size // 2) - 1,
-                    mini_size + 2,
-                    mini_size + 2,
-                )
-                pygame.draw.rect(self.screen, color, rect, 1)
-
             if is_chosen or gap > 35:
-                font = pygame.font.Font(None, 18)
-                score_txt = font.render(str(score), True, (255, 255, 255) if is_chosen else color)
+                label = str(score) if proven else f"({score:+.2f})"
+                score_txt = self.text.render(18, label, (255, 255, 255) if is_chosen else color)
                 txt_rect = score_txt.get_rect(center=(current_x, y + (mini_size // 2) + 12))
                 self.screen.blit(score_txt, txt_rect)
 
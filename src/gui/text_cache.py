@@ -0,0 +1,58 @@
+"""
+Caché de fuentes y de superficies de texto para el Renderer.
+
+Crear un pygame.font.Font lee y rasteriza la fuente, y font.render rasteriza
+cada cadena: hacerlo en cada cuadro (el panel del grafo dibuja decenas de mini
+tableros a 60 FPS) le quita CPU a la búsqueda. Las superficies se guardan por
+(tamaño, texto, color) y las fuentes por tamaño, cada una en un LRUCache acotado.
+"""
+
+from typing import Tuple
+
+import pygame
+
+from src.gui.lru import LRUCache
+
+Color = Tuple[int, int, int]
+
+
+class TextCache:
+    """
+    max_surfaces: superficies de texto guardadas antes de desalojar la menos usada.
+    max_fonts: fuentes (una por tamaño) guardadas antes de desalojar la menos usada.
+    """
+
+    def __init__(self, max_surfaces: int = 512, max_fonts: int = 32):
+        self.surfaces: LRUCache[pygame.Surface] = LRUCache(max_surfaces)
+        self.fonts: LRUCache[pygame.font.Font] = LRUCache(max_fonts)
+
+    def __len__(self) -> int:
+        return len(self.surfaces)
+
+    @property
+    def hits(self) -> int:
+        return self.surfaces.hits
+
+    @property
+    def misses(self) -> int:
+        return self.surfaces.misses
+
+    def clear(self):
+        self.surfaces.clear()
+        self.fonts.clear()
+
+    def font(self, size: int) -> pygame.font.Font:
+        """Fuente por defecto de pygame en el tamaño pedido."""
+        return self.fonts.get(size, lambda: self._load_font(size))
+
+    def _load_font(self, size: int) -> pygame.font.Font:
+        if not pygame.font.get_init():
+            pygame.font.init()  # A demanda: quien use el Renderer no necesita inicializar las fuentes
+        return pygame.font.Font(None, size)
+
+    def render(self, size: int, text: str, color: Color) -> pygame.Surface:
+        """
+        Superficie (con antialias) del texto. La superficie es compartida:
+        se puede dibujar con blit pero no modificar.
+        """
+        return self.surfaces.get((size, text, tuple(color)), lambda: self.font(size).render(text, True, color))
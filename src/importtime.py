@@ -0,0 +1,130 @@
+"""
+Reporte del tiempo de arranque en frío (estilo `python -X importtime`).
+
+Cada módulo se importa en un proceso nuevo con -X importtime; de `repeat` corridas
+se toma la de menor tiempo total (como el banco de pruebas toma el mejor tiempo)
+y se listan los módulos más caros por tiempo acumulado. Además se mide el tiempo
+de pared del proceso completo (intérprete + imports), que es lo que ve el usuario.
+Con --history se agrega una línea JSON por módulo para seguir la evolución.
+
+Uso: python -m src.importtime [módulos ...] [--repeat N] [--top N] [--history archivo.jsonl]
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+# El juego se importa como paquete (src.main) y la simulación como script desde src/ (simulate)
+DEFAULT_MODULES = ("src.main", "simulate")
+DEFAULT_REPEAT = 5
+DEFAULT_TOP = 15
+
+# (nombre, propio µs, acumulado µs, nivel de anidamiento)
+ImportRow = Tuple[str, int, int, int]
+
+
+def parse_importtime(output: str) -> List[ImportRow]:
+    """Filas de la salida de -X importtime (stderr), en el orden en que terminó cada import."""
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # Encabezado
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), int(fields[0]), int(fields[1]), depth))
+    return rows
+
+
+def _run(module: str) -> Tuple[float, List[ImportRow]]:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(ROOT), str(ROOT / "src")]))
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    elapsed = time.perf_counter() - start
+    if completed.returncode != 0:
+        raise RuntimeError(f"No se pudo importar {module}:\n{completed.stderr[-2000:]}")
+    return elapsed, parse_importtime(completed.stderr)
+
+
+def measure(module: str, repeat: int = DEFAULT_REPEAT) -> dict:
+    """Mide el arranque en frío de `module` (la mejor de `repeat` corridas)."""
+    best = None
+    best_process = float("inf")
+    for _ in range(max(1, repeat)):
+        elapsed, rows = _run(module)
+        best_process = min(best_process, elapsed)
+        total = sum(row[1] for row in rows)
+        if best is None or total < best[0]:
+            best = (total, rows)
+    total, rows = best
+    return {
+        "module": module,
+        "import_ms": total / 1000,
+        "process_ms": best_process * 1000,
+        "modules": len(rows),
+        "rows": rows,
+    }
+
+
+def format_report(result: dict, top: int = DEFAULT_TOP) -> str:
+    lines = [
+        f"{result['module']}: {result['import_ms']:.1f} ms en imports ({result['modules']} módulos), "
+        f"{result['process_ms']:.1f} ms el proceso completo",
+        f"{'acum. ms':>9} {'propio ms':>10}  módulo",
+    ]
+    for name, self_us, cumulative_us, depth in sorted(result["rows"], key=lambda row: -row[2])[:top]:
+        lines.append(f"{cumulative_us / 1000:>9.1f} {self_us / 1000:>10.1f}  {'  ' * depth}{name}")
+    return "\n".join(lines)
+
+
+def append_history(results: List[dict], path: Path):
+    stamp = time.strftime("%Y-%m-%dT%H:%M:%S")
+    with open(path, "a") as f:
+        for result in results:
+            entry: Dict = {
+                "date": stamp,
+                "python": platform.python_version(),
+                "module": result["module"],
+                "import_ms": round(result["import_ms"], 1),
+                "process_ms": round(result["process_ms"], 1),
+                "modules": result["modules"],
+            }
+            f.write(json.dumps(entry) + "\n")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Tiempo de arranque en frío por módulo (-X importtime).")
+    parser.add_argument("modules", nargs="*", default=list(DEFAULT_MODULES), help="Módulos a importar.")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Corridas por módulo (se toma la mejor).")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP, help="Módulos a listar por tiempo acumulado.")
+    parser.add_argument("--history", type=Path, help="Agrega los totales a este archivo JSONL.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    results = [measure(module, args.repeat) for module in args.modules]
+    print("\n\n".join(format_report(result, args.top) for result in results))
+    if args.history:
+        append_history(results, args.history)
+        print(f"\nTotales agregados a '{args.history}'.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,198 @@
+"""
+Modo de instrumentación para ver a dónde se va el tiempo de una corrida.
+
+Apagado no cuesta nada: no hay ganchos ni condiciones en el código caliente.
+Al activarlo se envuelven en el lugar los métodos del tablero (llamadas y tiempo
+inclusivo en ns) y las funciones de búsqueda (nodos expandidos por profundidad),
+y la corrida se perfila con cProfile (volcado .pstats) o con un trazador que
+escribe pilas colapsadas (formato de flamegraph.pl / speedscope: "a;b;c µs").
+Al salir se restauran los originales y se escriben los archivos.
+
+Se activa con la variable de entorno TTT_PROFILE=<directorio> (y opcionalmente
+TTT_PROFILE_FORMAT=pstats|collapsed) o con `--profile` en simulate.py.
+"""
+
+import cProfile
+import json
+import os
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+ENV_VAR = "TTT_PROFILE"
+FORMAT_ENV_VAR = "TTT_PROFILE_FORMAT"
+FORMATS = ("pstats", "collapsed")
+
+BOARD_METHODS = ("make_move", "push", "pop", "copy", "check_win", "check_win_at", "get_available_moves")
+# (módulo, función) de búsqueda cuyo segundo argumento es la profundidad desde la raíz. Se reemplaza
+# el atributo del módulo, así que cuentan las llamadas recursivas y las de ese módulo; una raíz llamada
+# desde otro módulo que importó la función por nombre (p. ej. iterative) no se cuenta
+SEARCH_FUNCTIONS = (
+    ("ai.minimax", "minimax_bruteforce"),
+    ("ai.minimax", "minimax_alpha_beta"),
+    ("ai.negamax", "negamax"),
+    ("ai.lookup", "minimax_lookup"),
+)
+
+
+def _loaded_modules(name: str) -> Iterator:
+    """El módulo tal como lo importa el paquete (src.x) y como lo importa simulate.py (x), si están cargados."""
+    for qualified in ("src." + name, name):
+        module = sys.modules.get(qualified)
+        if module is not None:
+            yield module
+
+
+class Instrumentation:
+    """Contadores y temporizadores que se instalan envolviendo funciones existentes."""
+
+    def __init__(self):
+        self.calls: Counter = Counter()
+        self.time_ns: Counter = Counter()
+        self.nodes_by_depth: Counter = Counter()
+        self._originals: List[Tuple[object, str, object]] = []
+
+    def _patch(self, owner, attribute: str, wrapper):
+        self._originals.append((owner, attribute, getattr(owner, attribute)))
+        setattr(owner, attribute, wrapper)
+
+    def _timed(self, name: str, func):
+        calls, time_ns, clock = self.calls, self.time_ns, time.perf_counter_ns
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                time_ns[name] += clock() - start
+                calls[name] += 1
+
+        return wrapper
+
+    def _per_depth(self, func):
+        nodes_by_depth = self.nodes_by_depth
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            nodes_by_depth[args[1] if len(args) > 1 else kwargs["depth"]] += 1
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    def install(self):
+        for module in _loaded_modules("game_logic.board"):
+            for method in BOARD_METHODS:
+                self._patch(module.Board, method, self._timed(f"Board.{method}", getattr(module.Board, method)))
+        for module_name, function in SEARCH_FUNCTIONS:
+            for module in _loaded_modules(module_name):
+                self._patch(module, function, self._per_depth(getattr(module, function)))
+
+    def uninstall(self):
+        while self._originals:
+            owner, attribute, original = self._originals.pop()
+            setattr(owner, attribute, original)
+
+    def report(self) -> Dict:
+        return {
+            "calls": dict(self.calls),
+            "time_ns": dict(self.time_ns),
+            "nodes_by_depth": {str(depth): n for depth, n in sorted(self.nodes_by_depth.items())},
+        }
+
+    def format_report(self) -> str:
+        lines = [f"{'función':<28} {'llamadas':>12} {'ms (incl.)':>12} {'ns/llamada':>11}"]
+        for name, calls in self.calls.most_common():
+            total = self.time_ns[name]
+            lines.append(f"{name:<28} {calls:>12} {total / 1e6:>12.1f} {total / calls:>11.0f}")
+        if self.nodes_by_depth:
+            lines.append(
+                "\nnodos por profundidad: " + ", ".join(f"{d}:{n}" for d, n in sorted(self.nodes_by_depth.items()))
+            )
+        return "\n".join(lines)
+
+
+class CollapsedStackProfiler:
+    """
+    Trazador determinista (sys.setprofile) que acumula tiempo propio por pila de llamadas.
+    write() produce una línea "módulo:función;...;módulo:función microsegundos" por pila.
+    """
+
+    def __init__(self):
+        self.totals: Counter = Counter()
+        self._stack: List[List] = []  # [nombre, inicio_ns, ns de hijos]
+        self._names: List[str] = []
+
+    def _callback(self, frame, event, arg):
+        now = time.perf_counter_ns()
+        if frame.f_globals.get("__name__") == __name__:
+            return  # Los envoltorios de Instrumentation no aparecen en las pilas
+        if event == "call":
+            name = f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_qualname}"
+        elif event == "c_call":
+            name = f"{getattr(arg, '__module__', None) or 'builtins'}:{getattr(arg, '__qualname__', repr(arg))}"
+        elif event in ("return", "c_return", "c_exception") and self._stack:
+            _, start, children = self._stack.pop()
+            elapsed = now - start
+            self.totals[";".join(self._names)] += elapsed - children
+            self._names.pop()
+            if self._stack:
+                self._stack[-1][2] += elapsed
+            return
+        else:
+            return
+        self._stack.append([name, now, 0])
+        self._names.append(name)
+
+    def enable(self):
+        sys.setprofile(self._callback)
+
+    def disable(self):
+        sys.setprofile(None)
+
+    def write(self, path: Path):
+        with open(path, "w") as f:
+            for stack, ns in self.totals.most_common():
+                if ns >= 1000:
+                    f.write(f"{stack} {ns // 1000}\n")
+
+
+def settings_from_env() -> Tuple[Optional[str], str]:
+    """(directorio de salida o None si está apagado, formato) según las variables de entorno."""
+    return os.environ.get(ENV_VAR) or None, os.environ.get(FORMAT_ENV_VAR, "pstats")
+
+
+@contextmanager
+def profiling(output_dir: Optional[str], fmt: str = "pstats", label: str = "run"):
+    """
+    Instrumenta y perfila el bloque; con output_dir None no hace nada.
+    Escribe <label>.pstats o <label>.collapsed y <label>-counters.json en output_dir.
+    """
+    if output_dir is None:
+        yield None
+        return
+    if fmt not in FORMATS:
+        raise ValueError(f"Formato de perfil desconocido: {fmt}")
+
+    directory = Path(output_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    instrumentation = Instrumentation()
+    profiler = cProfile.Profile() if fmt == "pstats" else CollapsedStackProfiler()
+
+    instrumentation.install()
+    profiler.enable()
+    try:
+        yield instrumentation
+    finally:
+        profiler.disable()
+        instrumentation.uninstall()
+        if fmt == "pstats":
+            profiler.dump_stats(directory / f"{label}.pstats")
+        else:
+            profiler.write(directory / f"{label}.collapsed")
+        (directory / f"{label}-counters.json").write_text(json.dumps(instrumentation.report(), indent=2) + "\n")
+        print(f"\n{instrumentation.format_report()}\nPerfil guardado en '{directory}' ({label}.{fmt}).")
@@ -1,13 +1,24 @@
 import sys
-import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from enum import Enum
 
 import pygame
 
-from src.ai.minimax import (
-    find_best_move_and_viz,
+from src.ai.budget import SearchCancelled
+from src.ai.context import SearchContext
+from src.ai.ordering import MoveOrderer
+from src.ai.transposition import TranspositionTable
+from src.config import (
+    AI_MOVE_TIME_LIMIT,
+    BOARD_COLS,
+    BOARD_OFFSET_Y,
+    BOARD_ROWS,
+    BOARD_WIDTH,
+    FPS,
+    HEIGHT,
+    SQUARE_SIZE,
+    WIDTH,
 )
-from src.config import *
 from src.game_logic.board import Board
 from src.gui.renderer import Renderer
 
@@ -23,12 +34,17 @@ class PlayerType:
     HUMAN = "HUMAN"
     AI_SLOW = "AI_SLOW"
     AI_FAST = "AI_FAST"
+    AI_LOOKUP = "AI_LOOKUP"
+    AI_PVS = "AI_PVS"
+
+
+AI_PLAYER_TYPES = [PlayerType.AI_SLOW, PlayerType.AI_FAST, PlayerType.AI_LOOKUP, PlayerType.AI_PVS]
 
 
 class GameController:
     def __init__(self):
+        # Solo el video: TextCache inicializa las fuentes al rasterizar el primer texto
         pygame.display.init()
-        pygame.font.init()
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
         pygame.display.set_caption("Comparador de IA: Minimax vs Alfa-Beta")
         self.clock = pygame.time.Clock()
@@ -43,6 +59,14 @@ class GameController:
         self.ai_speed_selected = None
         self.last_graph_data = []
         self.waiting_for_step = False
+        # Las IA rápidas (Alfa-Beta y PVS) conservan su tabla de transposición durante toda la partida
+        self.transposition_table = TranspositionTable()
+        self.move_orderer = MoveOrderer()
+
+        # La IA busca en un hilo aparte para que el bucle siga dibujando y atendiendo eventos
+        self.ai_executor = ThreadPoolExecutor(max_workers=1)
+        self.ai_future = None
+        self.ai_context = None
 
         # Configuración de Menús
         self.menu_options = [
@@ -50,6 +74,8 @@ class GameController:
             "Humano vs IA (Lenta - Minimax)",
             "Humano vs IA (Rápida - AlfaBeta)",
             "IA Lenta vs IA Rápida",
+            "Humano vs IA (Perfecta - Tabla)",
+            "Humano vs IA (PVS - NegaScout)",
         ]
         self.menu_selection = 0
 
@@ -66,6 +92,8 @@ class GameController:
             self.draw()
             self.clock.tick(FPS)
 
+        self._cancel_ai_turn()
+        self.ai_executor.shutdown()
         pygame.quit()
         sys.exit()
 
@@ -76,6 +104,10 @@ class GameController:
                 self.running = False
                 return
 
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                # La ventana perdió su contenido: el próximo cuadro se redibuja entero
+                self.renderer.invalidate()
+
             if self.state == GameState.MENU:
                 self._handle_menu_input(event, self.menu_options, is_main_menu=True)
 
@@ -139,6 +171,12 @@ class GameController:
             self.state = GameState.AI_SELECTION
         elif sel == 3:  # IA v IA
             self.start_game([PlayerType.AI_FAST, PlayerType.AI_SLOW])
+        elif sel == 4:  # IA con tabla precalculada
+            self.ai_speed_selected = PlayerType.AI_LOOKUP
+            self.state = GameState.AI_SELECTION
+        elif sel == 5:  # IA con búsqueda de variante principal
+            self.ai_speed_selected = PlayerType.AI_PVS
+            self.state = GameState.AI_SELECTION
 
     def _confirm_ai_selection(self):
         p1 = PlayerType.HUMAN
@@ -153,6 +191,10 @@ class GameController:
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_r:
                 self.reset_board()
+            elif event.key == pygame.K_ESCAPE and self.ai_future is not None:
+                # Cancela la búsqueda; la IA espera ENTER para volver a intentarlo
+                self._cancel_ai_turn()
+                self.waiting_for_step = True
             elif event.key == pygame.K_ESCAPE:
                 self.state = GameState.MENU
             elif event.key == pygame.K_RETURN and self.waiting_for_step:
@@ -180,42 +222,91 @@ class GameController:
             self._update_game_logic()
 
     def _update_game_logic(self):
+        if self.ai_future is not None:
+            if self.ai_future.done():
+                self._finish_ai_turn()
+            return
+
         if self.waiting_for_step:
             return
 
         current_player = self.player_types[self.board.turn - 1]
 
-        if not self.board.game_over and current_player in [
-            PlayerType.AI_SLOW,
-            PlayerType.AI_FAST,
-        ]:
-            self._execute_ai_turn(current_player)
-
-    def _execute_ai_turn(self, ai_type):
-        self.draw()
-        start_time = time.time()
+        if not self.board.game_over and current_player in AI_PLAYER_TYPES:
+            self._start_ai_turn(current_player)
 
+    def _start_ai_turn(self, ai_type):
+        """Lanza la búsqueda en segundo plano sobre una copia del tablero."""
         print(f"Turno {self.board.turn} ({ai_type}): Pensando...")
+        uses_time_limit = ai_type != PlayerType.AI_LOOKUP and AI_MOVE_TIME_LIMIT is not None
+        self.ai_context = SearchContext(time_limit=AI_MOVE_TIME_LIMIT if uses_time_limit else None)
+        self.ai_future = self.ai_executor.submit(self._search_ai_move, ai_type, self.board.copy(), self.ai_context)
 
-        use_alpha_beta = ai_type == PlayerType.AI_FAST
+    def _cancel_ai_turn(self):
+        """Cancela la búsqueda en curso y espera a que el hilo la abandone (ocurre en el siguiente nodo)."""
+        if self.ai_future is None:
+            return
+        self.ai_context.cancel()
+        wait([self.ai_future])
+        self.ai_future = None
+        print("Búsqueda cancelada.")
+
+    def _search_ai_move(self, ai_type, board, context):
+        """Se ejecuta en el hilo de la IA. Retorna (move, tree_data)."""
+        # Los motores se importan en el primer turno de la IA (en este hilo), no al abrir el menú
+        if ai_type == PlayerType.AI_LOOKUP:
+            from src.ai.lookup import find_best_move_lookup_and_viz
+
+            return find_best_move_lookup_and_viz(board, context=context)
+        else:
+            from src.ai.iterative import find_best_move_and_viz_limited
+            from src.ai.minimax import find_best_move_and_viz
+            from src.ai.negamax import minimax_pvs
+
+            use_alpha_beta = ai_type in (PlayerType.AI_FAST, PlayerType.AI_PVS)
+            scoring_function = minimax_pvs if ai_type == PlayerType.AI_PVS else None
+            table = self.transposition_table if use_alpha_beta else None
+            if AI_MOVE_TIME_LIMIT is None:
+                return find_best_move_and_viz(
+                    board,
+                    use_alpha_beta=use_alpha_beta,
+                    table=table,
+                    scoring_function=scoring_function,
+                    context=context,
+                )
+            else:
+                ordering = self.move_orderer if use_alpha_beta else None
+                return find_best_move_and_viz_limited(
+                    board,
+                    use_alpha_beta,
+                    AI_MOVE_TIME_LIMIT,
+                    table=table,
+                    ordering=ordering,
+                    scoring_function=scoring_function,
+                    context=context,
+                )
 
-        move, tree_data = find_best_move_and_viz(self.board, use_alpha_beta=use_alpha_beta)
+    def _finish_ai_turn(self):
+        """Aplica en el hilo principal la jugada que calculó el hilo de la IA."""
+        future, self.ai_future = self.ai_future, None
+        try:
+            move, tree_data = future.result()
+        except SearchCancelled:
+            return
 
         self.last_graph_data = tree_data
 
-        print(f"Cálculo completado en: {time.time() - start_time:.4f}s")
+        stats = self.ai_context.stats()
+        print(
+            f"Cálculo completado en: {stats['elapsed']:.4f}s "
+            f"({stats['nodes']} nodos, {stats['nodes_per_second']:.0f} nodos/s)"
+        )
 
         if move:
             self.board.make_move(move[0], move[1])
 
-            is_p1_ai = self.player_types[0] in [
-                PlayerType.AI_SLOW,
-                PlayerType.AI_FAST,
-            ]
-            is_p2_ai = self.player_types[1] in [
-                PlayerType.AI_SLOW,
-                PlayerType.AI_FAST,
-            ]
+            is_p1_ai = self.player_types[0] in AI_PLAYER_TYPES
+            is_p2_ai = self.player_types[1] in AI_PLAYER_TYPES
 
             if is_p1_ai and is_p2_ai:
                 self.waiting_for_step = True
@@ -228,7 +319,11 @@ class GameController:
             self.menu_rects = self.renderer.draw_menu(self.start_options, self.start_selection)
 
         elif self.state == GameState.PLAYING:
-            self._draw_game_screen()
+            # Solo se envían a la ventana las zonas que cambiaron; sin cambios no se actualiza nada
+            dirty_rects = self._draw_game_screen()
+            if dirty_rects:
+                pygame.display.update(dirty_rects)
+            return
 
         pygame.display.update()
 
@@ -243,26 +338,24 @@ class GameController:
         )
         self.renderer.set_inverted(should_invert)
 
-        self.renderer.draw_grid()
-        self.renderer.draw_symbols(self.board.board)
-        self.renderer.draw_decision_graph(self.last_graph_data)
-
-        real_current_player = self.player_types[self.board.turn - 1]
-        label = "HUMAN" if real_current_player == PlayerType.HUMAN else "IA"
-        self.renderer.draw_turn_indicator(self.board.turn, label)
-
         current_player = self.player_types[self.board.turn - 1]
-        if not self.board.game_over and current_player == PlayerType.HUMAN:
-            self._draw_ghost_symbol()
-
-        if self.board.game_over:
-            self.renderer.draw_win_line(self.board)
-            self.renderer.draw_game_over_text(self.board)
+        label = "HUMAN" if current_player == PlayerType.HUMAN else "IA"
 
-        if self.waiting_for_step:
-            self._draw_step_prompt()
+        ghost = None
+        if not self.board.game_over and current_player == PlayerType.HUMAN:
+            ghost = self._ghost_cell()
+
+        return self.renderer.draw_game_screen(
+            self.board,
+            self.last_graph_data,
+            label,
+            ghost=ghost,
+            step_prompt=self.waiting_for_step,
+            thinking=self.ai_context.stats() if self.ai_future is not None else None,
+        )
 
-    def _draw_ghost_symbol(self):
+    def _ghost_cell(self):
+        """Casilla libre bajo el mouse (fila, col), o None."""
         mouse_pos = pygame.mouse.get_pos()
         mouseX, mouseY = mouse_pos
         if (
@@ -273,15 +366,8 @@ class GameController:
             col = (mouseX - self.renderer.board_offset_x) // SQUARE_SIZE
             if 0 <= row < BOARD_ROWS and 0 <= col < BOARD_COLS:
                 if self.board.is_valid_move(row, col):
-                    self.renderer.draw_ghost_symbol(row, col, self.board.turn)
-
-    def _draw_step_prompt(self):
-        font = pygame.font.Font(None, 30)
-        prompt = font.render("Presione ENTER para siguiente jugada...", True, CIRCLE_COLOR)
-        rect = prompt.get_rect(center=(WIDTH // 3.25, HEIGHT - 25))
-        bg = rect.inflate(20, 10)
-        pygame.draw.rect(self.screen, BG_COLOR, bg)
-        self.screen.blit(prompt, rect)
+                    return row, col
+        return None
 
     def start_game(self, players):
         self.player_types = players
@@ -289,9 +375,12 @@ class GameController:
         self.reset_board()
 
     def reset_board(self):
+        self._cancel_ai_turn()
         self.board = Board()
         self.last_graph_data = []
         self.waiting_for_step = False
+        self.transposition_table.clear()
+        self.move_orderer.clear()
         pygame.event.clear()
 
 
@@ -0,0 +1,240 @@
+"""
+Escritura incremental de los resultados de la simulación.
+
+Los registros se acumulan en un búfer y se vuelcan por bloques (chunk_size filas)
+al backend elegido, así la memoria se mantiene constante y una interrupción solo
+pierde el bloque en curso. Backends:
+
+- "csv": CSV de solo anexado (compatible con el archivo histórico).
+- "ndjson": un objeto JSON por línea.
+- "columnar": directorio con un .npz comprimido por bloque y columnas tipadas
+  (enteros int64, reales float64, texto unicode); es el más compacto y rápido de cargar.
+
+Desde el notebook: `from src.results import load_results; df = load_results(ruta)`.
+"""
+
+import csv
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+DEFAULT_CHUNK_ROWS = 1024
+COLUMNAR_PART = "part-{:05d}.npz"
+
+
+def detect_format(path: str) -> str:
+    """Deduce el backend a partir de la extensión (o de si la ruta es un directorio)."""
+    suffix = Path(path).suffix.lower()
+    if suffix == ".csv":
+        return "csv"
+    if suffix in (".ndjson", ".jsonl"):
+        return "ndjson"
+    return "columnar"
+
+
+def _drop_partial_line(path: str):
+    """Si una interrupción dejó la última línea a medias, la descarta antes de anexar."""
+    size = os.path.getsize(path) if os.path.exists(path) else 0
+    if size == 0:
+        return
+    with open(path, "rb+") as f:
+        f.seek(max(0, size - 65536))
+        tail = f.read()
+        if not tail.endswith(b"\n"):
+            f.truncate(size - len(tail) + tail.rfind(b"\n") + 1)
+
+
+def _drop_last_game(path: str, fmt: str):
+    """
+    Antes de anexar, descarta todas las filas de la última partida del archivo.
+    Los bloques solo llevan partidas enteras, pero una interrupción durante la escritura
+    puede dejar algunas filas de la última sin las demás; como las filas no dicen si la
+    partida quedó completa, se descarta siempre y se vuelve a jugar.
+    """
+    _drop_partial_line(path)
+    column = None
+    last_id, last_start = None, None
+    with open(path, "rb") as f:
+        offset = 0
+        for line in f:
+            start, offset = offset, offset + len(line)
+            if fmt == "csv":
+                fields = next(csv.reader([line.decode()]))
+                if column is None:  # Encabezado
+                    column = fields.index("simulation_id") if "simulation_id" in fields else -1
+                    continue
+                sim_id = fields[column] if 0 <= column < len(fields) else None
+            else:
+                try:
+                    sim_id = json.loads(line).get("simulation_id")
+                except ValueError:
+                    continue
+            if sim_id != last_id:
+                last_id, last_start = sim_id, start
+    if last_id is not None:
+        os.truncate(path, last_start)
+
+
+class ResultSink:
+    """Base de los backends: acumula registros y los vuelca por bloques."""
+
+    def __init__(self, path: str, chunk_size: int = DEFAULT_CHUNK_ROWS, append: bool = False):
+        self.path = path
+        self.chunk_size = chunk_size
+        self.append = append
+        self.buffer: List[Dict] = []
+        self.rows_written = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def write(self, records: List[Dict]):
+        """Agrega los registros de una partida; vuelca si el búfer llegó al tamaño de bloque."""
+        self.buffer.extend(records)
+        if len(self.buffer) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        if self.buffer:
+            self._write_chunk(self.buffer)
+            self.rows_written += len(self.buffer)
+            self.buffer = []
+
+    def close(self):
+        self.flush()
+
+    def _write_chunk(self, rows: List[Dict]):
+        raise NotImplementedError
+
+
+class CsvSink(ResultSink):
+    def __init__(self, path: str, chunk_size: int = DEFAULT_CHUNK_ROWS, append: bool = False):
+        super().__init__(path, chunk_size, append)
+        self.fieldnames: Optional[List[str]] = None
+        if append and os.path.exists(path) and os.path.getsize(path) > 0:
+            _drop_last_game(path, "csv")
+            # Se respetan las columnas del archivo existente
+            with open(path, newline="") as existing:
+                self.fieldnames = next(csv.reader(existing))
+        else:
+            open(path, "w").close()
+
+    def _write_chunk(self, rows: List[Dict]):
+        with open(self.path, "a", newline="") as csvfile:
+            write_header = self.fieldnames is None
+            if write_header:
+                self.fieldnames = list(rows[0].keys())
+            writer = csv.DictWriter(csvfile, fieldnames=self.fieldnames, extrasaction="ignore")
+            if write_header:
+                writer.writeheader()
+            writer.writerows(rows)
+
+
+class NdjsonSink(ResultSink):
+    def __init__(self, path: str, chunk_size: int = DEFAULT_CHUNK_ROWS, append: bool = False):
+        super().__init__(path, chunk_size, append)
+        if append and os.path.exists(path):
+            _drop_last_game(path, "ndjson")
+        else:
+            open(path, "w").close()
+
+    def _write_chunk(self, rows: List[Dict]):
+        with open(self.path, "a") as f:
+            f.writelines(json.dumps(row) + "\n" for row in rows)
+
+
+class ColumnarSink(ResultSink):
+    def __init__(self, path: str, chunk_size: int = DEFAULT_CHUNK_ROWS, append: bool = False):
+        super().__init__(path, chunk_size, append)
+        os.makedirs(path, exist_ok=True)
+        # Cada parte se publica con un rename y contiene partidas enteras: no hay partidas a medias
+        parts = sorted(Path(path).glob("part-*.npz"))
+        if not append:
+            for part in parts:
+                part.unlink()
+            parts = []
+        self.next_part = len(parts)
+
+    def _write_chunk(self, rows: List[Dict]):
+        import numpy as np  # Solo el backend columnar lo necesita; CSV y NDJSON arrancan sin cargarlo
+
+        columns = {name: np.asarray([row[name] for row in rows]) for name in rows[0]}
+        target = os.path.join(self.path, COLUMNAR_PART.format(self.next_part))
+        # Se escribe con otro nombre y se renombra: un bloque a medio escribir nunca queda visible
+        tmp = target + ".tmp"
+        with open(tmp, "wb") as f:
+            np.savez_compressed(f, **columns)
+        os.replace(tmp, target)
+        self.next_part += 1
+
+
+SINKS = {"csv": CsvSink, "ndjson": NdjsonSink, "columnar": ColumnarSink}
+
+
+def open_sink(
+    path: str,
+    fmt: Optional[str] = None,
+    chunk_size: int = DEFAULT_CHUNK_ROWS,
+    append: bool = False,
+) -> ResultSink:
+    """Crea el backend para `path` (fmt None lo deduce de la extensión)."""
+    fmt = fmt or detect_format(path)
+    if fmt not in SINKS:
+        raise ValueError(f"Formato de resultados desconocido: {fmt}")
+    return SINKS[fmt](path, chunk_size, append)
+
+
+def read_column(path: str, column: str, fmt: Optional[str] = None) -> List:
+    """Valores de una columna sin cargar el resto (por ejemplo simulation_id para reanudar)."""
+    if not os.path.exists(path):
+        return []
+    fmt = fmt or detect_format(path)
+    if fmt == "csv":
+        with open(path, newline="") as csvfile:
+            return [row[column] for row in csv.DictReader(csvfile) if row.get(column)]
+    if fmt == "ndjson":
+        values = []
+        with open(path) as f:
+            for line in f:
+                try:
+                    values.append(json.loads(line)[column])
+                except (ValueError, KeyError):
+                    continue  # Línea truncada por una interrupción
+        return values
+    import numpy as np
+
+    values = []
+    for part in sorted(Path(path).glob("part-*.npz")):
+        with np.load(part) as data:
+            values.extend(data[column].tolist())
+    return values
+
+
+def completed_simulations(path: str, fmt: Optional[str] = None) -> Set[str]:
+    """
+    Identificadores de las partidas ya guardadas (para reanudar). Leerlos después de abrir
+    el backend con append=True, que descarta la última partida de los archivos CSV/NDJSON.
+    """
+    return set(read_column(path, "simulation_id", fmt))
+
+
+def load_results(path: str, fmt: Optional[str] = None):
+    """Carga los resultados en un DataFrame de pandas, sea cual sea el backend."""
+    import pandas as pd
+
+    fmt = fmt or detect_format(path)
+    if fmt == "csv":
+        return pd.read_csv(path)
+    if fmt == "ndjson":
+        return pd.read_json(path, lines=True)
+    import numpy as np
+
+    frames = []
+    for part in sorted(Path(path).glob("part-*.npz")):
+        with np.load(part) as data:
+            frames.append(pd.DataFrame({name: data[name] for name in data.files}))
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
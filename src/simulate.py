@@ -1,59 +1,167 @@
 # simulate.py
 
-import csv
+import argparse
 import random
 import time
-from typing import Dict, List, Tuple
+import tracemalloc
+import zlib
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Tuple
 
 # Importamos las nuevas funciones específicas para la simulación
+from ai.context import DetailedSearchContext, SearchContext
+from ai.iterative import find_best_move_iterative
+from ai.lookup import find_best_move_lookup
 from ai.minimax import (
     get_simulation_move_alpha_beta,
     get_simulation_move_bruteforce,
 )
+from ai.negamax import get_simulation_move_pvs, minimax_pvs
+from ai.ordering import MoveOrderer
+from ai.transposition import TranspositionTable
 from game_logic.board import Board
+from instrumentation import FORMATS, profiling, settings_from_env
+from results import DEFAULT_CHUNK_ROWS, SINKS, completed_simulations, open_sink
+
+# Los motores consultan el libro de src.ai.opening_book (ai.opening_book sería otra copia, con otro caché)
+from src.ai.opening_book import load_opening_book
 
 # --- CONFIGURACIÓN DEL EXPERIMENTO ---
-NUM_SIMULATIONS_PER_BATCH = 10  # teorema del limite central tiende a dist normal
+NUM_SIMULATIONS_PER_BATCH = 10  # teorema del limite central tiende a dist normal (--games lo cambia)
+BASE_SEED = 0  # Semilla base; cada partida deriva la suya del lote y su número (--seed lo cambia)
+# La extensión elige el formato: .csv, .ndjson o (cualquier otra) directorio columnar
 CSV_FILENAME = "queries/full_simulation_results.csv"
+USE_TRANSPOSITION_TABLE = False  # Cada IA conserva su propia tabla durante la partida
+USE_MOVE_ORDERING = False  # Killers/historia/prior estático para Alfa-Beta y PVS (un ordenador por IA)
+MOVE_TIME_LIMIT = None  # Segundos por jugada; con un valor las IA usan profundización iterativa
+SEARCH_WORKERS = None  # Procesos para puntuar en paralelo las jugadas raíz de Minimax (None = en serie)
+# Con el libro las primeras jugadas no se buscan (0 nodos): apagado para que los experimentos midan la búsqueda
+USE_OPENING_BOOK = False  # --book lo activa; las jugadas del libro se marcan en la columna book_move
+TRACK_MEMORY = False  # Pico de memoria por jugada con tracemalloc (--track-memory); hace más lentas las jugadas
+GAMES_IN_FLIGHT_PER_WORKER = 2  # Partidas enviadas al pool por proceso con --workers (acota la memoria)
 
 # Tipos de jugadores para la simulación
 AI_SLOW = "Minimax"
 AI_FAST = "Alpha-Beta"
+AI_LOOKUP = "Lookup"
+AI_PVS = "PVS"
 RANDOM = "Random"
 
+# IA que consultan el libro de aperturas antes de buscar
+BOOK_PLAYERS = (AI_SLOW, AI_FAST, AI_PVS)
+
+EXPERIMENT_BATCHES = {
+    "Direct_Comparison": (AI_SLOW, AI_FAST),
+    "Minimax_Profile": (AI_SLOW, RANDOM),
+    "AlphaBeta_Profile": (AI_FAST, RANDOM),
+    "Lookup_Profile": (AI_LOOKUP, RANDOM),
+    "PVS_Profile": (AI_PVS, RANDOM),
+}
+
 
-def get_ai_move(board: Board, player_type: str) -> Tuple[Tuple[int, int], int]:
-    """Llama a la función de IA correcta y retorna el movimiento y los nodos."""
+def get_ai_move(
+    board: Board,
+    player_type: str,
+    table: Optional[TranspositionTable] = None,
+    ordering: Optional[MoveOrderer] = None,
+    use_book: bool = USE_OPENING_BOOK,
+    context: Optional[SearchContext] = None,
+) -> Tuple[Tuple[int, int], int]:
+    """
+    Llama a la función de IA correcta y retorna el movimiento y los nodos.
+    context: recibe las estadísticas de la búsqueda (con MOVE_TIME_LIMIT debe traer ese presupuesto).
+    """
+    if MOVE_TIME_LIMIT is not None and player_type in (AI_SLOW, AI_FAST, AI_PVS):
+        scoring_function = minimax_pvs if player_type == AI_PVS else None
+        return find_best_move_iterative(
+            board,
+            player_type != AI_SLOW,
+            MOVE_TIME_LIMIT,
+            table=table,
+            ordering=ordering,
+            scoring_function=scoring_function,
+            use_book=use_book,
+            context=context,
+        )
     if player_type == AI_SLOW:
-        return get_simulation_move_bruteforce(board)
+        return get_simulation_move_bruteforce(board, table, SEARCH_WORKERS, context, use_book)
     elif player_type == AI_FAST:
-        return get_simulation_move_alpha_beta(board)
+        return get_simulation_move_alpha_beta(board, table, ordering, context, use_book)
+    elif player_type == AI_PVS:
+        return get_simulation_move_pvs(board, table, ordering, context=context, use_book=use_book)
+    elif player_type == AI_LOOKUP:
+        return find_best_move_lookup(board), 0
     return ((-1, -1), 0)
 
 
-def get_random_move(board: Board) -> Tuple[int, int]:
-    """Elige un movimiento válido al azar."""
-    return random.choice(board.get_available_moves())
+def get_random_move(board: Board, rng: Optional[random.Random] = None) -> Tuple[int, int]:
+    """Elige un movimiento válido al azar (con `rng` la elección es reproducible)."""
+    return (rng or random).choice(board.get_available_moves())
 
 
-def run_single_simulation(player1_type: str, player2_type: str) -> List[Dict]:
-    """Simula una partida entre dos tipos de jugadores definidos."""
+def run_single_simulation(
+    player1_type: str,
+    player2_type: str,
+    seed: Optional[int] = None,
+    use_book: bool = USE_OPENING_BOOK,
+    track_memory: bool = TRACK_MEMORY,
+) -> List[Dict]:
+    """
+    Simula una partida entre dos tipos de jugadores definidos. Con `seed` es reproducible.
+    Cada jugada se mide con perf_counter_ns (pared) y process_time_ns (CPU de este proceso;
+    no incluye los procesos de SEARCH_WORKERS) y, con track_memory, con el pico de tracemalloc.
+    """
+    started_tracing = track_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    try:
+        return _play(player1_type, player2_type, seed, use_book, track_memory)
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+
+
+def _play(player1_type: str, player2_type: str, seed: Optional[int], use_book: bool, track_memory: bool) -> List[Dict]:
+    rng = random.Random(seed)
     board = Board()
     game_records = []
     turn_number = 1
+    tables = [None, None]
+    if USE_TRANSPOSITION_TABLE:
+        tables = [TranspositionTable(), TranspositionTable()]
+    orderers = [None, None]
+    if USE_MOVE_ORDERING:
+        orderers = [MoveOrderer(), MoveOrderer()]
+    book = None
+    if use_book and (player1_type in BOOK_PLAYERS or player2_type in BOOK_PLAYERS):
+        book = load_opening_book()  # Antes de medir: si no, la primera jugada pagaría la carga del libro
 
     while not board.game_over:
         current_player = player1_type if (turn_number % 2 != 0) else player2_type
 
-        start_time = time.time()
         nodes_evaluated = 0
+        from_book = book is not None and current_player in BOOK_PLAYERS and book.entry(board) is not None
+        # Nodos y cortes por profundidad, finales y aciertos de tabla (en cero para Random)
+        context = DetailedSearchContext(time_limit=MOVE_TIME_LIMIT)
+        if track_memory:
+            tracemalloc.reset_peak()
+            memory_before = tracemalloc.get_traced_memory()[0]
+        start_ns = time.perf_counter_ns()
+        start_cpu_ns = time.process_time_ns()
 
         if current_player == RANDOM:
-            move = get_random_move(board)
+            move = get_random_move(board, rng)
         else:  # Es una IA
-            move, nodes_evaluated = get_ai_move(board, current_player)
+            player_index = (turn_number - 1) % 2
+            move, nodes_evaluated = get_ai_move(
+                board, current_player, tables[player_index], orderers[player_index], use_book, context
+            )
 
-        end_time = time.time()
+        cpu_ns = time.process_time_ns() - start_cpu_ns
+        wall_ns = time.perf_counter_ns() - start_ns
+        if track_memory:
+            peak_alloc = tracemalloc.get_traced_memory()[1] - memory_before
 
         if move != (-1, -1):
             board.make_move(move[0], move[1])
@@ -63,47 +171,163 @@ def run_single_simulation(player1_type: str, player2_type: str) -> List[Dict]:
             "pieces_on_board": turn_number - 1,
             "algorithm": current_player,
             "nodes_evaluated": nodes_evaluated,
-            "time_seconds": end_time - start_time,
+            "book_move": int(from_book),
+            "time_seconds": wall_ns / 1e9,
+            "wall_ns": wall_ns,
+            "cpu_ns": cpu_ns,
             "winner": board.winner if board.game_over else 0,
+            **search_columns(context),
         }
+        if track_memory:
+            record["peak_alloc_bytes"] = peak_alloc
         game_records.append(record)
         turn_number += 1
 
     return game_records
 
 
-def main():
-    all_results = []
+def _depth_counts(counts: Dict[int, int]) -> str:
+    """Conteos por profundidad en una sola celda: "1:8;2:56;..."."""
+    return ";".join(f"{depth}:{n}" for depth, n in counts.items())
+
 
-    experiment_batches = {
-        "Direct_Comparison": (AI_SLOW, AI_FAST),
-        "Minimax_Profile": (AI_SLOW, RANDOM),
-        "AlphaBeta_Profile": (AI_FAST, RANDOM),
+def search_columns(context: DetailedSearchContext) -> Dict:
+    """Columnas de estadísticas de búsqueda de una jugada (de dónde sale la mejora: poda, orden o tabla)."""
+    detail = context.detail()
+    return {
+        "nodes_by_depth": _depth_counts(detail["nodes_by_depth"]),
+        "cutoffs_by_depth": _depth_counts(detail["cutoffs_by_depth"]),
+        "cutoffs": detail["cutoffs"],
+        "first_move_cutoff_rate": detail["first_move_cutoff_rate"],
+        "terminal_nodes": detail["terminal_nodes"],
+        "tt_hits": detail["tt_hits"],
     }
 
-    total_sims = len(experiment_batches) * NUM_SIMULATIONS_PER_BATCH
-    print(f"Iniciando {total_sims} simulaciones en {len(experiment_batches)} lotes...")
-    sim_counter = 0
-    for batch_name, (p1, p2) in experiment_batches.items():
-        print(f"\n--- Ejecutando Lote: {batch_name} ({NUM_SIMULATIONS_PER_BATCH} partidas) ---")
-        for i in range(NUM_SIMULATIONS_PER_BATCH):
-            sim_counter += 1
-            print(f"  - Simulando partida {sim_counter}/{total_sims}...", end="\r")
-
-            results = run_single_simulation(p1, p2)
-            for record in results:
-                record["experiment_batch"] = batch_name
-                record["simulation_id"] = f"{batch_name}_{i + 1}"
-                all_results.append(record)
-        print(f"\nLote {batch_name} completado.")
-
-    print(f"\nSimulación finalizada. Guardando resultados en '{CSV_FILENAME}'...")
-    if all_results:
-        with open(CSV_FILENAME, "w", newline="") as csvfile:
-            fieldnames = all_results[0].keys()
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(all_results)
+
+def game_seed(base_seed: int, batch_name: str, index: int) -> int:
+    """Semilla determinista de una partida (no depende del orden ni del proceso que la juegue)."""
+    return zlib.crc32(f"{base_seed}:{batch_name}:{index}".encode())
+
+
+def play_game(task: Tuple[str, int, str, str, int, bool, bool]) -> List[Dict]:
+    """Juega una partida de un lote y etiqueta sus registros. Es la unidad de trabajo de los procesos."""
+    batch_name, index, p1, p2, seed, use_book, track_memory = task
+    results = run_single_simulation(p1, p2, seed, use_book, track_memory)
+    for record in results:
+        record["experiment_batch"] = batch_name
+        record["simulation_id"] = f"{batch_name}_{index}"
+        record["seed"] = seed
+    return results
+
+
+def run_games(tasks: List[Tuple[str, int, str, str, int, bool, bool]], workers: int) -> Iterator[List[Dict]]:
+    """Juega las partidas (en este proceso o repartidas entre `workers`) y las entrega al terminar."""
+    if workers <= 1:
+        for task in tasks:
+            yield play_game(task)
+        return
+    # Solo unas pocas partidas en vuelo por proceso: cada futuro guarda sus registros hasta que se
+    # entrega, así que enviarlas todas de entrada haría crecer la memoria con la cantidad de partidas
+    pending_tasks = iter(tasks)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight = {
+            pool.submit(play_game, task) for task in islice(pending_tasks, GAMES_IN_FLIGHT_PER_WORKER * workers)
+        }
+        while in_flight:
+            finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                task = next(pending_tasks, None)
+                if task is not None:
+                    in_flight.add(pool.submit(play_game, task))
+                yield future.result()
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Simulaciones de partidas entre las IA del proyecto.")
+    parser.add_argument("--games", type=int, default=NUM_SIMULATIONS_PER_BATCH, help="Partidas por lote.")
+    parser.add_argument("--workers", type=int, default=1, help="Procesos en paralelo (1 = en serie).")
+    parser.add_argument("--seed", type=int, default=BASE_SEED, help="Semilla base de las partidas.")
+    parser.add_argument("--output", default=CSV_FILENAME, help="Archivo (o directorio columnar) de resultados.")
+    parser.add_argument(
+        "--format", choices=list(SINKS), default=None, help="Formato de salida (por defecto según la extensión)."
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=DEFAULT_CHUNK_ROWS, help="Filas acumuladas antes de cada volcado."
+    )
+    parser.add_argument(
+        "--batches",
+        nargs="+",
+        choices=list(EXPERIMENT_BATCHES),
+        default=list(EXPERIMENT_BATCHES),
+        help="Lotes a ejecutar.",
+    )
+    parser.add_argument(
+        "--resume", action="store_true", help="Conserva el CSV existente y salta las partidas ya guardadas."
+    )
+    parser.add_argument(
+        "--book",
+        dest="use_book",
+        action=argparse.BooleanOptionalAction,
+        default=USE_OPENING_BOOK,
+        help="Responde las aperturas con el libro (0 nodos, marcadas en book_move) en vez de buscarlas.",
+    )
+    parser.add_argument(
+        "--track-memory",
+        action="store_true",
+        default=TRACK_MEMORY,
+        help="Agrega el pico de memoria asignada por jugada (tracemalloc; las jugadas se vuelven más lentas).",
+    )
+    profile_dir, profile_format = settings_from_env()
+    parser.add_argument(
+        "--profile",
+        metavar="DIR",
+        default=profile_dir,
+        help="Instrumenta y perfila la corrida; deja los resultados en DIR (también con TTT_PROFILE=DIR).",
+    )
+    parser.add_argument(
+        "--profile-format",
+        choices=FORMATS,
+        default=profile_format,
+        help="pstats (cProfile) o collapsed (pilas colapsadas para flamegraph).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+
+    # Al reanudar, el backend descarta la última partida guardada (pudo quedar a medias):
+    # se abre antes de leer cuáles están completas para que esa partida se vuelva a jugar
+    sink = open_sink(args.output, args.format, args.chunk_size, append=args.resume)
+    done = completed_simulations(args.output, args.format) if args.resume else set()
+    tasks = []
+    for batch_name in args.batches:
+        p1, p2 = EXPERIMENT_BATCHES[batch_name]
+        for i in range(1, args.games + 1):
+            if f"{batch_name}_{i}" not in done:
+                seed = game_seed(args.seed, batch_name, i)
+                tasks.append((batch_name, i, p1, p2, seed, args.use_book, args.track_memory))
+
+    total_sims = len(args.batches) * args.games
+    if args.profile and args.workers > 1:
+        print("Con --profile las partidas se juegan en este proceso (se ignora --workers).")
+        args.workers = 1
+    print(f"Iniciando {total_sims} simulaciones en {len(args.batches)} lotes con {args.workers} proceso(s)...")
+    if done:
+        print(f"Reanudando: {total_sims - len(tasks)} partidas ya estaban en '{args.output}'.")
+
+    # Los registros se vuelcan por bloques a medida que terminan las partidas: memoria constante
+    # y, ante una interrupción, solo se pierde el bloque en curso
+    start_time = time.time()
+    label = time.strftime("simulate-%Y%m%d-%H%M%S")
+    with profiling(args.profile, args.profile_format, label), sink:
+        for finished, results in enumerate(run_games(tasks, args.workers), start=1):
+            sink.write(results)
+
+            elapsed = max(time.time() - start_time, 1e-9)
+            print(f"  - Partidas completadas {finished}/{len(tasks)} ({finished / elapsed:.1f} partidas/s)", end="\r")
+
+    print(f"\nSimulación finalizada. Resultados guardados en '{args.output}'.")
     print("¡Listo!")
 
 
@@ -0,0 +1,21 @@
+from src.benchmark import POSITION_SETS, compare, measure
+
+
+def test_conjuntos_de_posiciones_fijos():
+    assert len(POSITION_SETS["ply1"]()) == 9
+    assert len(POSITION_SETS["ply2"]()) == 72
+
+
+def test_medicion_y_deteccion_de_regresiones():
+    result = measure("alpha_beta", "tactical", repeat=1)
+    assert result["positions"] == len(result["values"]) == 5
+    assert result["nodes"] > 0 and result["peak_kib"] > 0
+    assert measure("pvs", "tactical", repeat=1)["values"] == result["values"]
+
+    baseline = {"alpha_beta/tactical": result}
+    assert compare({"alpha_beta/tactical": result}, baseline) == []
+
+    slower = dict(result, nodes=result["nodes"] + 1, seconds=result["seconds"] * 2 + 1)
+    assert len(compare({"alpha_beta/tactical": slower}, baseline)) == 2
+    changed = dict(result, values=[1] * 5)
+    assert compare({"alpha_beta/tactical": changed}, baseline) == ["alpha_beta/tactical: los valores cambiaron"]
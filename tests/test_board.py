@@ -0,0 +1,82 @@
+from src.game_logic.board import Board
+
+
+def test_victoria_en_fila():
+    board = Board()
+    for move in [(0, 0), (1, 0), (0, 1), (1, 1), (0, 2)]:
+        assert board.make_move(*move)
+    assert board.game_over
+    assert board.winner == 1
+    assert board.win_info == ((0, 0), (0, 2))
+
+
+def test_victoria_en_diagonal_ascendente():
+    board = Board()
+    for move in [(0, 2), (0, 0), (1, 1), (0, 1), (2, 0)]:
+        board.make_move(*move)
+    assert board.winner == 1
+    assert board.win_info == ((0, 2), (2, 0))
+
+
+def test_empate_y_movimientos_disponibles():
+    board = Board()
+    assert len(board.get_available_moves()) == 9
+    for move in [(0, 0), (0, 1), (0, 2), (1, 1), (1, 0), (1, 2), (2, 1), (2, 0), (2, 2)]:
+        board.make_move(*move)
+    assert board.game_over
+    assert board.winner == 0
+    assert board.get_available_moves() == []
+    assert board.board == [[1, 2, 1], [1, 2, 2], [2, 1, 1]]
+
+
+def test_movimiento_invalido():
+    board = Board()
+    assert board.make_move(1, 1)
+    assert not board.make_move(1, 1)
+    assert board.turn == 2
+
+
+def test_movimiento_fuera_del_tablero():
+    board = Board()
+    for row, col in [(0, 3), (3, 0), (-1, 0), (0, -1)]:
+        assert not board.is_valid_move(row, col)
+        assert not board.make_move(row, col)
+    # (0, 3) no se juega en (1, 0) ni (3, 0) deja un bit suelto en la máscara
+    assert (board.masks, board.history, board.turn) == ([0, 0], [], 1)
+
+
+def test_push_pop_restaura_estado():
+    board = Board()
+    for move in [(0, 0), (1, 0), (0, 1), (1, 1)]:
+        board.push(move)
+    snapshot = (list(board.masks), board.turn, board.winner, board.game_over, board.win_info)
+
+    assert board.push((0, 2))
+    assert board.game_over and board.winner == 1
+    assert board.pop() == (0, 2)
+
+    assert (list(board.masks), board.turn, board.winner, board.game_over, board.win_info) == snapshot
+    assert not board.push((0, 0))
+
+
+def test_tablero_mnk_cuatro_en_linea():
+    board = Board(4, 4, 4)
+    for move in [(0, 0), (0, 1), (1, 1), (0, 2), (2, 2), (0, 3)]:
+        board.make_move(*move)
+    assert not board.game_over
+    board.make_move(3, 3)
+    assert board.winner == 1
+    assert board.win_info == ((0, 0), (3, 3))
+
+
+def test_gomoku_detecta_linea_parcial():
+    board = Board(15, 15, 5)
+    for col in range(4):
+        board.make_move(7, 3 + col)
+        board.make_move(0, col)
+    assert not board.game_over
+    board.make_move(7, 7)
+    assert board.winner == 1
+    assert board.win_info == ((7, 3), (7, 7))
+    board.pop()
+    assert not board.game_over and board.turn == 1
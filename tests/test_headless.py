@@ -0,0 +1,63 @@
+import csv
+
+import pygame
+import pytest
+
+from src.gui import headless
+
+
+def test_lee_posiciones_de_texto():
+    lines = ["# comentario", ".", "", "1,1 0,0  # centro y esquina"]
+    assert list(headless.read_positions(lines)) == [(), ((1, 1), (0, 0))]
+    assert headless.parse_moves(headless.format_moves(((2, 0), (0, 2)))) == ((2, 0), (0, 2))
+
+
+ILLEGAL = [((1, 1), (1, 1)), ((0, 0), (3, 0)), ((0, 0), (1, 0), (0, 1), (1, 1), (0, 2), (2, 2))]
+
+
+@pytest.mark.parametrize("bad", [headless.format_moves(moves) for moves in ILLEGAL] + ["1,1,1", "a,b"])
+def test_posiciones_invalidas_indican_la_linea(bad):
+    with pytest.raises(ValueError, match="Línea 3"):
+        list(headless.read_positions(["# comentario", ".", bad]))
+
+
+@pytest.mark.parametrize("moves", ILLEGAL)
+def test_no_se_dibuja_una_posicion_ilegal(moves):
+    # Repetida, fuera del tablero o después del final: antes se dibujaba otra posición sin aviso
+    with pytest.raises(ValueError, match="Jugada ilegal"):
+        headless.render_position((0, moves))
+
+
+def test_posiciones_por_cantidad_de_fichas():
+    assert len(list(headless.positions_with_pieces([2]))) == 72
+    # Clases de simetría con 0..9 fichas: 1 + 3 + 12 + 38 + 108 + 174 + 204 + 153 + 57 + 15
+    assert len(list(headless.positions_with_pieces(range(10), canonical=True))) == 765
+
+
+def test_dibuja_cuadros_manifiesto_y_hoja_de_contactos(tmp_path):
+    positions = tmp_path / "posiciones.txt"
+    positions.write_text(".\n1,1 0,0\n0,0 1,0 0,1 1,1 0,2\n")
+    output = tmp_path / "salida"
+
+    args = ["--positions", str(positions), "--output", str(output), "--sheet", "--sheet-columns", "2"]
+    assert headless.main(args) == 0
+
+    with open(output / "manifest.csv") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["moves"] for row in rows] == ["", "1,1 0,0", "0,0 1,0 0,1 1,1 0,2"]
+    assert rows[2]["best_move"] == "" and rows[2]["score"] == "1"  # Partida terminada
+
+    frame = pygame.image.load(str(output / rows[1]["file"]))
+    assert frame.get_size() == (headless.WIDTH, headless.HEIGHT)
+    sheet = pygame.image.load(str(output / "contact_sheet_001.png"))
+    thumb_height = headless.DEFAULT_THUMB_WIDTH * headless.HEIGHT // headless.WIDTH
+    assert sheet.get_size() == (2 * headless.DEFAULT_THUMB_WIDTH, 2 * (thumb_height + headless.LABEL_HEIGHT))
+
+
+def test_el_png_conserva_los_pixeles(tmp_path):
+    surface = pygame.Surface((5, 3))
+    surface.fill((10, 20, 30))
+    surface.set_at((4, 2), (255, 0, 128))
+    headless.save_png(surface, tmp_path / "a.png")
+    loaded = pygame.image.load(str(tmp_path / "a.png"))
+    assert pygame.image.tobytes(loaded, "RGB") == pygame.image.tobytes(surface, "RGB")
@@ -0,0 +1,24 @@
+from src.importtime import format_report, measure, parse_importtime
+
+SAMPLE = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     _io
+import time:       300 |        900 |   encodings
+import time:      1500 |       2400 | src.config
+"""
+
+
+def test_interpreta_la_salida_de_importtime():
+    rows = parse_importtime(SAMPLE)
+    assert rows == [("_io", 120, 120, 2), ("encodings", 300, 900, 1), ("src.config", 1500, 2400, 0)]
+
+
+def test_mide_un_modulo_en_un_proceso_nuevo():
+    result = measure("src.config", repeat=1)
+    assert result["module"] == "src.config" and result["process_ms"] >= result["import_ms"] > 0
+    assert "src.config" in format_report(result, top=3)
+
+
+def test_el_menu_y_la_simulacion_no_cargan_lo_que_no_usan():
+    # Los motores se importan en el primer turno de la IA y numpy solo con el backend columnar
+    assert not {"src.ai.minimax", "src.ai.iterative"} & {row[0] for row in measure("src.main", repeat=1)["rows"]}
+    assert "numpy" not in {row[0] for row in measure("simulate", repeat=1)["rows"]}
@@ -0,0 +1,44 @@
+import json
+import math
+import pstats
+
+from src.ai import minimax
+from src.ai.context import SearchContext
+from src.game_logic.board import Board
+from src.instrumentation import profiling
+
+
+def _search():
+    board = Board()
+    board.push((1, 1))
+    context = SearchContext()
+    # Por el módulo: la raíz pasa por el envoltorio igual que las llamadas recursivas
+    minimax.minimax_alpha_beta(board, 0, -math.inf, math.inf, True, context, board.turn)
+    return context.nodes
+
+
+def test_apagado_no_toca_nada():
+    original = Board.push
+    with profiling(None) as instrumentation:
+        _search()
+    assert instrumentation is None and Board.push is original
+
+
+def test_contadores_y_volcados(tmp_path):
+    original = Board.push
+    with profiling(str(tmp_path), "collapsed", "corrida"):
+        assert Board.push is not original
+        nodes = _search()
+    assert Board.push is original
+
+    counters = json.loads((tmp_path / "corrida-counters.json").read_text())
+    assert sum(counters["nodes_by_depth"].values()) == nodes
+    assert counters["calls"]["Board.push"] == counters["calls"]["Board.pop"] + 1 == nodes  # +1: la jugada inicial
+
+    stacks = (tmp_path / "corrida.collapsed").read_text().splitlines()
+    assert stacks and all("src.instrumentation:" not in line for line in stacks)
+    assert any("minimax_alpha_beta" in line for line in stacks)
+
+    with profiling(str(tmp_path), "pstats", "cprofile"):
+        _search()
+    assert pstats.Stats(str(tmp_path / "cprofile.pstats")).total_calls > 0
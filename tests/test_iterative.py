@@ -0,0 +1,142 @@
+import pytest
+
+from src.ai.budget import SearchCancelled, SearchTimeout
+from src.ai.context import DetailedSearchContext, SearchContext
+from src.ai.iterative import find_best_move_and_viz_limited, find_best_move_iterative, iterative_deepening
+from src.ai.lookup import find_best_move_lookup_and_viz
+from src.ai.minimax import (
+    find_best_move_alpha_beta,
+    find_best_move_and_viz,
+    get_simulation_move_alpha_beta,
+    get_simulation_move_bruteforce,
+)
+from src.ai.negamax import get_simulation_move_pvs
+from src.ai.opening_book import book_move
+from src.ai.ordering import MoveOrderer
+from src.ai.transposition import TranspositionTable
+from src.game_logic.board import Board
+
+
+def test_busqueda_completa_coincide_con_alfa_beta():
+    board = Board()
+    board.make_move(1, 1)
+    result = iterative_deepening(board)
+    assert result["complete"]
+    assert result["move"] == find_best_move_alpha_beta(board)[0]
+
+
+def test_presupuesto_de_nodos_deja_el_tablero_intacto():
+    board = Board(4, 4, 4)
+    board.make_move(0, 0)
+    masks, turn = list(board.masks), board.turn
+
+    result = iterative_deepening(board, node_limit=2000)
+
+    assert result["nodes"] <= 2000
+    assert not result["complete"]
+    assert result["depth"] >= 1
+    assert board.is_valid_move(*result["move"])
+    assert (board.masks, board.turn, len(board.history)) == (masks, turn, 1)
+
+
+def test_elige_la_victoria_inmediata():
+    board = Board(4, 4, 3)
+    for move in [(0, 0), (3, 3), (0, 1), (3, 2)]:
+        board.make_move(*move)
+    result = iterative_deepening(board, node_limit=50_000)
+    assert result["score"] == 1
+    assert result["move"] in [(0, 2)]
+
+
+ENTRY_POINTS = {
+    "minimax": lambda board, context: get_simulation_move_bruteforce(board, context=context, use_book=False),
+    "alfa_beta": lambda board, context: get_simulation_move_alpha_beta(board, context=context, use_book=False),
+    "pvs": lambda board, context: get_simulation_move_pvs(board, context=context, use_book=False),
+    "viz": lambda board, context: find_best_move_and_viz(board, True, context=context, use_book=False),
+    "viz_lookup": lambda board, context: find_best_move_lookup_and_viz(board, context),
+    "iterativa": lambda board, context: find_best_move_iterative(board, context=context, use_book=False),
+    "viz_limitada": lambda board, context: find_best_move_and_viz_limited(
+        board, True, 1.0, context=context, use_book=False
+    ),
+}
+# Estos motores atrapan el timeout y responden con lo que alcanzaron; la cancelación sí la propagan
+CATCH_TIMEOUT = ("iterativa", "viz_limitada")
+
+
+@pytest.mark.parametrize("name", list(ENTRY_POINTS))
+@pytest.mark.parametrize("abort", ["timeout", "cancel"])
+def test_busqueda_cortada_no_deja_jugadas_en_el_tablero(name, abort):
+    board = Board()
+    board.push((1, 1))
+    state = (list(board.history), list(board.masks), board.turn)
+    context = SearchContext(node_limit=20) if abort == "timeout" else SearchContext(check_interval=16)
+    if abort == "cancel":
+        context.cancel()
+
+    if abort == "timeout" and name in CATCH_TIMEOUT:
+        ENTRY_POINTS[name](board, context)
+    else:
+        with pytest.raises(SearchTimeout if abort == "timeout" else SearchCancelled):
+            ENTRY_POINTS[name](board, context)
+    assert (board.history, board.masks, board.turn) == state
+
+
+@pytest.mark.parametrize("stones", [[(1, 1)], [(1, 1), (0, 0)]])
+def test_posicion_del_libro_sin_tiempo_para_el_arbol_no_lanza_timeout(stones):
+    board = Board()
+    for move in stones:
+        board.push(move)
+    # Sin presupuesto para armar el árbol (antes se propagaba SearchTimeout y la GUI se caía)
+    move, tree = find_best_move_and_viz_limited(board, False, 1.0, context=SearchContext(node_limit=1))
+
+    assert move == book_move(board)
+    assert len(board.history) == len(stones)
+    chosen = [child for child in tree["children"] if child["is_chosen"]]
+    assert [child["move"] for child in chosen] == [move]
+    assert chosen[0]["score"] == tree["score"]
+    assert all(isinstance(child["score"], int) and not child["children"] for child in tree["children"])
+
+
+def test_contexto_cancela_informa_progreso_y_resume():
+    reports = []
+    context = SearchContext(progress=reports.append, progress_interval=0.0, check_interval=64)
+    move, nodes = get_simulation_move_alpha_beta(Board(), context=context, use_book=False)
+    stats = context.stats()
+    assert stats["nodes"] == nodes and stats["best_move"] == move and stats["finished"]
+    assert len(reports) > 1 and reports[-1]["finished"]
+
+    cancelled = SearchContext(check_interval=64)
+    cancelled.cancel()
+    with pytest.raises(SearchCancelled):
+        get_simulation_move_bruteforce(Board(), context=cancelled, use_book=False)
+    assert cancelled.nodes == 64
+
+    with pytest.raises(SearchTimeout):
+        get_simulation_move_bruteforce(Board(), context=SearchContext(node_limit=1000), use_book=False)
+
+
+def test_contexto_detallado_cuenta_cortes_finales_y_tabla():
+    context = DetailedSearchContext()
+    move, nodes = get_simulation_move_alpha_beta(Board(), TranspositionTable(), MoveOrderer(), context, use_book=False)
+    detail = context.detail()
+    assert sum(detail["nodes_by_depth"].values()) == nodes
+    assert min(detail["nodes_by_depth"]) == 1  # Las jugadas raíz están a profundidad 1
+    assert detail["cutoffs"] == sum(detail["cutoffs_by_depth"].values()) > 0
+    assert 0 < detail["first_move_cutoff_rate"] <= 1
+    assert detail["terminal_nodes"] > 0 and detail["tt_hits"] > 0
+    assert SearchContext().detail() == {}
+
+
+def test_victoria_demostrada_con_tiempo_de_sobra_da_el_arbol_exacto():
+    # X gana en (0, 2): la profundización para en el primer ply, pero el árbol debe ser el exacto
+    board = Board()
+    for move in [(0, 0), (1, 0), (0, 1), (1, 1), (2, 2)]:
+        board.make_move(*move)
+    move, tree = find_best_move_and_viz_limited(board, True, 10.0, use_book=False)
+    exact_move, exact_tree = find_best_move_and_viz(board, True, use_book=False)
+
+    assert move == exact_move
+    assert [child["score"] for child in tree["children"]] == [child["score"] for child in exact_tree["children"]]
+    assert all(isinstance(child["score"], int) for child in tree["children"])
+    chosen = next(child for child in tree["children"] if child["is_chosen"])
+    assert chosen["children"]  # La ruta elegida se expande como en la búsqueda completa
@@ -0,0 +1,28 @@
+from src.ai.lookup import find_best_move_lookup, load_lookup_table
+from src.ai.minimax import find_best_move_alpha_beta
+from src.game_logic.board import Board
+
+
+def test_tablero_vacio_es_empate_con_nueve_jugadas():
+    score, best_mask, depth = load_lookup_table().entry(Board())
+    assert score == 0
+    assert best_mask == 0b111111111  # Todas las aperturas empatan
+    assert depth == 9
+
+
+def test_tabla_detecta_victoria_inmediata():
+    board = Board()
+    for move in [(0, 0), (1, 0), (0, 1), (1, 1)]:
+        board.make_move(*move)
+    score, _, depth = load_lookup_table().entry(board)
+    assert (score, depth) == (1, 1)
+    assert find_best_move_lookup(board) == (0, 2)
+
+
+def test_coincide_con_alfa_beta():
+    board = Board()
+    while not board.game_over:
+        move = find_best_move_lookup(board)
+        assert move == find_best_move_alpha_beta(board)[0]
+        board.make_move(*move)
+    assert board.winner == 0
@@ -0,0 +1,60 @@
+import math
+
+from src.ai.context import DetailedSearchContext, SearchContext
+from src.ai.iterative import iterative_deepening
+from src.ai.minimax import find_best_move_and_viz, get_simulation_move_alpha_beta, minimax_alpha_beta
+from src.ai.negamax import get_simulation_move_pvs, minimax_pvs, negamax
+from src.ai.ordering import MoveOrderer
+from src.ai.transposition import TranspositionTable
+from src.game_logic.board import Board
+
+
+def _position(*moves):
+    board = Board()
+    for move in moves:
+        board.push(move)
+    return board
+
+
+def test_pvs_coincide_con_alfa_beta():
+    for board in (Board(), _position((0, 0)), _position((1, 1), (0, 0), (2, 2)), _position((0, 0), (1, 1), (0, 1))):
+        expected = minimax_alpha_beta(board, 0, -math.inf, math.inf, True, SearchContext(), board.turn)
+        assert negamax(board, 0, -math.inf, math.inf, SearchContext()) == expected
+        assert negamax(board, 0, -math.inf, math.inf, SearchContext(), use_pvs=False) == expected
+        assert (
+            get_simulation_move_pvs(board, use_book=False)[0]
+            == get_simulation_move_alpha_beta(board, use_book=False)[0]
+        )
+
+
+def test_aspiracion_tabla_y_ordenamiento_no_cambian_la_jugada():
+    board = _position((1, 1), (0, 0), (2, 2))
+    expected, plain_nodes = get_simulation_move_pvs(board, aspiration=None)
+    move, nodes = get_simulation_move_pvs(board, TranspositionTable(), MoveOrderer())
+    assert move == expected
+    assert nodes < plain_nodes
+    assert get_simulation_move_pvs(board, aspiration=0.1)[0] == expected
+
+
+def test_minimax_pvs_sirve_para_el_arbol_y_la_profundizacion():
+    board = _position((0, 0), (1, 1))
+    expected, _ = get_simulation_move_alpha_beta(board)
+    assert find_best_move_and_viz(board, True, scoring_function=minimax_pvs)[0] == expected
+
+    result = iterative_deepening(board, scoring_function=minimax_pvs)
+    assert result["complete"] and result["move"] == expected
+    assert board.history and len(board.history) == 2
+
+
+def test_la_raiz_pvs_no_cuenta_como_nodo():
+    # Una sola jugada posible: como alfa-beta, PVS visita solo el hijo (profundidad 1)
+    board = _position((0, 0), (0, 1), (0, 2), (1, 1), (1, 0), (1, 2), (2, 1), (2, 0))
+    assert get_simulation_move_pvs(board, use_book=False)[1] == 1
+    assert get_simulation_move_alpha_beta(board, use_book=False)[1] == 1
+
+    # Con ventana de aspiración (y su posible re-búsqueda) la raíz tampoco aparece en el detalle
+    context = DetailedSearchContext()
+    get_simulation_move_pvs(_position((1, 1), (0, 0), (2, 2)), context=context, use_book=False)
+    detail = context.detail()
+    assert 0 not in detail["nodes_by_depth"]
+    assert sum(detail["nodes_by_depth"].values()) == context.nodes
@@ -0,0 +1,38 @@
+import json
+
+from src.ai.minimax import find_best_move_and_viz, get_simulation_move_alpha_beta
+from src.ai.opening_book import DEFAULT_BOOK_PATH, book_move, generate_opening_book, load_opening_book
+from src.game_logic.board import Board
+
+
+def _book_positions(board, plies):
+    if board.game_over or len(board.history) >= plies:
+        return
+    yield board
+    for move in board.get_available_moves():
+        board.push(move)
+        yield from _book_positions(board, plies)
+        board.pop()
+
+
+def test_libro_coincide_con_la_busqueda():
+    book = load_opening_book()
+    for board in _book_positions(Board(), book.plies):
+        expected, _ = get_simulation_move_alpha_beta(board, use_book=False)
+        assert book_move(board) == expected
+
+
+def test_apertura_sin_nodos_y_desactivable():
+    board = Board()
+    assert get_simulation_move_alpha_beta(board) == ((0, 0), 0)
+    assert get_simulation_move_alpha_beta(board, use_book=False)[1] > 0
+    assert book_move(Board(4, 4, 4)) is None
+
+    move, tree = find_best_move_and_viz(board, False)
+    assert move == (0, 0) and tree["score"] == 0
+
+
+def test_libro_incluido_esta_actualizado(tmp_path):
+    path = tmp_path / "book.json"
+    generate_opening_book(path)
+    assert json.loads(path.read_text()) == json.loads(DEFAULT_BOOK_PATH.read_text())
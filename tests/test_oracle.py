@@ -0,0 +1,131 @@
+"""
+Oráculo de corrección: recorre los 5.478 estados alcanzables del tres en raya y
+comprueba que cada motor devuelve el valor teórico y una jugada óptima.
+"""
+
+import math
+
+from src.ai.context import SearchContext
+from src.ai.iterative import iterative_deepening
+from src.ai.lookup import find_best_move_lookup, minimax_lookup
+from src.ai.minimax import (
+    get_simulation_move_alpha_beta,
+    get_simulation_move_bruteforce,
+    minimax_alpha_beta,
+    minimax_bruteforce,
+)
+from src.ai.negamax import get_simulation_move_pvs, minimax_pvs, negamax
+from src.ai.ordering import MoveOrderer
+from src.ai.transposition import TranspositionTable
+from src.game_logic.board import Board
+
+
+def _reachable_states():
+    """Copia de cada estado alcanzable (incluidos los terminales), una vez por posición."""
+    states = {}
+
+    def walk(board):
+        key = tuple(board.masks)
+        if key in states:
+            return
+        states[key] = board.copy()
+        if board.game_over:
+            return
+        for move in board.get_available_moves():
+            board.push(move)
+            walk(board)
+            board.pop()
+
+    walk(Board())
+    return list(states.values())
+
+
+def _oracle_values(states):
+    """Valor minimax exacto de cada estado para el jugador 1 (recursión memorizada sobre todo el árbol)."""
+    values = {}
+
+    def value(board):
+        key = tuple(board.masks)
+        if key not in values:
+            if board.game_over:
+                values[key] = 0 if board.winner == 0 else (1 if board.winner == 1 else -1)
+            else:
+                children = []
+                for move in board.get_available_moves():
+                    board.push(move)
+                    children.append(value(board))
+                    board.pop()
+                values[key] = max(children) if board.turn == 1 else min(children)
+        return values[key]
+
+    value(Board())
+    return values
+
+
+STATES = _reachable_states()
+ORACLE = _oracle_values(STATES)
+
+
+def _value_engines():
+    """Motores con la firma de minimax: (tablero, jugador 1 maximiza) -> valor para el jugador 1."""
+
+    def alpha_beta(board, table=None, ordering=None):
+        return minimax_alpha_beta(
+            board, 0, -math.inf, math.inf, board.turn == 1, SearchContext(), 1, table, ordering=ordering
+        )
+
+    table, orderer = TranspositionTable(), MoveOrderer()
+    return {
+        "alpha_beta": alpha_beta,
+        "alpha_beta_tt": lambda board: alpha_beta(board, table, orderer),
+        "pvs": lambda board: minimax_pvs(board, 0, -math.inf, math.inf, board.turn == 1, SearchContext(), 1),
+        "negamax": lambda board: (1 if board.turn == 1 else -1) * negamax(board, 0, -1, 1, SearchContext()),
+        "lookup": lambda board: minimax_lookup(board, 0, -math.inf, math.inf, board.turn == 1, SearchContext(), 1),
+    }
+
+
+def _move_engines():
+    """Funciones de jugada. Las tablas se comparten entre estados, como durante una partida."""
+    brute_table, ab_table, pvs_table, iterative_table = (TranspositionTable() for _ in range(4))
+    ab_orderer, pvs_orderer = MoveOrderer(), MoveOrderer()
+    return {
+        "bruteforce_tt": lambda board: get_simulation_move_bruteforce(board, brute_table, use_book=False)[0],
+        "alpha_beta": lambda board: get_simulation_move_alpha_beta(board, use_book=False)[0],
+        "alpha_beta_tt": lambda board: get_simulation_move_alpha_beta(board, ab_table, ab_orderer, use_book=False)[0],
+        "pvs": lambda board: get_simulation_move_pvs(board, use_book=False)[0],
+        "pvs_tt": lambda board: get_simulation_move_pvs(board, pvs_table, pvs_orderer, use_book=False)[0],
+        "iterative": lambda board: iterative_deepening(board, table=iterative_table)["move"],
+        "lookup": find_best_move_lookup,
+    }
+
+
+def test_oraculo_cubre_todos_los_estados():
+    assert len(STATES) == 5478
+    assert sum(not board.game_over for board in STATES) == 4520
+    assert ORACLE[(0, 0)] == 0
+
+    # El oráculo coincide con el minimax de referencia donde su costo es razonable
+    for board in STATES:
+        if bin(board.masks[0] | board.masks[1]).count("1") >= 4:
+            expected = minimax_bruteforce(board, 0, board.turn == 1, SearchContext(), 1)
+            assert ORACLE[tuple(board.masks)] == expected
+
+
+def test_motores_devuelven_el_valor_teorico():
+    for name, engine in _value_engines().items():
+        for board in STATES:
+            if name == "negamax" and board.game_over:
+                continue  # negamax puntúa los finales para quien ya no mueve
+            assert engine(board) == ORACLE[tuple(board.masks)], (name, board.history)
+
+
+def test_motores_eligen_jugadas_optimas():
+    for name, engine in _move_engines().items():
+        for board in STATES:
+            if board.game_over:
+                continue
+            best = ORACLE[tuple(board.masks)]
+            move = engine(board)
+            board.push(move)
+            assert ORACLE[tuple(board.masks)] == best, (name, board.history)
+            board.pop()
@@ -0,0 +1,33 @@
+import math
+
+from src.ai.context import SearchContext
+from src.ai.minimax import minimax_alpha_beta
+from src.ai.ordering import MoveOrderer
+from src.game_logic.board import Board
+
+
+def test_prior_estatico_centro_esquinas_bordes():
+    board = Board()
+    ordered = MoveOrderer().order(board, board.get_available_moves(), 0)
+    assert ordered[0] == (1, 1)
+    assert set(ordered[1:5]) == {(0, 0), (0, 2), (2, 0), (2, 2)}
+    assert set(ordered[5:]) == {(0, 1), (1, 0), (1, 2), (2, 1)}
+
+
+def test_jugada_hash_y_killers_van_primero():
+    board = Board()
+    orderer = MoveOrderer()
+    orderer.record_cutoff(board, (0, 1), 2, 5)
+    moves = board.get_available_moves()
+    assert orderer.order(board, moves, 2)[0] == (0, 1)
+    assert orderer.order(board, moves, 2, hash_move=(2, 1))[:2] == [(2, 1), (0, 1)]
+    assert MoveOrderer(use_killers=False, use_history=False).order(board, moves, 2)[0] == (1, 1)
+
+
+def test_ordenar_reduce_nodos_sin_cambiar_valor():
+    plain = SearchContext()
+    ordered = SearchContext()
+    expected = minimax_alpha_beta(Board(), 0, -math.inf, math.inf, True, plain, 1)
+    value = minimax_alpha_beta(Board(), 0, -math.inf, math.inf, True, ordered, 1, ordering=MoveOrderer())
+    assert value == expected
+    assert ordered.nodes < plain.nodes // 2
@@ -0,0 +1,44 @@
+from src.ai.context import DetailedSearchContext
+from src.ai.minimax import (
+    find_best_move_alpha_beta,
+    find_best_move_bruteforce,
+    get_simulation_move_bruteforce,
+    root_pool,
+    score_root_moves_parallel,
+)
+from src.game_logic.board import Board
+
+
+def test_paralelo_coincide_con_serie():
+    board = Board()
+    board.push((0, 0))
+    board.push((1, 1))
+
+    serial = get_simulation_move_bruteforce(board, use_book=False)
+    assert get_simulation_move_bruteforce(board, workers=2, use_book=False) == serial
+    assert find_best_move_bruteforce(board, workers=2, use_book=False) == find_best_move_bruteforce(
+        board, use_book=False
+    )
+    assert find_best_move_alpha_beta(board, workers=2, use_book=False)[0] == find_best_move_alpha_beta(board)[0]
+    assert len(board.history) == 2
+
+
+def test_paralelo_suma_el_detalle_de_cada_proceso():
+    board = Board()
+    board.push((1, 1))
+    serial, parallel = DetailedSearchContext(), DetailedSearchContext()
+    get_simulation_move_bruteforce(board, context=serial, use_book=False)
+    get_simulation_move_bruteforce(board, workers=2, context=parallel, use_book=False)
+    assert parallel.nodes == serial.nodes
+    assert parallel.detail() == serial.detail()
+
+
+def test_el_pool_se_reutiliza_entre_jugadas():
+    board = Board()
+    board.push((0, 0))
+    board.push((1, 1))
+    pool = root_pool(2)
+    score_root_moves_parallel(board, True, 2)
+    board.push((2, 2))
+    score_root_moves_parallel(board, True, 2)
+    assert root_pool(2) is pool
@@ -0,0 +1,89 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from src.config import HEIGHT, WIDTH
+from src.game_logic.board import Board
+from src.gui.atlas import SpriteAtlas
+from src.gui.renderer import HEURISTIC_COLOR, Renderer
+
+THINKING = {"elapsed": 0.5, "nodes": 1234, "nodes_per_second": 2468.0, "depth": 3}
+
+
+def _renderer():
+    return Renderer(pygame.Surface((WIDTH, HEIGHT)))
+
+
+def test_sin_cambios_no_hay_nada_que_actualizar():
+    renderer, board, graph = _renderer(), Board(), []
+    assert renderer.draw_game_screen(board, graph, "HUMAN") == [pygame.Rect(0, 0, WIDTH, HEIGHT)]
+    assert renderer.draw_game_screen(board, graph, "HUMAN") == []
+    assert renderer.draw_game_screen(board, graph, "IA", thinking=THINKING) == [pygame.Rect(0, 0, WIDTH, HEIGHT)]
+    assert renderer.draw_game_screen(board, graph, "IA", thinking=dict(THINKING)) == []
+
+
+def test_la_casilla_fantasma_solo_ensucia_su_casilla_y_la_anterior():
+    renderer, board, graph = _renderer(), Board(), []
+    renderer.draw_game_screen(board, graph, "HUMAN")
+
+    first = renderer.draw_game_screen(board, graph, "HUMAN", ghost=(0, 0))
+    assert len(first) == 1 and first[0].width < WIDTH
+    second = renderer.draw_game_screen(board, graph, "HUMAN", ghost=(2, 2))
+    assert second == [first[0], renderer.draw_ghost_symbol(2, 2, board.turn)]
+
+    # Al quitar el fantasma se repone el fondo: la pantalla vuelve a ser la escena estática
+    assert renderer.draw_game_screen(board, graph, "HUMAN") == [second[1]]
+    assert renderer.screen.get_at(second[1].center) == renderer.background.get_at(second[1].center)
+
+
+def test_el_tablero_o_un_grafo_nuevo_reconstruyen_la_escena():
+    renderer, board, graph = _renderer(), Board(), []
+    renderer.draw_game_screen(board, graph, "HUMAN")
+
+    board.make_move(1, 1)
+    assert renderer.draw_game_screen(board, graph, "HUMAN") == [pygame.Rect(0, 0, WIDTH, HEIGHT)]
+    assert renderer.draw_game_screen(board, [], "HUMAN") == [pygame.Rect(0, 0, WIDTH, HEIGHT)]
+
+    renderer.invalidate()
+    assert renderer.draw_game_screen(board, renderer._graph_source, "HUMAN") == [pygame.Rect(0, 0, WIDTH, HEIGHT)]
+
+
+def test_los_mini_tableros_salen_del_atlas():
+    renderer = _renderer()
+    state = [[1, 0, 0], [0, 2, 0], [0, 0, 0]]
+    renderer.draw_mini_board(700.6, 100, 28, state)
+    renderer.draw_mini_board(800, 200, 28, [row[:] for row in state])
+    renderer.draw_mini_board(900, 300, 28, state, highlight=((255, 255, 0), 2))
+    assert (len(renderer.mini_boards), renderer.mini_boards.hits) == (2, 1)
+
+    # El sprite reproduce el dibujo directo: fondo blanco dentro del tablero y marco fuera de él
+    assert renderer.screen.get_at((701, 101)) == renderer.screen.get_at((801, 201))
+    assert renderer.screen.get_at((898, 298))[:3] == (255, 255, 0)
+
+    renderer.set_inverted(True)
+    renderer.draw_mini_board(700, 100, 28, state)
+    assert len(renderer.mini_boards) == 3
+
+
+def test_el_atlas_desaloja_el_sprite_menos_usado():
+    atlas = SpriteAtlas(max_sprites=2)
+    for key in ("a", "b", "a", "c"):
+        atlas.get(key, lambda: pygame.Surface((1, 1)))
+    assert list(atlas) == ["a", "c"]
+    assert (atlas.hits, atlas.misses) == (1, 3)
+
+
+def test_los_puntajes_estimados_se_distinguen_de_los_demostrados():
+    renderer = _renderer()
+    matrix = [[1, 0, 0], [0, 2, 0], [0, 0, 0]]
+    children = [
+        {"score": 0.9411764705882353, "board_matrix": matrix, "children": []},
+        {"score": 1, "board_matrix": matrix, "children": []},
+        {"score": 0.0, "board_matrix": matrix, "children": []},
+    ]
+    renderer.draw_decision_graph({"score": 1, "board_matrix": matrix, "children": children})
+
+    labels = {(text, color) for size, text, color in renderer.text.surfaces if size == 18}
+    assert labels == {("(+0.94)", HEURISTIC_COLOR), ("1", (0, 255, 0)), ("(+0.00)", HEURISTIC_COLOR)}
@@ -0,0 +1,62 @@
+import pytest
+
+from src.results import completed_simulations, load_results, open_sink
+
+
+def _game(sim_id, turns=3):
+    return [
+        {"turn": t, "algorithm": "Alpha-Beta", "nodes_evaluated": 10 * t, "time_seconds": 0.5, "simulation_id": sim_id}
+        for t in range(1, turns + 1)
+    ]
+
+
+@pytest.mark.parametrize("name", ["r.csv", "r.ndjson", "r_cols"])
+def test_volcado_por_bloques_y_reanudacion(tmp_path, name):
+    path = str(tmp_path / name)
+    with open_sink(path, chunk_size=4) as sink:
+        sink.write(_game("A_1"))
+        assert sink.rows_written == 0  # Aún en el búfer
+        sink.write(_game("A_2"))
+        assert sink.rows_written == 6
+        sink.write(_game("A_3"))
+    assert completed_simulations(path) == {"A_1", "A_2", "A_3"}
+
+    # Como simulate: las pendientes se leen después de abrir (CSV/NDJSON descartan la última partida)
+    with open_sink(path, append=True) as sink:
+        for sim_id in sorted({"A_1", "A_2", "A_3", "A_4"} - completed_simulations(path)):
+            sink.write(_game(sim_id))
+    df = load_results(path)
+    assert len(df) == 12
+    assert df["nodes_evaluated"].sum() == 4 * 60
+    assert set(df["simulation_id"]) == {"A_1", "A_2", "A_3", "A_4"}
+
+
+def test_reanudar_descarta_linea_truncada(tmp_path):
+    path = str(tmp_path / "r.ndjson")
+    with open_sink(path) as sink:
+        sink.write(_game("A_1") + _game("A_2"))
+    with open(path, "a") as f:
+        f.write('{"turn": 1, "simul')
+    with open_sink(path, append=True) as sink:
+        assert completed_simulations(path) == {"A_1"}
+        sink.write(_game("A_2"))
+    assert len(load_results(path)) == 6
+
+
+@pytest.mark.parametrize("name", ["r.csv", "r.ndjson"])
+def test_reanudar_descarta_partida_cortada_entre_filas(tmp_path, name):
+    path = str(tmp_path / name)
+    with open_sink(path) as sink:
+        sink.write(_game("A_1") + _game("A_2"))
+    # Interrupción a mitad del bloque: de A_2 solo se llegó a escribir la primera fila
+    with open(path) as f:
+        lines = f.readlines()
+    with open(path, "w") as f:
+        f.writelines(lines[: len(lines) - 2])
+
+    with open_sink(path, append=True) as sink:
+        assert completed_simulations(path) == {"A_1"}
+        sink.write(_game("A_2"))
+    df = load_results(path)
+    assert len(df) == 6
+    assert sorted(df["simulation_id"]) == ["A_1"] * 3 + ["A_2"] * 3
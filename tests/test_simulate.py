@@ -0,0 +1,38 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# simulate.py se ejecuta como script desde src/ (importa ai.*, no src.ai.*): se importa igual que al correrlo
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import simulate  # noqa: E402
+
+
+def test_minimax_en_paralelo_registra_el_detalle_de_la_busqueda(monkeypatch):
+    serial = simulate.run_single_simulation(simulate.AI_SLOW, simulate.RANDOM, seed=1, use_book=False)
+    monkeypatch.setattr(simulate, "SEARCH_WORKERS", 2)
+    parallel = simulate.run_single_simulation(simulate.AI_SLOW, simulate.RANDOM, seed=1, use_book=False)
+
+    columns = ("nodes_evaluated", "nodes_by_depth", "terminal_nodes", "cutoffs")
+    first = parallel[0]
+    assert first["nodes_evaluated"] == 549_945
+    assert first["nodes_by_depth"] and first["terminal_nodes"] > 0
+    assert [[row[c] for c in columns] for row in parallel] == [[row[c] for c in columns] for row in serial]
+
+
+def test_en_paralelo_solo_hay_unas_pocas_partidas_en_vuelo(monkeypatch):
+    submitted = []
+
+    class CountingPool(ThreadPoolExecutor):
+        def submit(self, fn, *args):
+            submitted.append(args[0])
+            return super().submit(fn, *args)
+
+    monkeypatch.setattr(simulate, "ProcessPoolExecutor", CountingPool)
+    tasks = [("R", i, simulate.RANDOM, simulate.RANDOM, i, False, False) for i in range(1, 41)]
+    workers = 2
+    delivered = []
+    for records in simulate.run_games(tasks, workers):
+        delivered.append(records[0]["simulation_id"])
+        assert len(submitted) - len(delivered) <= simulate.GAMES_IN_FLIGHT_PER_WORKER * workers
+    assert sorted(delivered) == sorted(f"R_{i}" for i in range(1, 41))
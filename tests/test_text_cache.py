@@ -0,0 +1,41 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from src.config import HEIGHT, WIDTH
+from src.gui.renderer import Renderer
+from src.gui.text_cache import TextCache
+
+
+def test_reutiliza_superficies_por_tamano_texto_y_color():
+    cache = TextCache()
+    first = cache.render(18, "1", (255, 0, 0))
+    assert cache.render(18, "1", (255, 0, 0)) is first
+    assert cache.render(18, "1", (0, 255, 0)) is not first
+    assert cache.render(20, "1", (255, 0, 0)) is not first
+    assert (cache.hits, cache.misses) == (1, 3)
+    assert cache.font(18) is cache.font(18)
+
+
+def test_desaloja_la_superficie_menos_usada():
+    cache = TextCache(max_surfaces=2, max_fonts=1)
+    cache.render(18, "a", (0, 0, 0))
+    cache.render(18, "b", (0, 0, 0))
+    cache.render(18, "a", (0, 0, 0))  # "b" queda como la menos usada
+    cache.render(20, "c", (0, 0, 0))
+    assert set(cache.surfaces) == {(18, "a", (0, 0, 0)), (20, "c", (0, 0, 0))}
+    assert list(cache.fonts) == [20]
+
+
+def test_el_grafo_no_vuelve_a_rasterizar_entre_cuadros():
+    renderer = Renderer(pygame.Surface((WIDTH, HEIGHT)))
+    child = {"score": 1, "board_matrix": [[1, 0, 0], [0, 2, 0], [0, 0, 1]], "children": [], "is_chosen": True}
+    root = {"score": 1, "board_matrix": [[1, 0, 0], [0, 2, 0], [0, 0, 0]], "children": [child]}
+
+    renderer.draw_decision_graph(root)
+    misses = renderer.text.misses
+    renderer.draw_decision_graph(root)
+    assert renderer.text.misses == misses
+    assert renderer.text.hits > 0
@@ -0,0 +1,61 @@
+import math
+
+from src.ai.context import SearchContext
+from src.ai.minimax import find_best_move_and_viz, minimax_alpha_beta, minimax_bruteforce
+from src.ai.transposition import TranspositionTable, canonical_key
+from src.game_logic.board import Board
+
+
+def _board_from(moves):
+    board = Board()
+    for move in moves:
+        board.make_move(*move)
+    return board
+
+
+def test_clave_canonica_invariante_por_simetria():
+    # Misma posición girada 90° y reflejada
+    original = _board_from([(0, 0), (1, 1), (0, 1)])
+    rotada = _board_from([(0, 2), (1, 1), (1, 2)])
+    reflejada = _board_from([(0, 2), (1, 1), (0, 1)])
+    assert canonical_key(original)[0] == canonical_key(rotada)[0] == canonical_key(reflejada)[0]
+    assert canonical_key(original)[0] != canonical_key(_board_from([(0, 0), (1, 1), (2, 2)]))[0]
+
+
+def test_tabla_reduce_nodos_sin_cambiar_valor():
+    board = Board()
+    plain = SearchContext()
+    cached = SearchContext()
+    table = TranspositionTable()
+
+    expected = minimax_alpha_beta(board, 0, -math.inf, math.inf, True, plain, 1)
+    value = minimax_alpha_beta(board, 0, -math.inf, math.inf, True, cached, 1, table)
+
+    assert value == expected == 0
+    assert cached.nodes < plain.nodes // 10
+    assert minimax_bruteforce(board, 0, True, SearchContext(), 1, table) == 0
+
+
+def _tree_scores(node):
+    return [node["score"], [_tree_scores(child) for child in node["children"]]]
+
+
+def test_arbol_visual_reutiliza_puntajes_entre_niveles():
+    board = _board_from([(1, 1), (0, 0)])
+    single_search = SearchContext()
+    minimax_bruteforce(board, 0, True, single_search, board.turn)
+
+    brute, fast = SearchContext(), SearchContext()
+    brute_move, brute_tree = find_best_move_and_viz(board, False, context=brute)
+    fast_move, fast_tree = find_best_move_and_viz(board, True, context=fast)
+
+    # Los tres niveles del árbol cuestan menos que una sola búsqueda completa
+    assert brute.nodes < single_search.nodes
+    assert brute_move == fast_move
+    assert _tree_scores(brute_tree) == _tree_scores(fast_tree)
+
+
+def test_desalojo_respeta_capacidad():
+    table = TranspositionTable(max_entries=10, eviction="fifo")
+    minimax_alpha_beta(Board(), 0, -math.inf, math.inf, True, SearchContext(), 1, table)
+    assert len(table) == 10